@@ -11,6 +11,14 @@ class Settings(BaseSettings):
     DB_NAME: str = "sales_analytics"
     DB_USER: str = "sales_user"
     DB_PASSWORD: str = "sales_pass123"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+    DB_ARROW_READS: bool = False
+    DB_ARROW_BACKEND: str = "auto"
+    DB_TYPED_READS: bool = False
     
     # Application
     APP_ENV: str = "development"
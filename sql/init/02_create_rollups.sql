@@ -0,0 +1,54 @@
+-- Sales rollup tables (daily / monthly / yearly per region and category)
+
+CREATE TABLE IF NOT EXISTS sales_rollup_daily (
+    period_start DATE NOT NULL,
+    region VARCHAR(100) NOT NULL DEFAULT '',
+    category VARCHAR(100) NOT NULL DEFAULT '',
+    quantity BIGINT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    transactions BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (period_start, region, category)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS sales_rollup_monthly (
+    period_start DATE NOT NULL,
+    region VARCHAR(100) NOT NULL DEFAULT '',
+    category VARCHAR(100) NOT NULL DEFAULT '',
+    quantity BIGINT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    transactions BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (period_start, region, category)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS sales_rollup_yearly (
+    period_start DATE NOT NULL,
+    region VARCHAR(100) NOT NULL DEFAULT '',
+    category VARCHAR(100) NOT NULL DEFAULT '',
+    quantity BIGINT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    transactions BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (period_start, region, category)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Aggregate sets kept in sync with sales (one row per name)
+CREATE TABLE IF NOT EXISTS sales_rollup_state (
+    name VARCHAR(50) PRIMARY KEY
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Sales not yet folded into each aggregate set. Rows are written by the trigger
+-- below in the same transaction as the sale, so a sale whose id commits after a
+-- higher id is still folded by the next refresh.
+CREATE TABLE IF NOT EXISTS sales_rollup_pending (
+    name VARCHAR(50) NOT NULL,
+    sale_id INT NOT NULL,
+    PRIMARY KEY (name, sale_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+DROP TRIGGER IF EXISTS sales_rollup_pending_insert;
+
+CREATE TRIGGER sales_rollup_pending_insert AFTER INSERT ON sales FOR EACH ROW
+    INSERT IGNORE INTO sales_rollup_pending (name, sale_id) SELECT name, NEW.id FROM sales_rollup_state;
+
+INSERT IGNORE INTO sales_rollup_state (name) VALUES ('sales');
+
+INSERT IGNORE INTO sales_rollup_pending (name, sale_id) SELECT 'sales', id FROM sales;
@@ -0,0 +1,23 @@
+-- Daily partial totals per product and per customer (top-K queries)
+
+CREATE TABLE IF NOT EXISTS sales_daily_product (
+    day DATE NOT NULL,
+    product_id INT NOT NULL,
+    quantity BIGINT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    transactions BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, product_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS sales_daily_customer (
+    day DATE NOT NULL,
+    customer_id INT NOT NULL,
+    quantity BIGINT NOT NULL DEFAULT 0,
+    total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    transactions BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, customer_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT IGNORE INTO sales_rollup_state (name) VALUES ('top_k');
+
+INSERT IGNORE INTO sales_rollup_pending (name, sale_id) SELECT 'top_k', id FROM sales;
@@ -0,0 +1,15 @@
+-- Archive of purged sales (same columns as sales, original ids preserved)
+
+CREATE TABLE IF NOT EXISTS sales_archive (
+    id INT PRIMARY KEY,
+    date DATETIME NOT NULL,
+    product_id INT NOT NULL,
+    customer_id INT NOT NULL,
+    quantity INT NOT NULL,
+    unit_price DECIMAL(10, 2) NOT NULL,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    region VARCHAR(100),
+    category VARCHAR(100),
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_date (date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -1,5 +1,6 @@
 from .sale import Sale
+from .sale_batch import SaleBatch
 from .product import Product
 from .customer import Customer
 
-__all__ = ['Sale', 'Product', 'Customer']
\ No newline at end of file
+__all__ = ['Sale', 'SaleBatch', 'Product', 'Customer']
\ No newline at end of file
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Customer:
     """Entidad que representa a un cliente."""
     id: Optional[int]
@@ -17,4 +17,30 @@ class Customer:
         if not self.email or "@" not in self.email:
             raise ValueError("El correo electrónico no es válido.")
         if not self.name.strip():
-            raise ValueError("El nombre del cliente no puede estar vacío.")
\ No newline at end of file
+            raise ValueError("El nombre del cliente no puede estar vacío.")
+
+    @classmethod
+    def from_tuple(cls, row: Sequence[Any]) -> 'Customer':
+        """
+        Construye un cliente desde una tupla confiable (orden de columnas de la tabla).
+
+        No vuelve a ejecutar las validaciones de __post_init__: usar solo con
+        filas que provienen de la base de datos, donde ya se garantizan.
+        """
+        entity = object.__new__(cls)
+        (entity.id, entity.name, entity.email, entity.phone, entity.region,
+         entity.registration_date, entity.segment) = row
+        return entity
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Customer':
+        """Construye un cliente desde una fila confiable (mapeo columna -> valor) sin revalidar."""
+        entity = object.__new__(cls)
+        entity.id = row['id']
+        entity.name = row['name']
+        entity.email = row['email']
+        entity.phone = row['phone']
+        entity.region = row['region']
+        entity.registration_date = row['registration_date']
+        entity.segment = row.get('segment')
+        return entity
\ No newline at end of file
@@ -0,0 +1,88 @@
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+REGION = 'region'
+CATEGORY = 'category'
+
+
+class DimensionDictionary:
+    """
+    Codificación por diccionario de una dimensión de texto repetida.
+
+    Asigna a cada valor un código entero pequeño y estable (solo se añaden
+    valores, nunca se reordenan), de modo que los códigos de distintos lotes
+    y DataFrames son comparables. El código -1 representa nulo.
+    """
+
+    def __init__(self, name: str, values: Iterable[str] = ()):
+        self.name = name
+        self._values: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> Tuple[str, ...]:
+        """Tabla de valores: la posición de cada valor es su código."""
+        return tuple(self._values)
+
+    def extend(self, values: Iterable[str]) -> None:
+        """Registra valores nuevos al final de la tabla."""
+        for value in values:
+            self.code_for(value)
+
+    def code_for(self, value: str) -> int:
+        """Devuelve el código de un valor, registrándolo si no existía."""
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self._values)
+                    self._values.append(value)
+                    self._codes[value] = code
+        return code
+
+    def encode(self, values) -> np.ndarray:
+        """Codifica una columna de valores a un array int32 de códigos."""
+        codes, uniques = pd.factorize(pd.Series(values, copy=False), use_na_sentinel=True)
+        if len(uniques) == 0:
+            return np.full(len(codes), -1, dtype=np.int32)
+        mapping = np.fromiter((self.code_for(value) for value in uniques), dtype=np.int32, count=len(uniques))
+        return np.where(codes >= 0, mapping[codes], -1).astype(np.int32)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Decodifica códigos a un array de objetos (-1 se traduce a None)."""
+        lookup = np.array(self._values + [None], dtype=object)
+        return lookup[np.asarray(codes)]
+
+    def categorical(self, values) -> pd.Categorical:
+        """Convierte una columna a dtype category con las categorías de la tabla compartida."""
+        codes = self.encode(values)
+        return pd.Categorical.from_codes(codes, categories=list(self._values))
+
+
+_registry: Dict[str, DimensionDictionary] = {}
+_registry_lock = threading.Lock()
+
+
+def get_dimension(name: str) -> DimensionDictionary:
+    """Obtiene (o crea) el diccionario compartido de una dimensión."""
+    with _registry_lock:
+        if name not in _registry:
+            _registry[name] = DimensionDictionary(name)
+        return _registry[name]
+
+
+def to_categorical_columns(df: pd.DataFrame, columns: Iterable[str] = (REGION, CATEGORY)) -> pd.DataFrame:
+    """Convierte las columnas de dimensión presentes a dtype category con códigos compartidos."""
+    for column in columns:
+        if column in df:
+            df[column] = get_dimension(column).categorical(df[column])
+    return df
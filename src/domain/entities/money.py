@@ -0,0 +1,111 @@
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+CENTS_PER_UNIT = 100
+CENTS_SUFFIX = '_cents'
+
+Amount = Union[Decimal, float, int, str]
+
+
+def to_cents(amount: Amount) -> int:
+    """Convierte un monto a centavos enteros (redondeo half-up, exacto para Decimal)."""
+    return int(Decimal(str(amount)).scaleb(2).to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convierte centavos enteros a un Decimal con dos decimales."""
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def to_cents_array(values) -> np.ndarray:
+    """
+    Convierte una columna de montos a un array int64 de centavos.
+
+    Las columnas object (Decimal de MySQL) se convierten de forma exacta valor a
+    valor; las columnas numéricas se redondean al centavo, lo cual es exacto
+    para montos con dos decimales como los de DECIMAL(10, 2).
+    """
+    array = np.asarray(values)
+    if array.dtype == object:
+        return np.fromiter((to_cents(v) for v in array), dtype=np.int64, count=len(array))
+    if np.issubdtype(array.dtype, np.integer):
+        return array.astype(np.int64) * CENTS_PER_UNIT
+    return np.round(array.astype(np.float64) * CENTS_PER_UNIT).astype(np.int64)
+
+
+def cents_column(column: str) -> str:
+    """Nombre de la columna en centavos asociada a una columna monetaria."""
+    return f"{column}{CENTS_SUFFIX}"
+
+
+def is_cents_column(column: str) -> bool:
+    return str(column).endswith(CENTS_SUFFIX)
+
+
+def to_cents_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Reemplaza las columnas monetarias indicadas por su equivalente <columna>_cents (int64)."""
+    df = df.copy()
+    for column in columns:
+        if column in df:
+            df[column] = to_cents_array(df[column].to_numpy())
+            df = df.rename(columns={column: cents_column(column)})
+    return df
+
+
+def cents_to_float(cents: pd.Series) -> pd.Series:
+    """Convierte centavos a float64 (para visualización y estadística)."""
+    return cents.astype(np.float64) / CENTS_PER_UNIT
+
+
+def cents_to_text(cents: pd.Series) -> pd.Series:
+    """Formatea centavos como texto decimal exacto ('-12.05'), sin pasar por float."""
+    cents = cents.astype(np.int64)
+    magnitude = cents.abs()
+    sign = np.where(cents < 0, '-', '')
+    return (sign + (magnitude // CENTS_PER_UNIT).astype(str) + '.'
+            + (magnitude % CENTS_PER_UNIT).astype(str).str.zfill(2))
+
+
+def cents_to_decimal(cents: pd.Series) -> pd.Series:
+    """Convierte centavos a Decimal exacto (columna object)."""
+    return cents.map(from_cents).astype(object)
+
+
+_CENTS_CONVERTERS = {
+    'float': cents_to_float,
+    'text': cents_to_text,
+    'decimal': cents_to_decimal,
+}
+
+
+def from_cents_columns(df: pd.DataFrame, kind: str = 'float') -> pd.DataFrame:
+    """
+    Convierte las columnas <columna>_cents de vuelta a su nombre original.
+
+    Args:
+        df: DataFrame con columnas en centavos
+        kind: 'float', 'text' (decimal exacto como texto) o 'decimal'
+
+    Returns:
+        DataFrame con las columnas monetarias en unidades
+    """
+    if kind not in _CENTS_CONVERTERS:
+        raise ValueError(f"Tipo de conversión no soportado: {kind}")
+    convert = _CENTS_CONVERTERS[kind]
+    df = df.copy()
+    for column in [c for c in df.columns if is_cents_column(c)]:
+        original = str(column)[:-len(CENTS_SUFFIX)]
+        df[column] = convert(df[column])
+        df = df.rename(columns={column: original})
+    return df
+
+
+def column_cents(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Obtiene una columna monetaria en centavos, usando <columna>_cents si ya existe."""
+    cents = cents_column(column)
+    if cents in df:
+        return np.asarray(df[cents], dtype=np.int64)
+    return to_cents_array(df[column].to_numpy())
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 
+from .money import to_cents
 
-@dataclass
+
+@dataclass(slots=True)
 class Product:
     """Entidad que representa a un producto."""
     id: Optional[int]
@@ -20,12 +22,47 @@ class Product:
             raise ValueError("El costo no puede ser negativo.")
         if self.stock < 0:
             raise ValueError("El stock no puede ser negativo.")
-        
+
+    @property
+    def price_cents(self) -> int:
+        """Precio en centavos enteros."""
+        return to_cents(self.price)
+
+    @property
+    def cost_cents(self) -> int:
+        """Costo en centavos enteros."""
+        return to_cents(self.cost)
+
+    @classmethod
+    def from_tuple(cls, row: Sequence[Any]) -> 'Product':
+        """
+        Construye un producto desde una tupla confiable (orden de columnas de la tabla).
+
+        No vuelve a ejecutar las validaciones de __post_init__: usar solo con
+        filas que provienen de la base de datos, donde ya se garantizan.
+        """
+        entity = object.__new__(cls)
+        (entity.id, entity.name, entity.category, entity.price, entity.cost, entity.stock) = row
+        return entity
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Product':
+        """Construye un producto desde una fila confiable (mapeo columna -> valor) sin revalidar."""
+        entity = object.__new__(cls)
+        entity.id = row['id']
+        entity.name = row['name']
+        entity.category = row['category']
+        entity.price = row['price']
+        entity.cost = row['cost']
+        entity.stock = row['stock']
+        return entity
+
     def calculate_margin(self) -> Decimal:
-        """Calcula el margen de beneficio del producto."""
+        """Calcula el margen de beneficio del producto (0 si el precio es cero)."""
         if self.price == 0:
-            return ((self.price - self.cost) / self.price) * 100
-        
+            return Decimal('0')
+        return ((self.price - self.cost) / self.price) * 100
+
     def is_in_stock(self, quantity: int) -> bool:
         """Verifica si el producto está en stock."""
         return self.stock >= quantity
\ No newline at end of file
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Mapping, Optional, Sequence
 
+from .money import to_cents
 
-@dataclass
+
+@dataclass(slots=True)
 class Sale:
     """Entidad que representa una venta."""
     id: Optional[int]
@@ -25,7 +27,45 @@ class Sale:
             raise ValueError("El precio unitario no puede ser negativo.")
         if self.total_amount != self.unit_price * self.quantity:
             raise ValueError("El monto total debe ser igual al precio unitario por la cantidad.")
-        
+
+    @property
+    def unit_price_cents(self) -> int:
+        """Precio unitario en centavos enteros."""
+        return to_cents(self.unit_price)
+
+    @property
+    def total_amount_cents(self) -> int:
+        """Monto total en centavos enteros."""
+        return to_cents(self.total_amount)
+
+    @classmethod
+    def from_tuple(cls, row: Sequence[Any]) -> 'Sale':
+        """
+        Construye una venta desde una tupla confiable (orden de columnas de la tabla).
+
+        No vuelve a ejecutar las validaciones de __post_init__: usar solo con
+        filas que provienen de la base de datos, donde ya se garantizan.
+        """
+        entity = object.__new__(cls)
+        (entity.id, entity.date, entity.product_id, entity.customer_id, entity.quantity,
+         entity.unit_price, entity.total_amount, entity.region, entity.category) = row
+        return entity
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> 'Sale':
+        """Construye una venta desde una fila confiable (mapeo columna -> valor) sin revalidar."""
+        entity = object.__new__(cls)
+        entity.id = row['id']
+        entity.date = row['date']
+        entity.product_id = row['product_id']
+        entity.customer_id = row['customer_id']
+        entity.quantity = row['quantity']
+        entity.unit_price = row['unit_price']
+        entity.total_amount = row['total_amount']
+        entity.region = row['region']
+        entity.category = row['category']
+        return entity
+
     def calculate_discount(self, discount_percentage: Decimal) -> Decimal:
         """Calcula el descuento aplicado a la venta."""
         return self.total_amount * (1 - Decimal(str(discount_percentage / 100)))
\ No newline at end of file
@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .dimension import CATEGORY, REGION, get_dimension
+from .money import from_cents, to_cents_array
+from .sale import Sale
+from .validation_rules import SALE_VALIDATOR
+
+
+def _encode(values, dimension: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """Codifica valores con el diccionario compartido de la dimensión (-1 = nulo)."""
+    dictionary = get_dimension(dimension)
+    codes = dictionary.encode(values)
+    return codes, dictionary.values
+
+
+@dataclass
+class SaleBatch:
+    """
+    Lote columnar de ventas (struct-of-arrays) respaldado por arrays de NumPy.
+
+    Los montos se guardan en centavos (int64) y la región y la categoría se
+    codifican con los diccionarios compartidos de dimensión (-1 representa
+    nulo), por lo que los códigos son comparables entre lotes.
+    Aplica las mismas reglas de negocio que Sale sin crear un objeto por fila.
+    """
+    date: np.ndarray
+    product_id: np.ndarray
+    customer_id: np.ndarray
+    quantity: np.ndarray
+    unit_price_cents: np.ndarray
+    total_amount_cents: np.ndarray
+    region_codes: np.ndarray
+    regions: Tuple[str, ...]
+    category_codes: np.ndarray
+    categories: Tuple[str, ...]
+
+    def __post_init__(self):
+        self.date = np.asarray(self.date, dtype='datetime64[ns]')
+        self.product_id = np.asarray(self.product_id, dtype=np.int64)
+        self.customer_id = np.asarray(self.customer_id, dtype=np.int64)
+        self.quantity = np.asarray(self.quantity, dtype=np.int64)
+        self.unit_price_cents = np.asarray(self.unit_price_cents, dtype=np.int64)
+        self.total_amount_cents = np.asarray(self.total_amount_cents, dtype=np.int64)
+        self.region_codes = np.asarray(self.region_codes, dtype=np.int32)
+        self.category_codes = np.asarray(self.category_codes, dtype=np.int32)
+        self.regions = tuple(self.regions)
+        self.categories = tuple(self.categories)
+
+        lengths = {len(column) for column in self._columns().values()}
+        if len(lengths) > 1:
+            raise ValueError("Todas las columnas del lote deben tener la misma longitud.")
+        self.validate()
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        return {
+            'date': self.date,
+            'product_id': self.product_id,
+            'customer_id': self.customer_id,
+            'quantity': self.quantity,
+            'unit_price_cents': self.unit_price_cents,
+            'total_amount_cents': self.total_amount_cents,
+            'region_codes': self.region_codes,
+            'category_codes': self.category_codes,
+        }
+
+    def rule_violations(self) -> Dict[str, np.ndarray]:
+        """Evalúa las reglas de negocio de Sale sobre todo el lote y devuelve una máscara por regla."""
+        violations = SALE_VALIDATOR.violations(self._columns())
+        return {rule.message: invalid for rule, invalid in violations.items()}
+
+    def invalid_mask(self) -> np.ndarray:
+        """Devuelve una máscara booleana con las filas que incumplen alguna regla."""
+        mask = np.zeros(len(self), dtype=bool)
+        for violations in self.rule_violations().values():
+            mask |= violations
+        return mask
+
+    def validate(self) -> None:
+        """Valida el lote completo; lanza ValueError con la primera regla incumplida."""
+        for message, violations in self.rule_violations().items():
+            if violations.any():
+                first = int(np.flatnonzero(violations)[0])
+                raise ValueError(
+                    f"{message} ({int(violations.sum())} filas inválidas, primera en la posición {first})"
+                )
+
+    @property
+    def region(self) -> np.ndarray:
+        """Regiones decodificadas."""
+        return get_dimension(REGION).decode(self.region_codes)
+
+    @property
+    def category(self) -> np.ndarray:
+        """Categorías decodificadas."""
+        return get_dimension(CATEGORY).decode(self.category_codes)
+
+    def slice(self, start: int, stop: int) -> 'SaleBatch':
+        """Devuelve un sub-lote (vistas sobre los mismos arrays)."""
+        return SaleBatch(
+            date=self.date[start:stop],
+            product_id=self.product_id[start:stop],
+            customer_id=self.customer_id[start:stop],
+            quantity=self.quantity[start:stop],
+            unit_price_cents=self.unit_price_cents[start:stop],
+            total_amount_cents=self.total_amount_cents[start:stop],
+            region_codes=self.region_codes[start:stop],
+            regions=self.regions,
+            category_codes=self.category_codes[start:stop],
+            categories=self.categories,
+        )
+
+    def iter_chunks(self, chunk_size: int) -> Iterator['SaleBatch']:
+        """Recorre el lote en sub-lotes de tamaño acotado."""
+        for start in range(0, len(self), chunk_size):
+            yield self.slice(start, start + chunk_size)
+
+    def to_records(self) -> List[Dict[str, object]]:
+        """Genera los parámetros de inserción (un dict por fila) con montos en Decimal."""
+        keys = ('date', 'product_id', 'customer_id', 'quantity',
+                'unit_price', 'total_amount', 'region', 'category')
+        columns = (
+            pd.DatetimeIndex(self.date).to_pydatetime().tolist(),
+            self.product_id.tolist(),
+            self.customer_id.tolist(),
+            self.quantity.tolist(),
+            [from_cents(v) for v in self.unit_price_cents.tolist()],
+            [from_cents(v) for v in self.total_amount_cents.tolist()],
+            self.region.tolist(),
+            self.category.tolist(),
+        )
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convierte el lote a DataFrame (región y categoría como dtype category)."""
+        return pd.DataFrame({
+            'date': self.date,
+            'product_id': self.product_id,
+            'customer_id': self.customer_id,
+            'quantity': self.quantity,
+            'unit_price_cents': self.unit_price_cents,
+            'total_amount_cents': self.total_amount_cents,
+            'region': pd.Categorical.from_codes(self.region_codes, categories=list(self.regions)),
+            'category': pd.Categorical.from_codes(self.category_codes, categories=list(self.categories)),
+        })
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'SaleBatch':
+        """
+        Construye un lote a partir de un DataFrame de ventas.
+
+        Acepta montos en unidades monetarias (unit_price, total_amount) o en
+        centavos (unit_price_cents, total_amount_cents).
+        """
+        unit_price = (df['unit_price_cents'] if 'unit_price_cents' in df
+                      else to_cents_array(df['unit_price'].to_numpy()))
+        total_amount = (df['total_amount_cents'] if 'total_amount_cents' in df
+                        else to_cents_array(df['total_amount'].to_numpy()))
+        region_codes, regions = _encode(df['region'], REGION)
+        category_codes, categories = _encode(df['category'], CATEGORY)
+        return cls(
+            date=pd.to_datetime(df['date']).to_numpy(dtype='datetime64[ns]'),
+            product_id=df['product_id'].to_numpy(),
+            customer_id=df['customer_id'].to_numpy(),
+            quantity=df['quantity'].to_numpy(),
+            unit_price_cents=np.asarray(unit_price),
+            total_amount_cents=np.asarray(total_amount),
+            region_codes=region_codes,
+            regions=regions,
+            category_codes=category_codes,
+            categories=categories,
+        )
+
+    @classmethod
+    def from_sales(cls, sales: Sequence[Sale]) -> 'SaleBatch':
+        """Construye un lote a partir de entidades Sale ya existentes."""
+        region_codes, regions = _encode([s.region for s in sales], REGION)
+        category_codes, categories = _encode([s.category for s in sales], CATEGORY)
+        return cls(
+            date=np.array([s.date for s in sales], dtype='datetime64[ns]'),
+            product_id=[s.product_id for s in sales],
+            customer_id=[s.customer_id for s in sales],
+            quantity=[s.quantity for s in sales],
+            unit_price_cents=to_cents_array(np.array([s.unit_price for s in sales], dtype=object)),
+            total_amount_cents=to_cents_array(np.array([s.total_amount for s in sales], dtype=object)),
+            region_codes=region_codes,
+            regions=regions,
+            category_codes=category_codes,
+            categories=categories,
+        )
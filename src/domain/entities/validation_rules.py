@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .money import cents_column, to_cents_array
+
+Frame = Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    """Regla de negocio expresada como una operación vectorizada sobre columnas."""
+    name: str
+    message: str
+    columns: Tuple[str, ...]
+    check: Callable[[Frame], np.ndarray]  # True = la fila cumple la regla
+
+
+@dataclass
+class ValidationResult:
+    """Resultado de validar un DataFrame: máscara de filas válidas y resumen por regla."""
+    mask: np.ndarray
+    summary: pd.DataFrame
+
+    @property
+    def total(self) -> int:
+        return len(self.mask)
+
+    @property
+    def rejected(self) -> int:
+        return int((~self.mask).sum())
+
+    @property
+    def is_valid(self) -> bool:
+        return bool(self.mask.all())
+
+
+class EntityValidator:
+    """Evalúa un conjunto de reglas de negocio sobre un DataFrame en una sola pasada."""
+
+    def __init__(self, rules: Sequence[ValidationRule]):
+        self.rules = tuple(rules)
+
+    def violations(self, frame: Frame) -> Dict[ValidationRule, np.ndarray]:
+        """Devuelve, por regla, la máscara de filas que la incumplen."""
+        return {rule: ~np.asarray(rule.check(frame), dtype=bool) for rule in self.rules}
+
+    def validate(self, frame: Frame) -> ValidationResult:
+        """
+        Valida todas las filas.
+
+        Args:
+            frame: DataFrame (o mapeo columna -> array) con las columnas de las reglas
+
+        Returns:
+            ValidationResult con la máscara de filas válidas y el número de
+            rechazos por regla
+        """
+        return self._summarize(self.violations(frame), _frame_length(frame))
+
+    @staticmethod
+    def _summarize(violations: Dict[ValidationRule, np.ndarray], length: int) -> ValidationResult:
+        mask = np.ones(length, dtype=bool)
+        for invalid in violations.values():
+            mask &= ~invalid
+        summary = pd.DataFrame({
+            'rule': [rule.name for rule in violations],
+            'message': [rule.message for rule in violations],
+            'rejected': [int(invalid.sum()) for invalid in violations.values()],
+        })
+        return ValidationResult(mask=mask, summary=summary)
+
+    def split(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, ValidationResult]:
+        """
+        Separa las filas válidas de las rechazadas.
+
+        Returns:
+            Tuple (válidas, rechazadas con columna failed_rules, resultado)
+        """
+        violations = self.violations(df)
+        result = self._summarize(violations, len(df))
+        rejected = df[~result.mask].copy()
+        reasons = pd.Series('', index=df.index, dtype=object)
+        for rule, invalid in violations.items():
+            if invalid.any():
+                reasons[invalid] = reasons[invalid] + rule.name + ';'
+        rejected['failed_rules'] = reasons[~result.mask].str.rstrip(';')
+        return df[result.mask], rejected, result
+
+
+def _frame_length(frame: Frame) -> int:
+    if isinstance(frame, pd.DataFrame):
+        return len(frame)
+    return len(next(iter(frame.values()), ()))
+
+
+def _numeric(frame: Frame, column: str) -> np.ndarray:
+    return pd.to_numeric(pd.Series(np.asarray(frame[column])), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _cents(frame: Frame, column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Obtiene la columna monetaria en centavos y la máscara de valores presentes."""
+    cents = cents_column(column)
+    if cents in frame:
+        values = np.asarray(frame[cents], dtype=np.int64)
+        return values, np.ones(len(values), dtype=bool)
+    values = np.asarray(frame[column])
+    present = np.asarray(pd.notna(values), dtype=bool)
+    result = np.zeros(len(values), dtype=np.int64)
+    result[present] = to_cents_array(values[present])
+    return result, present
+
+
+def _non_negative_money(column: str) -> Callable[[Frame], np.ndarray]:
+    def check(frame: Frame) -> np.ndarray:
+        values, present = _cents(frame, column)
+        return present & (values >= 0)
+    return check
+
+
+def _total_matches(frame: Frame) -> np.ndarray:
+    unit_price, unit_present = _cents(frame, 'unit_price')
+    total, total_present = _cents(frame, 'total_amount')
+    quantity = _numeric(frame, 'quantity')
+    with np.errstate(invalid='ignore'):
+        return unit_present & total_present & (total == unit_price * quantity)
+
+
+def _text(frame: Frame, column: str) -> pd.Series:
+    return pd.Series(np.asarray(frame[column], dtype=object)).fillna('').astype(str)
+
+
+SALE_RULES = (
+    ValidationRule('quantity_positive', "La cantidad debe ser mayor que cero.", ('quantity',),
+                   lambda f: _numeric(f, 'quantity') > 0),
+    ValidationRule('unit_price_non_negative', "El precio unitario no puede ser negativo.", ('unit_price',),
+                   _non_negative_money('unit_price')),
+    ValidationRule('total_matches_unit_price', "El monto total debe ser igual al precio unitario por la cantidad.",
+                   ('unit_price', 'quantity', 'total_amount'), _total_matches),
+)
+
+PRODUCT_RULES = (
+    ValidationRule('price_non_negative', "El precio debe ser positivo.", ('price',),
+                   _non_negative_money('price')),
+    ValidationRule('cost_non_negative', "El costo no puede ser negativo.", ('cost',),
+                   _non_negative_money('cost')),
+    ValidationRule('stock_non_negative', "El stock no puede ser negativo.", ('stock',),
+                   lambda f: _numeric(f, 'stock') >= 0),
+)
+
+CUSTOMER_RULES = (
+    ValidationRule('email_valid', "El correo electrónico no es válido.", ('email',),
+                   lambda f: _text(f, 'email').str.contains('@', regex=False).to_numpy()),
+    ValidationRule('name_not_empty', "El nombre del cliente no puede estar vacío.", ('name',),
+                   lambda f: (_text(f, 'name').str.strip() != '').to_numpy()),
+)
+
+SALE_VALIDATOR = EntityValidator(SALE_RULES)
+PRODUCT_VALIDATOR = EntityValidator(PRODUCT_RULES)
+CUSTOMER_VALIDATOR = EntityValidator(CUSTOMER_RULES)
@@ -1,5 +1,10 @@
 from .sales_repository import SalesRepository
 from .product_repository import ProductRepository
 from .customer_repository import CustomerRepository
+from .async_sales_repository import AsyncSalesRepository
+from .async_product_repository import AsyncProductRepository
+from .async_customer_repository import AsyncCustomerRepository
+from .pagination import Page, decode_cursor, encode_cursor
+from .query_spec import OPERATORS, apply_query
 
-__all__ = ['SalesRepository', 'ProductRepository', 'CustomerRepository']
\ No newline at end of file
+__all__ = ['SalesRepository', 'ProductRepository', 'CustomerRepository', 'AsyncSalesRepository', 'AsyncProductRepository', 'AsyncCustomerRepository', 'Page', 'encode_cursor', 'decode_cursor', 'OPERATORS', 'apply_query']
\ No newline at end of file
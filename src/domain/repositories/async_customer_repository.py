@@ -0,0 +1,92 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Mapping, Optional, Sequence, Union
+import pandas as pd
+
+from ..entities.customer import Customer
+from .query_spec import Filters
+
+
+class AsyncCustomerRepository(ABC):
+    """Interfaz asíncrona (asyncio) para el repositorio de clientes."""
+
+    @abstractmethod
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los clientes."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, customer_id: int) -> Optional[Customer]:
+        """Obtiene un cliente por su ID."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, customer_ids: List[int]) -> List[Customer]:
+        """Obtiene varios clientes por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
+    @abstractmethod
+    async def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene clientes por región."""
+        pass
+
+    @abstractmethod
+    async def get_by_segment(self, segment: str) -> pd.DataFrame:
+        """Obtiene clientes por segmento."""
+        pass
+
+    @abstractmethod
+    async def save(self, customer: Customer) -> Customer:
+        """Guarda un nuevo cliente."""
+        pass
+
+    @abstractmethod
+    async def update_segment(self, customer_id: int, segment: str) -> bool:
+        """Actualiza el segmento de un cliente."""
+        pass
+
+    @abstractmethod
+    async def update_segments_bulk(self, segments: Union[Mapping[int, Optional[str]], pd.DataFrame],
+                                   batch_size: int = 10_000) -> int:
+        """Actualiza el segmento de muchos clientes por lotes (ver CustomerRepository.update_segments_bulk)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, customer_id: int) -> bool:
+        """Elimina un cliente por su ID."""
+        pass
+
+    @abstractmethod
+    async def get_customers_with_purchases(self) -> pd.DataFrame:
+        """Obtiene clientes con su historial de compras."""
+        pass
+
+    @abstractmethod
+    async def get_top_customers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los clientes con más compras."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) todos los clientes en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) los clientes de una región en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_segment(self, segment: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) los clientes de un segmento en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_customers_with_purchases(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) los clientes con su historial de compras en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta clientes con proyección de columnas, filtros, orden y límite (ver CustomerRepository.query)."""
+        pass
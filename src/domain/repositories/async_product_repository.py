@@ -0,0 +1,88 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import pandas as pd
+
+from ..entities.product import Product
+from .query_spec import Filters
+
+
+class AsyncProductRepository(ABC):
+    """Interfaz asíncrona (asyncio) para el repositorio de productos."""
+
+    @abstractmethod
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los productos."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        """Obtiene un producto por su ID."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, product_ids: List[int]) -> List[Product]:
+        """Obtiene varios productos por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
+    @abstractmethod
+    async def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene productos por categoría."""
+        pass
+
+    @abstractmethod
+    async def get_low_stock(self, threshold: int = 10) -> pd.DataFrame:
+        """Obtiene productos con stock bajo."""
+        pass
+
+    @abstractmethod
+    async def save(self, product: Product) -> Product:
+        """Guarda un nuevo producto."""
+        pass
+
+    @abstractmethod
+    async def update_stock(self, product_id: int, quantity: int) -> bool:
+        """Actualiza el stock de un producto."""
+        pass
+
+    @abstractmethod
+    async def update_stock_bulk(self, deltas: Union[Mapping[int, int], Iterable[Tuple[int, int]]],
+                                batch_size: int = 1_000, atomic: bool = False,
+                                rejected: Optional[List[int]] = None) -> int:
+        """Aplica variaciones de stock a muchos productos por lotes (ver ProductRepository.update_stock_bulk)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, product_id: int) -> bool:
+        """Elimina un producto por su ID."""
+        pass
+
+    @abstractmethod
+    async def get_products_with_margin(self) -> pd.DataFrame:
+        """Obtiene productos con su margen de beneficio calculado."""
+        pass
+
+    @abstractmethod
+    async def get_best_sellers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los productos más vendidos."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) todos los productos en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) los productos de una categoría en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_low_stock(self, threshold: int = 10, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) los productos con stock bajo en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta productos con proyección de columnas, filtros, orden y límite (ver ProductRepository.query)."""
+        pass
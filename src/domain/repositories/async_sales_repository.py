@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Sequence, Union
+import pandas as pd
+from datetime import datetime
+
+from ..entities.sale import Sale
+from ..entities.sale_batch import SaleBatch
+from .query_spec import Filters
+from .pagination import Page
+
+
+class AsyncSalesRepository(ABC):
+    """Interfaz asíncrona (asyncio) para el repositorio de ventas."""
+
+    @abstractmethod
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
+    @abstractmethod
+    async def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas."""
+        pass
+
+    @abstractmethod
+    async def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                                     cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id), continuando desde cursor."""
+        pass
+
+    @abstractmethod
+    async def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región."""
+        pass
+
+    @abstractmethod
+    async def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto."""
+        pass
+
+    @abstractmethod
+    async def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta."""
+        pass
+
+    @abstractmethod
+    async def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas (lista de entidades o lote columnar SaleBatch)."""
+        pass
+
+    @abstractmethod
+    async def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID."""
+        pass
+
+    @abstractmethod
+    async def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """Guarda un DataFrame de ventas."""
+        pass
+
+    @abstractmethod
+    async def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """Obtiene ventas agregadas por período (diario, mensual, anual)."""
+        pass
+
+    @abstractmethod
+    async def get_top_products(self, limit: int = 10, start_date: datetime = None,
+                               end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) todas las ventas en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime,
+                           chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) las ventas de un rango de fechas en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) las ventas de una región en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera (async for) las ventas de una categoría en bloques de chunk_size filas."""
+        pass
+
+    @abstractmethod
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta ventas con proyección de columnas, filtros, orden y límite (ver SalesRepository.query)."""
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-import panda as pd
+from typing import Iterator, List, Mapping, Optional, Sequence, Union
+import pandas as pd
 
 from ..entities.customer import Customer
+from .query_spec import Filters
 
 
 class CustomerRepository(ABC):
@@ -18,6 +19,11 @@ class CustomerRepository(ABC):
         """Obtiene un cliente por su ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, customer_ids: List[int]) -> List[Customer]:
+        """Obtiene varios clientes por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
     @abstractmethod
     def get_by_region(self, region: str) -> pd.DataFrame:
         """Obtiene clientes por región."""
@@ -38,6 +44,21 @@ class CustomerRepository(ABC):
         """Actualiza el segmento de un cliente."""
         pass
 
+    @abstractmethod
+    def update_segments_bulk(self, segments: Union[Mapping[int, Optional[str]], pd.DataFrame],
+                             batch_size: int = 10_000) -> int:
+        """
+        Actualiza el segmento de muchos clientes por lotes.
+
+        Args:
+            segments: {customer_id: segmento} o DataFrame con columnas customer_id (o id) y segment
+            batch_size: Número de clientes por lote (una transacción por lote)
+
+        Returns:
+            Número de clientes cuyo segmento cambió (los que ya lo tenían no se escriben)
+        """
+        pass
+
     @abstractmethod
     def delete(self, customer_id: int) -> bool:
         """Elimina un cliente por su ID."""
@@ -51,4 +72,39 @@ class CustomerRepository(ABC):
     @abstractmethod
     def get_top_customers(self, limit: int = 10) -> pd.DataFrame:
         """Obtiene los clientes con más compras."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todos los clientes en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes de una región en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_segment(self, segment: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes de un segmento en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_customers_with_purchases(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes con su historial de compras en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Consulta clientes con proyección de columnas, filtros, orden y límite en una sola sentencia.
+
+        Args:
+            columns: Columnas a devolver (por defecto, todas)
+            filters: {columna: valor} (una lista como valor equivale a 'in') o
+                lista de (columna, operador, valor) con operadores de query_spec.OPERATORS
+            order_by: Columnas de orden; el prefijo '-' indica orden descendente
+            limit: Número máximo de filas
+        """
+        pass
@@ -0,0 +1,42 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+import pandas as pd
+
+
+@dataclass
+class Page:
+    """
+    Página de resultados de una lectura paginada por clave (keyset).
+
+    next_cursor es un token opaco que se pasa a la siguiente llamada para
+    continuar justo después de la última fila; es None en la última página.
+    """
+    data: pd.DataFrame
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def encode_cursor(date, row_id: int) -> str:
+    """Codifica la posición (date, id) de la última fila leída como token URL-safe."""
+    payload = json.dumps([pd.Timestamp(date).isoformat(), int(row_id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """Decodifica un token de encode_cursor a la posición (date, id)."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        date, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(date), int(row_id)
+    except (ValueError, TypeError) as error:
+        raise ValueError("El cursor de paginación no es válido.") from error
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 import pandas as pd
 
 from ..entities.product import Product
+from .query_spec import Filters
 
 
 class ProductRepository(ABC):
@@ -18,6 +19,11 @@ class ProductRepository(ABC):
         """Obtiene un producto por su ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, product_ids: List[int]) -> List[Product]:
+        """Obtiene varios productos por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
     @abstractmethod
     def get_by_category(self, category: str) -> pd.DataFrame:
         """Obtiene productos por categoría."""
@@ -38,6 +44,28 @@ class ProductRepository(ABC):
         """Actualiza el stock de un producto."""
         pass
 
+    @abstractmethod
+    def update_stock_bulk(self, deltas: Union[Mapping[int, int], Iterable[Tuple[int, int]]],
+                          batch_size: int = 1_000, atomic: bool = False,
+                          rejected: Optional[List[int]] = None) -> int:
+        """
+        Aplica variaciones de stock a muchos productos por lotes.
+
+        Igual que update_stock, no deja ningún stock negativo: los productos
+        cuya variación neta lo haría no se modifican y se informan en rejected.
+
+        Args:
+            deltas: {product_id: variación} o pares (product_id, variación); los ids repetidos se suman
+            batch_size: Número de productos por lote (en orden de id)
+            atomic: Si es True todos los lotes se aplican en una sola transacción;
+                si no, cada lote se confirma por separado
+            rejected: Lista a la que se añaden los ids rechazados por quedar con stock negativo
+
+        Returns:
+            Número de productos actualizados
+        """
+        pass
+
     @abstractmethod
     def delete(self, product_id: int) -> bool:
         """Elimina un producto por su ID."""
@@ -52,3 +80,33 @@ class ProductRepository(ABC):
     def get_best_sellers(self, limit: int = 10) -> pd.DataFrame:
         """Obtiene los productos más vendidos."""
         pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todos los productos en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los productos de una categoría en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_low_stock(self, threshold: int = 10, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los productos con stock bajo en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Consulta productos con proyección de columnas, filtros, orden y límite en una sola sentencia.
+
+        Args:
+            columns: Columnas a devolver (por defecto, todas)
+            filters: {columna: valor} (una lista como valor equivale a 'in') o
+                lista de (columna, operador, valor) con operadores de query_spec.OPERATORS
+            order_by: Columnas de orden; el prefijo '-' indica orden descendente
+            limit: Número máximo de filas
+        """
+        pass
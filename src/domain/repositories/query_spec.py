@@ -0,0 +1,90 @@
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+OPERATORS = ('=', '!=', '<', '<=', '>', '>=', 'in', 'between')
+
+Filter = Tuple[str, str, Any]
+Filters = Union[Mapping[str, Any], Sequence[Filter]]
+
+
+def normalize_filters(filters: Optional[Filters]) -> List[Filter]:
+    """
+    Normaliza los filtros de query a una lista de (columna, operador, valor).
+
+    Un diccionario {columna: valor} equivale a igualdades; si el valor es una
+    lista, tupla o conjunto equivale a 'in'.
+    """
+    if not filters:
+        return []
+    if isinstance(filters, Mapping):
+        filters = [(column, 'in' if isinstance(value, (list, tuple, set, frozenset)) else '=', value)
+                   for column, value in filters.items()]
+    normalized = []
+    for column, operator, value in filters:
+        operator = operator.lower()
+        if operator not in OPERATORS:
+            raise ValueError(f"Operador de filtro no soportado: {operator}")
+        if operator == 'in':
+            value = list(value)
+            if not value:
+                raise ValueError(f"El filtro 'in' sobre {column} no puede estar vacío.")
+        if operator == 'between' and len(value) != 2:
+            raise ValueError(f"El filtro 'between' sobre {column} requiere dos valores.")
+        normalized.append((column, operator, value))
+    return normalized
+
+
+def parse_order_by(order_by: Optional[Iterable[str]]) -> List[Tuple[str, bool]]:
+    """Convierte ['date', '-total_amount'] en [(columna, descendente)]."""
+    if order_by is None:
+        return []
+    if isinstance(order_by, str):
+        order_by = [order_by]
+    return [(item[1:], True) if item.startswith('-') else (item, False) for item in order_by]
+
+
+def validate_columns(requested: Iterable[str], allowed: Sequence[str]) -> List[str]:
+    """Comprueba que las columnas pedidas pertenezcan a la lista permitida."""
+    requested = list(requested)
+    unknown = [column for column in requested if column not in allowed]
+    if unknown:
+        raise ValueError(f"Columnas no disponibles: {', '.join(map(str, unknown))}")
+    return requested
+
+
+def apply_query(df: pd.DataFrame, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                order_by: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+    """Aplica una consulta de query sobre un DataFrame en memoria (para implementaciones sin SQL)."""
+    allowed = list(df.columns)
+    mask = pd.Series(True, index=df.index)
+    for column, operator, value in normalize_filters(filters):
+        validate_columns([column], allowed)
+        series = df[column]
+        if operator == '=':
+            mask &= series == value
+        elif operator == '!=':
+            mask &= series != value
+        elif operator == '<':
+            mask &= series < value
+        elif operator == '<=':
+            mask &= series <= value
+        elif operator == '>':
+            mask &= series > value
+        elif operator == '>=':
+            mask &= series >= value
+        elif operator == 'in':
+            mask &= series.isin(value)
+        else:
+            mask &= series.between(value[0], value[1])
+    result = df[mask.to_numpy()]
+    order = parse_order_by(order_by)
+    if order:
+        validate_columns([column for column, _ in order], allowed)
+        result = result.sort_values([column for column, _ in order],
+                                    ascending=[not descending for _, descending in order], kind='stable')
+    if limit is not None:
+        result = result.head(limit)
+    if columns is not None:
+        result = result[validate_columns(columns, allowed)]
+    return result.reset_index(drop=True)
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Union
 import pandas as pd
 from datetime import datetime
 
 from ..entities.sale import Sale
+from ..entities.sale_batch import SaleBatch
+from .query_spec import Filters
+from .pagination import Page
 
 class SalesRepository(ABC):
     """Interfaz para el repositorio de ventas."""
@@ -18,18 +21,29 @@ class SalesRepository(ABC):
         """Obtiene una venta por su ID."""
         pass
 
+    @abstractmethod
+    def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        pass
+
     @abstractmethod
     def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
         """Obtiene ventas dentro de un rango de fechas."""
         pass
 
+    @abstractmethod
+    def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                               cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id), continuando desde cursor."""
+        pass
+
     @abstractmethod
     def get_by_region(self,region: str) -> pd.DataFrame:
         """Obtiene ventas por región."""
         pass
 
     @abstractmethod
-    def get_by_category(self, category: str) -> dp.DataFrame:
+    def get_by_category(self, category: str) -> pd.DataFrame:
         """Obtiene ventas por categoría de producto."""
         pass
 
@@ -39,8 +53,8 @@ class SalesRepository(ABC):
         pass
 
     @abstractmethod
-    def save_bulk(self, sales: List[Sale]) -> int:
-        """Guarda múltiples ventas."""
+    def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas (lista de entidades o lote columnar SaleBatch)."""
         pass
 
     @abstractmethod
@@ -62,3 +76,38 @@ class SalesRepository(ABC):
     def get_top_products(self, limit: int = 10, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
         """Obtiene los productos más vendidos."""
         pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de chunk_size filas (cursor del servidor)."""
+        pass
+
+    @abstractmethod
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Consulta ventas con proyección de columnas, filtros, orden y límite en una sola sentencia.
+
+        Args:
+            columns: Columnas a devolver (por defecto, todas)
+            filters: {columna: valor} (una lista como valor equivale a 'in') o
+                lista de (columna, operador, valor) con operadores de query_spec.OPERATORS
+            order_by: Columnas de orden; el prefijo '-' indica orden descendente
+            limit: Número máximo de filas
+        """
+        pass
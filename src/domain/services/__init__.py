@@ -1,4 +1,7 @@
 from .analytics_service import AnalyticsService
 from .statistical_service import StatisticalService, DistributionType
+from .pricing_service import DiscountPricingEngine, DiscountTable
+from .margin_service import calculate_margins
 
-__all__ = ['AnalyticsService', 'StatisticalService', 'DistributionType']
\ No newline at end of file
+__all__ = ['AnalyticsService', 'StatisticalService', 'DistributionType', 'DiscountPricingEngine', 'DiscountTable',
+           'calculate_margins']
\ No newline at end of file
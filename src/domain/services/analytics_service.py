@@ -1,28 +1,57 @@
 from abc import ABC, abstractmethod
-import panda as pd
+import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 
+from ..entities.dimension import REGION, get_dimension
+from ..entities.money import CENTS_PER_UNIT, cents_column
+
 
 class AnalyticsService(ABC):
     """Servicio de dominio para el análisis de datos de ventas. Define la lógica sin dependencias externas"""
 
+    # Columnas que necesita calculate_sales_metrics (para SalesRepository.query)
+    SALES_METRICS_COLUMNS = ('date', 'quantity', 'total_amount')
+
+    @staticmethod
+    def _money_values(df: pd.DataFrame, column: str = 'total_amount') -> Tuple[str, pd.Series]:
+        """
+        Obtiene la columna monetaria a agregar.
+
+        Prefiere la versión en centavos (<columna>_cents, int64) para que las
+        agregaciones sean aritmética entera exacta y vectorizada; si no existe
+        convierte la columna en unidades (posiblemente Decimal) a numérica.
+        """
+        cents = cents_column(column)
+        if cents in df.columns:
+            return cents, df[cents]
+        return column, pd.to_numeric(df[column])
 
-    @abstractmethod
     def calculate_sales_metrics(self, df: pd.DataFrame) -> Dict[str, float]:
         """
         Calcula métricas clave de ventas.
         
         Args:
             df: DataFrame con columnas [total_amount, quantity, date]
+                (o total_amount_cents en lugar de total_amount)
             
         Returns:
             Dict con métricas: total_sales, avg_sale, total_transactions, etc.
         """
-        pass
+        column, amounts = self._money_values(df)
+        total_sales = amounts.sum()
+        if column != 'total_amount':
+            total_sales = int(total_sales) / CENTS_PER_UNIT
+        transactions = len(df)
+        return {
+            'total_sales': float(total_sales),
+            'avg_sale': float(total_sales) / transactions if transactions else 0.0,
+            'total_transactions': transactions,
+            'total_quantity': int(df['quantity'].sum()),
+            'avg_quantity': float(df['quantity'].mean()) if transactions else 0.0,
+        }
     
-    @abstractmethod
     def analyze_trends(self, df: pd.DataFrame, period: str = 'M') -> pd.DataFrame:
         """
         Analiza tendencias de ventas por período.
@@ -32,9 +61,17 @@ class AnalyticsService(ABC):
             period: 'D' (día), 'W' (semana), 'M' (mes), 'Q' (trimestre), 'Y' (año)
             
         Returns:
-            DataFrame con ventas agregadas por período.
+            DataFrame con ventas agregadas por período (en centavos si la
+            entrada trae total_amount_cents).
         """
-        pass
+        column, amounts = self._money_values(df)
+        periods = pd.to_datetime(df['date']).dt.to_period(period).dt.start_time.rename('period')
+        frame = pd.DataFrame({column: amounts, 'quantity': df['quantity']})
+        return (frame.groupby(periods)
+                     .agg(**{column: (column, 'sum')},
+                          quantity=('quantity', 'sum'),
+                          transactions=(column, 'size'))
+                     .reset_index())
 
     @abstractmethod
     def calculate_growth_rate(self, df: pd.DataFrame, period: str = 'M') -> pd.DataFrame:
@@ -130,10 +167,12 @@ class AnalyticsService(ABC):
         """
         pass
 
-    @abstractmethod
     def analyze_regional_performance(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Analiza el desempeño de ventas por región.
+
+        La región se agrupa por sus códigos enteros del diccionario compartido
+        (dtype category), no por comparación de cadenas.
         
         Args:
             df: DataFrame con ventas [region, total_amount, quantity]
@@ -141,7 +180,19 @@ class AnalyticsService(ABC):
         Returns:
             DataFrame con métricas por región
         """
-        pass
+        column, amounts = self._money_values(df)
+        frame = pd.DataFrame({
+            REGION: get_dimension(REGION).categorical(df[REGION]),
+            column: amounts.to_numpy(),
+            'quantity': df['quantity'].to_numpy(),
+        })
+        result = (frame.groupby(REGION, observed=True)
+                       .agg(**{column: (column, 'sum')},
+                            quantity=('quantity', 'sum'),
+                            transactions=('quantity', 'size')))
+        result['avg_sale'] = result[column] / result['transactions']
+        result['share'] = result[column] / result[column].sum()
+        return result.sort_values(column, ascending=False).reset_index()
 
     @abstractmethod
     def calculate_conversion_funnel(self, df: pd.DataFrame) -> Dict[str, float]:
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from ..entities.money import column_cents
+
+
+def calculate_margins(df: pd.DataFrame) -> pd.Series:
+    """
+    Calcula el margen porcentual de todos los productos en una sola pasada.
+
+    Equivale a Product.calculate_margin: (precio - costo) / precio * 100, con
+    margen 0 para los productos con precio cero.
+
+    Args:
+        df: DataFrame de productos [price, cost] (o price_cents, cost_cents)
+
+    Returns:
+        Serie float64 con el margen, alineada con el índice de df
+    """
+    return pd.Series(_margins(column_cents(df, 'price'), column_cents(df, 'cost')), index=df.index, name='margin')
+
+
+def _margins(price: np.ndarray, cost: np.ndarray) -> np.ndarray:
+    margins = np.zeros(len(price), dtype=np.float64)
+    priced = price != 0
+    margins[priced] = (price[priced] - cost[priced]) / price[priced] * 100
+    return margins
+
@@ -0,0 +1,164 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..entities.dimension import CATEGORY, REGION, get_dimension
+from ..entities.money import CENTS_PER_UNIT, column_cents, from_cents
+from ..entities.sale import Sale
+
+# Los porcentajes de descuento se representan como millonésimas de la tasa
+# (12.5 % -> 125000), lo que admite hasta cuatro decimales en el porcentaje.
+RATE_SCALE = 1_000_000
+_PERCENT_TO_RATE = RATE_SCALE // 100
+
+
+def percentage_to_rate(percentage) -> int:
+    """Convierte un porcentaje (Decimal, int o str) a millonésimas enteras de forma exacta."""
+    rate = Decimal(str(percentage)) * _PERCENT_TO_RATE
+    if rate != rate.to_integral_value():
+        raise ValueError("El porcentaje de descuento admite como máximo cuatro decimales.")
+    if not 0 <= rate <= RATE_SCALE:
+        raise ValueError("El porcentaje de descuento debe estar entre 0 y 100.")
+    return int(rate)
+
+
+@dataclass(frozen=True)
+class DiscountTable:
+    """
+    Tabla de descuentos por tramos de cantidad, categoría y región.
+
+    Los descuentos no se acumulan: a cada venta se le aplica el mayor
+    porcentaje entre los que le corresponden.
+    """
+    quantity_tiers: Tuple[Tuple[int, Decimal], ...] = ()  # (cantidad mínima, porcentaje)
+    by_category: Mapping[str, Decimal] = field(default_factory=dict)
+    by_region: Mapping[str, Decimal] = field(default_factory=dict)
+    default: Decimal = Decimal('0')
+
+
+class DiscountPricingEngine:
+    """
+    Motor de precios que aplica una tabla de descuentos a un conjunto de ventas.
+
+    Trabaja sobre columnas completas en aritmética entera: el monto con
+    descuento exacto se calcula en unidades de 1e-8 (centavos por millonésima
+    de tasa), por lo que coincide exactamente con Sale.calculate_discount; el
+    monto facturable se redondea al centavo (half-up).
+    """
+
+    def __init__(self, table: DiscountTable):
+        self._table = table
+        self._default_rate = percentage_to_rate(table.default)
+        self._tiers = sorted((int(minimum), percentage_to_rate(pct)) for minimum, pct in table.quantity_tiers)
+        self._category_rates = {k: percentage_to_rate(v) for k, v in table.by_category.items()}
+        self._region_rates = {k: percentage_to_rate(v) for k, v in table.by_region.items()}
+
+    @staticmethod
+    def _dimension_rates(values, dimension: str, rates: Dict[str, int]) -> np.ndarray:
+        dictionary = get_dimension(dimension)
+        codes = dictionary.encode(values)
+        known = set(dictionary.values)
+        lookup = np.zeros(len(known) + 1, dtype=np.int64)  # el código -1 cae en la última posición
+        # Las claves de la tabla de descuentos que no aparecen en los datos no
+        # se registran en el diccionario compartido: ninguna venta las tiene.
+        for value, rate in rates.items():
+            if value in known:
+                lookup[dictionary.code_for(value)] = rate
+        return lookup[codes]
+
+    def discount_rates(self, df: pd.DataFrame) -> np.ndarray:
+        """Calcula la tasa de descuento (millonésimas) aplicable a cada venta."""
+        rates = np.full(len(df), self._default_rate, dtype=np.int64)
+        if self._tiers:
+            quantity = df['quantity'].to_numpy()
+            for minimum, rate in self._tiers:
+                rates = np.where(quantity >= minimum, np.maximum(rates, rate), rates)
+        if self._category_rates:
+            rates = np.maximum(rates, self._dimension_rates(df[CATEGORY], CATEGORY, self._category_rates))
+        if self._region_rates:
+            rates = np.maximum(rates, self._dimension_rates(df[REGION], REGION, self._region_rates))
+        return rates
+
+    def exact_discounted(self, df: pd.DataFrame) -> np.ndarray:
+        """Monto con descuento exacto de cada venta en unidades de 1e-8 (sin redondeo)."""
+        return column_cents(df, 'total_amount') * (RATE_SCALE - self.discount_rates(df))
+
+    def apply(self, df: pd.DataFrame, product_costs: Optional[pd.Series] = None) -> pd.DataFrame:
+        """
+        Aplica la tabla de descuentos a todas las ventas.
+
+        Args:
+            df: DataFrame con ventas [quantity, total_amount (o total_amount_cents),
+                category, region]; opcionalmente unit_cost (o unit_cost_cents)
+            product_costs: Costo unitario en centavos indexado por product_id,
+                alternativo a la columna unit_cost
+
+        Returns:
+            DataFrame con discount_percentage, montos en centavos antes y
+            después del descuento y, si hay costos, el impacto en el margen
+        """
+        totals = column_cents(df, 'total_amount')
+        rates = self.discount_rates(df)
+        exact = totals * (RATE_SCALE - rates)
+        discounted = (exact + RATE_SCALE // 2) // RATE_SCALE
+        result = pd.DataFrame({
+            'discount_percentage': rates / _PERCENT_TO_RATE,
+            'total_amount_cents': totals,
+            'discounted_amount_cents': discounted,
+            'discount_cents': totals - discounted,
+        }, index=df.index)
+
+        unit_costs = self._unit_costs(df, product_costs)
+        if unit_costs is not None:
+            costs = unit_costs * df['quantity'].to_numpy()
+            result['margin_cents'] = totals - costs
+            result['discounted_margin_cents'] = discounted - costs
+            result['margin_impact_cents'] = result['discounted_margin_cents'] - result['margin_cents']
+        return result
+
+    @staticmethod
+    def _unit_costs(df: pd.DataFrame, product_costs: Optional[pd.Series]) -> Optional[np.ndarray]:
+        if product_costs is not None:
+            return product_costs.reindex(df['product_id']).fillna(0).to_numpy(dtype=np.int64)
+        if 'unit_cost' in df or 'unit_cost_cents' in df:
+            return column_cents(df, 'unit_cost')
+        return None
+
+    def summarize(self, priced: pd.DataFrame) -> Dict[str, float]:
+        """Resume el resultado de apply: ingresos antes/después y variación de margen."""
+        summary = {
+            'revenue': int(priced['total_amount_cents'].sum()) / CENTS_PER_UNIT,
+            'discounted_revenue': int(priced['discounted_amount_cents'].sum()) / CENTS_PER_UNIT,
+            'total_discount': int(priced['discount_cents'].sum()) / CENTS_PER_UNIT,
+        }
+        if 'margin_impact_cents' in priced:
+            summary['margin'] = int(priced['margin_cents'].sum()) / CENTS_PER_UNIT
+            summary['discounted_margin'] = int(priced['discounted_margin_cents'].sum()) / CENTS_PER_UNIT
+            summary['margin_impact'] = int(priced['margin_impact_cents'].sum()) / CENTS_PER_UNIT
+        return summary
+
+    def verify(self, sales: Sequence[Sale]) -> List[int]:
+        """
+        Compara el motor con Sale.calculate_discount venta a venta.
+
+        Returns:
+            Posiciones de las ventas cuyo resultado no coincide (vacía si todo cuadra)
+        """
+        df = pd.DataFrame({
+            'quantity': [sale.quantity for sale in sales],
+            'total_amount_cents': [sale.total_amount_cents for sale in sales],
+            CATEGORY: [sale.category for sale in sales],
+            REGION: [sale.region for sale in sales],
+        })
+        rates = self.discount_rates(df)
+        exact = self.exact_discounted(df)
+        mismatches = []
+        for position, sale in enumerate(sales):
+            percentage = Decimal(int(rates[position])) / _PERCENT_TO_RATE
+            expected = sale.calculate_discount(percentage)
+            if from_cents(int(exact[position])).scaleb(-6) != expected:
+                mismatches.append(position)
+        return mismatches
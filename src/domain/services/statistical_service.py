@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-import panda as pd
+import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, List, Optional
 from enum import Enum
 
 
-class DistributorType(Enum):
+class DistributionType(Enum):
     """Tipos de distribución estadística para análisis de ventas."""
     NORMAL = "normal"
     UNIFORM = "uniform"
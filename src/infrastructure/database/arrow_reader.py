@@ -0,0 +1,157 @@
+import importlib
+import importlib.util
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+from config.settings import settings
+from ...domain.entities.money import CENTS_PER_UNIT, cents_column
+from .sql_connection import get_engine
+
+BACKENDS = ('auto', 'connectorx', 'adbc', 'cursor')
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def _widen(arrow_type: pa.DataType) -> pa.DataType:
+    """Tipo común para todos los bloques de una columna (la precisión decimal inferida varía por bloque)."""
+    if pa.types.is_decimal(arrow_type):
+        return pa.decimal128(38, arrow_type.scale)
+    return arrow_type
+
+
+def _decimal_to_cents(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Centavos int64 exactos de una columna decimal (redondeo half-up, como money.to_cents)."""
+    # Precisión 34: el producto por 100 (decimal de 3 dígitos) no supera los 38 dígitos de decimal128
+    column = column.cast(pa.decimal128(34, column.type.scale))
+    cents = pc.multiply(column, pa.scalar(Decimal(CENTS_PER_UNIT), pa.decimal128(3, 0)))
+    return pc.round(cents, round_mode='half_towards_infinity').cast(pa.int64())
+
+
+def _decimals_to_numbers(table: pa.Table, cents_columns: Iterable[str] = ()) -> pa.Table:
+    """
+    Convierte las columnas decimales a float64, como pd.read_sql (coerce_float),
+    o a <columna>_cents (int64) las indicadas en cents_columns.
+    """
+    cents_columns = set(cents_columns)
+    for position, field in enumerate(table.schema):
+        if not pa.types.is_decimal(field.type):
+            continue
+        if field.name in cents_columns:
+            table = table.set_column(position, cents_column(field.name), _decimal_to_cents(table.column(position)))
+        else:
+            table = table.set_column(position, field.name, table.column(position).cast(pa.float64()))
+    return table
+
+
+class ArrowReader:
+    """
+    Lectura de resultados como tablas Arrow columnares.
+
+    Backends:
+        connectorx: lee con connectorx directamente a buffers Arrow (MySQL).
+        adbc: usa el driver ADBC de SQLite sobre el archivo de la base de datos.
+        cursor: construye record batches desde el cursor DB-API del engine;
+            no requiere dependencias adicionales.
+    Con 'auto' se usa connectorx (MySQL) o adbc (SQLite en archivo) si están
+    instalados y, si no, cursor. Los DataFrames se obtienen con
+    to_pandas(split_blocks=True), que reutiliza los buffers numéricos de
+    Arrow sin consolidarlos en bloques de pandas; las columnas decimales
+    (DECIMAL de MySQL) se entregan como float64, igual que con pd.read_sql,
+    o como centavos int64 exactos.
+    """
+
+    CHUNK_SIZE = 50_000
+
+    def __init__(self, engine: Optional[Engine] = None, backend: Optional[str] = None):
+        self._engine = engine if engine is not None else get_engine()
+        backend = backend or settings.DB_ARROW_BACKEND
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend de lectura Arrow no soportado: {backend}")
+        self.backend = self._resolve(backend)
+
+    def _resolve(self, backend: str) -> str:
+        dialect = self._engine.dialect.name
+        file_database = dialect == 'sqlite' and self._engine.url.database not in (None, '', ':memory:')
+        if backend == 'auto':
+            if dialect == 'mysql' and _available('connectorx'):
+                return 'connectorx'
+            if file_database and _available('adbc_driver_sqlite'):
+                return 'adbc'
+            return 'cursor'
+        if backend == 'connectorx' and not _available('connectorx'):
+            raise ValueError("El backend 'connectorx' requiere el paquete connectorx.")
+        if backend == 'adbc':
+            if not file_database:
+                raise ValueError("El backend 'adbc' solo está disponible para bases SQLite en archivo.")
+            if not _available('adbc_driver_sqlite'):
+                raise ValueError("El backend 'adbc' requiere el paquete adbc-driver-sqlite.")
+        return backend
+
+    def _render(self, statement: TextClause, params: dict) -> str:
+        """SQL con los parámetros como literales (connectorx y ADBC no reciben parámetros con nombre)."""
+        dialect = self._engine.dialect
+        if dialect.name == 'sqlite':
+            # Mismo formato que el adaptador de sqlite3 para que las comparaciones de texto coincidan
+            params = {name: value.isoformat(' ') if isinstance(value, datetime) else value
+                      for name, value in params.items()}
+        statement = statement.bindparams(*(bindparam(name, value, expanding=isinstance(value, (list, tuple)))
+                                           for name, value in params.items()))
+        compiler_dialect = type(dialect)(paramstyle='named')
+        return str(statement.compile(dialect=compiler_dialect, compile_kwargs={'literal_binds': True}))
+
+    def read_table(self, sql: Union[str, TextClause], params: Optional[dict] = None) -> pa.Table:
+        """Ejecuta una consulta y devuelve el resultado como tabla Arrow."""
+        statement = text(sql) if isinstance(sql, str) else sql
+        params = params or {}
+        if self.backend == 'connectorx':
+            connectorx = importlib.import_module('connectorx')
+            url = self._engine.url.set(drivername=self._engine.dialect.name)
+            return connectorx.read_sql(url.render_as_string(hide_password=False),
+                                       self._render(statement, params), return_type='arrow')
+        if self.backend == 'adbc':
+            dbapi = importlib.import_module('adbc_driver_sqlite.dbapi')
+            with dbapi.connect(self._engine.url.database) as conn, conn.cursor() as cursor:
+                cursor.execute(self._render(statement, params))
+                return cursor.fetch_arrow_table()
+        return self._read_cursor(statement, params)
+
+    def _read_cursor(self, statement: TextClause, params: dict) -> pa.Table:
+        with self._engine.connect() as conn:
+            result = conn.execute(statement, params)
+            names = list(result.keys())
+            chunks: List[List[pa.Array]] = [[] for _ in names]
+            types: List[Optional[pa.DataType]] = [None] * len(names)
+            for rows in result.partitions(self.CHUNK_SIZE):
+                for position, values in enumerate(zip(*rows)):
+                    array = pa.array(values, type=types[position])
+                    if types[position] is None and not pa.types.is_null(array.type):
+                        types[position] = _widen(array.type)
+                        array = array.cast(types[position])
+                    chunks[position].append(array)
+        columns = []
+        for arrays, arrow_type in zip(chunks, types):
+            arrow_type = arrow_type or pa.null()
+            columns.append(pa.chunked_array([array if array.type == arrow_type else array.cast(arrow_type)
+                                             for array in arrays], type=arrow_type))
+        return pa.Table.from_arrays(columns, names=names)
+
+    def read_frame(self, sql: Union[str, TextClause], params: Optional[dict] = None,
+                   cents_columns: Iterable[str] = ()) -> pd.DataFrame:
+        """
+        Ejecuta una consulta y convierte la tabla Arrow a DataFrame sin consolidar bloques.
+
+        Las columnas decimales de cents_columns se devuelven como <columna>_cents
+        (int64) y el resto de columnas decimales como float64.
+        """
+        table = _decimals_to_numbers(self.read_table(sql, params), cents_columns)
+        return table.to_pandas(split_blocks=True, self_destruct=True, coerce_temporal_nanoseconds=True)
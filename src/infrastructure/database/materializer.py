@@ -0,0 +1,224 @@
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from ...domain.entities.dimension import get_dimension
+from ...domain.entities.money import CENTS_PER_UNIT, cents_column
+
+# Tipos lógicos de columna
+ID = 'id'
+INTEGER = 'integer'
+MONEY = 'money'
+DATETIME = 'datetime'
+CATEGORY = 'category'
+TEXT = 'text'
+
+# Esquema de sql/init/01_create_tables.sql. Los ids e INT de MySQL son de
+# 32 bits; las columnas VARCHAR de baja cardinalidad se codifican como
+# category con los diccionarios compartidos de dimensión.
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'customers': {
+        'id': ID,
+        'name': TEXT,
+        'email': TEXT,
+        'phone': TEXT,
+        'region': CATEGORY,
+        'registration_date': DATETIME,
+        'segment': CATEGORY,
+    },
+    'products': {
+        'id': ID,
+        'name': TEXT,
+        'category': CATEGORY,
+        'price': MONEY,
+        'cost': MONEY,
+        'stock': INTEGER,
+    },
+    'sales': {
+        'id': ID,
+        'date': DATETIME,
+        'product_id': ID,
+        'customer_id': ID,
+        'quantity': INTEGER,
+        'unit_price': MONEY,
+        'total_amount': MONEY,
+        'region': CATEGORY,
+        'category': CATEGORY,
+    },
+}
+
+_INITIAL_CAPACITY = 1024
+
+
+class _ColumnBuffer:
+    """Array preasignado de una columna que crece geométricamente al llenarse por bloques."""
+
+    def __init__(self, dtype, capacity: int, nullable: bool = False):
+        self.values = np.empty(capacity, dtype=dtype)
+        self.mask = np.zeros(capacity, dtype=bool) if nullable else None
+        self.size = 0
+
+    def append(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        end = self.size + len(values)
+        if end > len(self.values):
+            capacity = max(end, len(self.values) * 2)
+            grown = np.empty(capacity, dtype=self.values.dtype)
+            grown[:self.size] = self.values[:self.size]
+            self.values = grown
+            if self.mask is not None:
+                grown_mask = np.zeros(capacity, dtype=bool)
+                grown_mask[:self.size] = self.mask[:self.size]
+                self.mask = grown_mask
+        self.values[self.size:end] = values
+        if self.mask is not None and mask is not None:
+            self.mask[self.size:end] = mask
+        self.size = end
+
+    def finish(self) -> np.ndarray:
+        return self.values[:self.size]
+
+
+def _integers(values: Sequence[Any], dtype) -> tuple:
+    """Convierte valores enteros de un bloque; los NULL se devuelven como máscara."""
+    try:
+        return np.array(values, dtype=dtype), None
+    except TypeError:
+        mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        return np.array([0 if value is None else value for value in values], dtype=dtype), mask
+
+
+class ResultMaterializer:
+    """
+    Construye DataFrames tipados directamente desde las filas de un cursor.
+
+    Cada columna se llena bloque a bloque (result.partitions) en un array
+    preasignado del dtype final, sin pasar por una columna object intermedia:
+    ids e INT como int32 (Int32 si hay NULL), DECIMAL como float64 o como
+    <columna>_cents int64 con money_as_cents=True, DATETIME como
+    datetime64[ns] y los VARCHAR de baja cardinalidad como category.
+    Las columnas que no figuran en el esquema se infieren con pandas.
+    """
+
+    CHUNK_SIZE = 50_000
+
+    def __init__(self, schema: Mapping[str, str], money_as_cents: bool = False,
+                 chunk_size: Optional[int] = None):
+        self._schema = dict(schema)
+        self._money_as_cents = money_as_cents
+        self._chunk_size = chunk_size or self.CHUNK_SIZE
+
+    @classmethod
+    def for_table(cls, table: str, money_as_cents: bool = False, extra: Optional[Mapping[str, str]] = None,
+                  chunk_size: Optional[int] = None) -> 'ResultMaterializer':
+        """Materializador con el esquema de una tabla (y tipos de columnas calculadas en extra)."""
+        if table not in TABLE_SCHEMAS:
+            raise ValueError(f"Tabla sin esquema de materialización: {table}")
+        return cls({**TABLE_SCHEMAS[table], **(extra or {})}, money_as_cents, chunk_size)
+
+    def _buffer(self, kind: Optional[str], capacity: int) -> _ColumnBuffer:
+        if kind in (ID, INTEGER):
+            return _ColumnBuffer(np.int32, capacity, nullable=True)
+        if kind == MONEY:
+            return _ColumnBuffer(np.int64 if self._money_as_cents else np.float64, capacity,
+                                 nullable=self._money_as_cents)
+        if kind == DATETIME:
+            return _ColumnBuffer('datetime64[ns]', capacity)
+        return _ColumnBuffer(object, capacity)
+
+    def _fill(self, buffer: _ColumnBuffer, kind: Optional[str], values: Sequence[Any]) -> None:
+        if kind in (ID, INTEGER):
+            buffer.append(*_integers(values, np.int32))
+        elif kind == MONEY:
+            # DECIMAL(10, 2) es exacto al centavo en float64
+            amounts = np.array(values, dtype=np.float64)
+            if self._money_as_cents:
+                mask = np.isnan(amounts)
+                cents = np.round(np.where(mask, 0.0, amounts) * CENTS_PER_UNIT).astype(np.int64)
+                buffer.append(cents, mask)
+            else:
+                buffer.append(amounts)
+        elif kind == DATETIME:
+            buffer.append(np.array(values, dtype='datetime64[ns]'))
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            buffer.append(column)
+
+    def _column(self, name: str, kind: Optional[str], buffer: _ColumnBuffer):
+        values = buffer.finish()
+        mask = buffer.mask[:buffer.size] if buffer.mask is not None else None
+        if mask is not None and mask.any():
+            return pd.arrays.IntegerArray(values, mask)
+        if kind == CATEGORY:
+            dictionary = get_dimension(name)
+            return pd.Categorical.from_codes(dictionary.encode(values), categories=list(dictionary.values))
+        if kind is None:
+            return pd.Series(values, copy=False).infer_objects().to_numpy()
+        return values
+
+    def _frame(self, columns: List[str], buffers: List[_ColumnBuffer]) -> pd.DataFrame:
+        data = {}
+        for name, buffer in zip(columns, buffers):
+            kind = self._schema.get(name)
+            output = cents_column(name) if kind == MONEY and self._money_as_cents else name
+            data[output] = self._column(name, kind, buffer)
+        return pd.DataFrame(data, columns=list(data), copy=False)
+
+    def materialize(self, result, expected_rows: Optional[int] = None) -> pd.DataFrame:
+        """
+        Consume un resultado de SQLAlchemy y devuelve el DataFrame tipado.
+
+        Con expected_rows los arrays se preasignan al tamaño exacto.
+        """
+        columns = list(result.keys())
+        kinds = [self._schema.get(name) for name in columns]
+        capacity = expected_rows if expected_rows is not None else _INITIAL_CAPACITY
+        buffers = [self._buffer(kind, capacity) for kind in kinds]
+        for rows in result.partitions(self._chunk_size):
+            for buffer, kind, values in zip(buffers, kinds, zip(*rows)):
+                self._fill(buffer, kind, values)
+        return self._frame(columns, buffers)
+
+    def iter_materialize(self, result, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Produce un DataFrame tipado por cada bloque de chunk_size filas del resultado."""
+        columns = list(result.keys())
+        kinds = [self._schema.get(name) for name in columns]
+        for rows in result.partitions(chunk_size or self._chunk_size):
+            buffers = [self._buffer(kind, len(rows)) for kind in kinds]
+            for buffer, kind, values in zip(buffers, kinds, zip(*rows)):
+                self._fill(buffer, kind, values)
+            yield self._frame(columns, buffers)
+
+
+def read_typed(connectable, sql: str, table: str, params: Optional[dict] = None,
+               money_as_cents: bool = False, extra: Optional[Mapping[str, str]] = None) -> pd.DataFrame:
+    """Ejecuta una consulta y materializa el resultado con el esquema de la tabla."""
+    materializer = ResultMaterializer.for_table(table, money_as_cents, extra)
+    if isinstance(connectable, Connection):
+        return materializer.materialize(connectable.execute(text(sql), params or {}))
+    with connectable.connect() as conn:
+        return materializer.materialize(conn.execute(text(sql), params or {}))
+
+
+def compare_memory(engine: Engine, sql: str, table: str, params: Optional[dict] = None,
+                   money_as_cents: bool = False) -> Dict[str, float]:
+    """
+    Compara la memoria de un resultado leído con pandas.read_sql y con el materializador.
+
+    Returns:
+        Diccionario con bytes de cada DataFrame (memory_usage(deep=True)) y su relación
+    """
+    with engine.connect() as conn:
+        baseline = pd.read_sql(text(sql), conn, params=params or {})
+        typed = read_typed(conn, sql, table, params, money_as_cents)
+    baseline_bytes = int(baseline.memory_usage(deep=True).sum())
+    typed_bytes = int(typed.memory_usage(deep=True).sum())
+    return {
+        'rows': len(typed),
+        'read_sql_bytes': baseline_bytes,
+        'typed_bytes': typed_bytes,
+        'ratio': typed_bytes / baseline_bytes if baseline_bytes else 1.0,
+    }
@@ -0,0 +1,419 @@
+"""Sentencias SQL utilizadas por los repositorios."""
+
+SALES_COLUMNS = "id, date, product_id, customer_id, quantity, unit_price, total_amount, region, category"
+
+SELECT_ALL_SALES = f"SELECT {SALES_COLUMNS} FROM sales"
+
+SELECT_SALE_BY_ID = f"SELECT {SALES_COLUMNS} FROM sales WHERE id = :sale_id"
+
+SELECT_SALES_BY_DATE_RANGE = f"""
+SELECT {SALES_COLUMNS} FROM sales
+WHERE date BETWEEN :start_date AND :end_date
+ORDER BY date
+"""
+
+# Paginación por clave sobre (date, id): idx_date incluye implícitamente la
+# clave primaria en InnoDB, así que cada página es un rango del índice.
+SELECT_SALES_PAGE_BY_DATE_RANGE = f"""
+SELECT {SALES_COLUMNS} FROM sales
+WHERE date BETWEEN :start_date AND :end_date
+ORDER BY date, id
+LIMIT :limit
+"""
+
+SELECT_SALES_PAGE_BY_DATE_RANGE_AFTER = f"""
+SELECT {SALES_COLUMNS} FROM sales
+WHERE date BETWEEN :start_date AND :end_date
+  AND (date > :after_date OR (date = :after_date AND id > :after_id))
+ORDER BY date, id
+LIMIT :limit
+"""
+
+SELECT_SALES_BY_REGION = f"SELECT {SALES_COLUMNS} FROM sales WHERE region = :region"
+
+SELECT_SALES_BY_CATEGORY = f"SELECT {SALES_COLUMNS} FROM sales WHERE category = :category"
+
+SELECT_SALES_FOR_AGGREGATION = "SELECT date, quantity, total_amount FROM sales"
+
+SELECT_TOP_PRODUCTS = """
+SELECT s.product_id, p.name AS product_name,
+       SUM(s.quantity) AS total_quantity,
+       SUM(s.total_amount) AS total_revenue,
+       COUNT(*) AS transactions
+FROM sales s
+JOIN products p ON p.id = s.product_id
+WHERE (:start_date IS NULL OR s.date >= :start_date)
+  AND (:end_date IS NULL OR s.date <= :end_date)
+GROUP BY s.product_id, p.name
+ORDER BY total_revenue DESC
+LIMIT :limit
+"""
+
+INSERT_SALE = """
+INSERT INTO sales (date, product_id, customer_id, quantity, unit_price, total_amount, region, category)
+VALUES (:date, :product_id, :customer_id, :quantity, :unit_price, :total_amount, :region, :category)
+"""
+
+DELETE_SALE = "DELETE FROM sales WHERE id = :sale_id"
+
+DELETE_ALL_SALES = "DELETE FROM sales"
+
+PRODUCT_COLUMNS = "id, name, category, price, cost, stock"
+
+SELECT_ALL_PRODUCTS = f"SELECT {PRODUCT_COLUMNS} FROM products"
+
+SELECT_PRODUCT_BY_ID = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id = :product_id"
+
+SELECT_PRODUCTS_BY_CATEGORY = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE category = :category"
+
+SELECT_LOW_STOCK_PRODUCTS = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE stock <= :threshold ORDER BY stock"
+
+SELECT_BEST_SELLERS = """
+SELECT p.id AS product_id, p.name AS product_name, p.category,
+       SUM(s.quantity) AS total_quantity,
+       SUM(s.total_amount) AS total_revenue
+FROM products p
+JOIN sales s ON s.product_id = p.id
+GROUP BY p.id, p.name, p.category
+ORDER BY total_quantity DESC
+LIMIT :limit
+"""
+
+INSERT_PRODUCT = """
+INSERT INTO products (name, category, price, cost, stock)
+VALUES (:name, :category, :price, :cost, :stock)
+"""
+
+UPDATE_PRODUCT_STOCK = """
+UPDATE products SET stock = stock + :quantity
+WHERE id = :product_id AND stock + :quantity >= 0
+"""
+
+DELETE_PRODUCT = "DELETE FROM products WHERE id = :product_id"
+
+
+SELECT_PRODUCT_STOCK_BY_IDS = "SELECT id, stock FROM products WHERE id IN :ids ORDER BY id"
+
+
+def build_stock_delta_update(deltas) -> tuple:
+    """
+    Construye un UPDATE único que suma a cada producto su variación de stock (CASE por id).
+
+    Como UPDATE_PRODUCT_STOCK, no modifica los productos cuyo stock quedaría negativo.
+    """
+    cases = []
+    params = {}
+    for position, (product_id, delta) in enumerate(deltas.items()):
+        cases.append(f"WHEN :id_{position} THEN :delta_{position}")
+        params[f'id_{position}'] = int(product_id)
+        params[f'delta_{position}'] = int(delta)
+    ids = ", ".join(f":id_{position}" for position in range(len(cases)))
+    delta = f"CASE id {' '.join(cases)} ELSE 0 END"
+    sql = f"UPDATE products SET stock = stock + {delta} WHERE id IN ({ids}) AND stock + {delta} >= 0"
+    return sql, params
+
+CUSTOMER_COLUMNS = "id, name, email, phone, region, registration_date, segment"
+
+SELECT_ALL_CUSTOMERS = f"SELECT {CUSTOMER_COLUMNS} FROM customers"
+
+SELECT_CUSTOMER_BY_ID = f"SELECT {CUSTOMER_COLUMNS} FROM customers WHERE id = :customer_id"
+
+SELECT_CUSTOMERS_BY_REGION = f"SELECT {CUSTOMER_COLUMNS} FROM customers WHERE region = :region"
+
+SELECT_CUSTOMERS_BY_SEGMENT = f"SELECT {CUSTOMER_COLUMNS} FROM customers WHERE segment = :segment"
+
+SELECT_CUSTOMERS_WITH_PURCHASES = """
+SELECT c.id, c.name, c.email, c.region, c.segment,
+       COUNT(s.id) AS purchases,
+       COALESCE(SUM(s.total_amount), 0) AS total_spent,
+       MIN(s.date) AS first_purchase,
+       MAX(s.date) AS last_purchase
+FROM customers c
+LEFT JOIN sales s ON s.customer_id = c.id
+GROUP BY c.id, c.name, c.email, c.region, c.segment
+"""
+
+SELECT_TOP_CUSTOMERS = """
+SELECT c.id AS customer_id, c.name, c.region, c.segment,
+       COUNT(s.id) AS purchases,
+       SUM(s.total_amount) AS total_spent
+FROM customers c
+JOIN sales s ON s.customer_id = c.id
+GROUP BY c.id, c.name, c.region, c.segment
+ORDER BY total_spent DESC
+LIMIT :limit
+"""
+
+INSERT_CUSTOMER = """
+INSERT INTO customers (name, email, phone, region, registration_date, segment)
+VALUES (:name, :email, :phone, :region, :registration_date, :segment)
+"""
+
+UPDATE_CUSTOMER_SEGMENT = "UPDATE customers SET segment = :segment WHERE id = :customer_id"
+
+# Actualización masiva de segmentos: tabla temporal de la sesión + UPDATE con JOIN
+SEGMENT_STAGING_TABLE = "customer_segment_updates"
+
+CREATE_SEGMENT_STAGING = f"""
+CREATE TEMPORARY TABLE IF NOT EXISTS {SEGMENT_STAGING_TABLE} (
+    customer_id INT PRIMARY KEY,
+    segment VARCHAR(50)
+)
+"""
+
+INSERT_SEGMENT_STAGING = f"INSERT INTO {SEGMENT_STAGING_TABLE} (customer_id, segment) VALUES (:customer_id, :segment)"
+
+CLEAR_SEGMENT_STAGING = f"DELETE FROM {SEGMENT_STAGING_TABLE}"
+
+DROP_SEGMENT_STAGING = {
+    'mysql': f"DROP TEMPORARY TABLE IF EXISTS {SEGMENT_STAGING_TABLE}",
+    'sqlite': f"DROP TABLE IF EXISTS temp.{SEGMENT_STAGING_TABLE}",
+}
+
+# Solo se escriben las filas cuyo segmento cambia (comparación segura con NULL)
+APPLY_SEGMENT_STAGING = {
+    'mysql': f"""
+UPDATE customers c
+JOIN {SEGMENT_STAGING_TABLE} s ON s.customer_id = c.id
+SET c.segment = s.segment
+WHERE NOT (c.segment <=> s.segment)
+""",
+    'sqlite': f"""
+UPDATE customers SET segment = s.segment
+FROM {SEGMENT_STAGING_TABLE} AS s
+WHERE s.customer_id = customers.id AND customers.segment IS NOT s.segment
+""",
+}
+
+DELETE_CUSTOMER = "DELETE FROM customers WHERE id = :customer_id"
+
+SELECT_SALES_BY_IDS = f"SELECT {SALES_COLUMNS} FROM sales WHERE id IN :ids"
+
+# Purga y archivo de ventas antiguas por lotes de ids (sql/init/04_create_sales_archive.sql)
+# ORDER BY date, id se resuelve recorriendo idx_date (que incluye la clave primaria) sin ordenar
+SELECT_SALE_IDS_BEFORE = "SELECT id FROM sales WHERE date < :cutoff ORDER BY date, id LIMIT :limit"
+
+INSERT_SALES_ARCHIVE_BY_IDS = f"INSERT INTO sales_archive ({SALES_COLUMNS}) SELECT {SALES_COLUMNS} FROM sales WHERE id IN :ids"
+
+DELETE_SALES_BY_IDS = "DELETE FROM sales WHERE id IN :ids"
+
+SELECT_PRODUCTS_BY_IDS = f"SELECT {PRODUCT_COLUMNS} FROM products WHERE id IN :ids"
+
+SELECT_CUSTOMERS_BY_IDS = f"SELECT {CUSTOMER_COLUMNS} FROM customers WHERE id IN :ids"
+
+# Tablas de resumen por período (sql/init/02_create_rollups.sql)
+ROLLUP_TABLES = {
+    'D': 'sales_rollup_daily',
+    'M': 'sales_rollup_monthly',
+    'Y': 'sales_rollup_yearly',
+}
+
+ROLLUP_PERIOD_EXPRESSIONS = {
+    'mysql': {
+        'D': "DATE(date)",
+        'M': "DATE_FORMAT(date, '%Y-%m-01')",
+        'Y': "DATE_FORMAT(date, '%Y-01-01')",
+    },
+    'sqlite': {
+        'D': "date(date)",
+        'M': "strftime('%Y-%m-01', date)",
+        'Y': "strftime('%Y-01-01', date)",
+    },
+}
+
+# Medidas que suman todas las tablas de agregados incrementales
+AGGREGATE_MEASURES = {
+    'quantity': 'SUM(quantity)',
+    'total_amount': 'SUM(total_amount)',
+    'transactions': 'COUNT(*)',
+}
+
+
+def build_incremental_upsert(dialect: str, table: str, keys, where: str = "id IN :ids", sign: int = 1) -> str:
+    """
+    Construye el INSERT ... SELECT que suma a una tabla de agregados las ventas
+    que cumplen where (por defecto, id en la lista :ids), agrupadas por keys
+    (columna -> expresión). Con sign=-1 las descuenta.
+    """
+    negate = "-" if sign < 0 else ""
+    select_keys = ", ".join(f"{expression} AS {column}" for column, expression in keys.items())
+    select_measures = ", ".join(f"{negate}{expression} AS {column}" for column, expression in AGGREGATE_MEASURES.items())
+    columns = ", ".join([*keys, *AGGREGATE_MEASURES])
+    positions = ", ".join(str(position) for position in range(1, len(keys) + 1))
+    if dialect == 'mysql':
+        updates = ", ".join(f"{m} = {table}.{m} + delta.{m}" for m in AGGREGATE_MEASURES)
+        clause = f"ON DUPLICATE KEY UPDATE {updates}"
+    else:
+        updates = ", ".join(f"{m} = {m} + excluded.{m}" for m in AGGREGATE_MEASURES)
+        clause = f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}"
+    return f"""
+INSERT INTO {table} ({columns})
+SELECT {columns}
+FROM (
+    SELECT {select_keys}, {select_measures}
+    FROM sales
+    WHERE {where}
+    GROUP BY {positions}
+) AS delta
+WHERE 1 = 1
+{clause}"""
+
+
+def build_clear_table(table: str) -> str:
+    """Construye el DELETE que vacía una tabla de agregados."""
+    return f"DELETE FROM {table}"
+
+
+def build_incremental_subtract(table: str, keys) -> str:
+    """Construye el UPDATE que descuenta una venta eliminada de una tabla de agregados."""
+    conditions = " AND ".join(f"{column} = :{column}" for column in keys)
+    return f"""
+UPDATE {table}
+SET quantity = quantity - :quantity,
+    total_amount = total_amount - :total_amount,
+    transactions = transactions - 1
+WHERE {conditions}
+"""
+
+
+def rollup_keys(period_expression: str) -> dict:
+    """Claves de agrupación de las tablas de resumen por período."""
+    return {
+        'period_start': period_expression,
+        'region': "COALESCE(region, '')",
+        'category': "COALESCE(category, '')",
+    }
+
+
+def build_rollup_aggregation(table: str) -> str:
+    """Construye la lectura de una tabla de resumen sumada sobre región y categoría."""
+    return f"""
+SELECT period_start, SUM(quantity) AS quantity, SUM(total_amount) AS total_amount,
+       SUM(transactions) AS transactions
+FROM {table}
+GROUP BY period_start
+HAVING SUM(transactions) > 0
+"""
+
+
+# Ventas pendientes de sumar por conjunto de agregados (sql/init/02_create_rollups.sql). El trigger
+# AFTER INSERT de sales añade una fila por cada nombre de sales_rollup_state en la misma transacción
+# que la venta, de modo que una venta se suma aunque su id se confirme después de ids mayores.
+SELECT_ROLLUP_STATE = "SELECT name FROM sales_rollup_state WHERE name = :name"
+
+INSERT_ROLLUP_STATE = {
+    'mysql': "INSERT IGNORE INTO sales_rollup_state (name) VALUES (:name)",
+    'sqlite': "INSERT OR IGNORE INTO sales_rollup_state (name) VALUES (:name)",
+}
+
+BACKFILL_PENDING_SALES = {
+    'mysql': "INSERT IGNORE INTO sales_rollup_pending (name, sale_id) SELECT :name, id FROM sales",
+    'sqlite': "INSERT OR IGNORE INTO sales_rollup_pending (name, sale_id) SELECT :name, id FROM sales",
+}
+
+CREATE_PENDING_SALES_TRIGGER = {
+    'mysql': """
+CREATE TRIGGER sales_rollup_pending_insert AFTER INSERT ON sales FOR EACH ROW
+    INSERT IGNORE INTO sales_rollup_pending (name, sale_id) SELECT name, NEW.id FROM sales_rollup_state
+""",
+    'sqlite': """
+CREATE TRIGGER IF NOT EXISTS sales_rollup_pending_insert AFTER INSERT ON sales
+BEGIN
+    INSERT OR IGNORE INTO sales_rollup_pending (name, sale_id) SELECT name, NEW.id FROM sales_rollup_state;
+END
+""",
+}
+
+SELECT_PENDING_SALE_IDS = "SELECT sale_id FROM sales_rollup_pending WHERE name = :name ORDER BY sale_id"
+
+SELECT_PENDING_SALE_IDS_IN = "SELECT sale_id FROM sales_rollup_pending WHERE name = :name AND sale_id IN :ids"
+
+DELETE_PENDING_SALE_IDS = "DELETE FROM sales_rollup_pending WHERE name = :name AND sale_id IN :ids"
+
+DELETE_PENDING_SALE = "DELETE FROM sales_rollup_pending WHERE name = :name AND sale_id = :sale_id"
+
+CLEAR_PENDING_SALES = "DELETE FROM sales_rollup_pending WHERE name = :name"
+
+PENDING_SALES_FILTER = "id IN (SELECT sale_id FROM sales_rollup_pending WHERE name = :name)"
+
+SELECT_PENDING_SALES_FOR_AGGREGATION = f"SELECT date, quantity, total_amount FROM sales WHERE {PENDING_SALES_FILTER}"
+
+# Totales diarios por producto y por cliente (sql/init/03_create_daily_totals.sql)
+DAILY_TOTAL_TABLES = {
+    'product_id': 'sales_daily_product',
+    'customer_id': 'sales_daily_customer',
+}
+
+
+def build_daily_totals_window(table: str, key: str) -> str:
+    """Construye la suma por clave de los totales diarios de [first_day, last_day] (None = sin límite)."""
+    return f"""
+SELECT {key}, SUM(quantity) AS quantity, SUM(total_amount) AS total_amount,
+       SUM(transactions) AS transactions
+FROM {table}
+WHERE (:first_day IS NULL OR day >= :first_day)
+  AND (:last_day IS NULL OR day <= :last_day)
+GROUP BY {key}
+"""
+
+
+def build_sales_window_remainder(key: str) -> str:
+    """
+    Construye la suma por clave de las ventas de la ventana que los totales
+    diarios no cubren: días incompletos de los extremos y ventas aún
+    pendientes de sumar.
+    """
+    return f"""
+SELECT {key}, SUM(quantity) AS quantity, SUM(total_amount) AS total_amount,
+       COUNT(*) AS transactions
+FROM sales
+WHERE (:start_date IS NULL OR date >= :start_date)
+  AND (:end_date IS NULL OR date <= :end_date)
+  AND ({PENDING_SALES_FILTER} OR date < :first_full OR date >= :after_full)
+GROUP BY {key}
+"""
+
+
+SELECT_PRODUCT_NAMES_BY_IDS = "SELECT id, name, category FROM products WHERE id IN :ids"
+
+SELECT_CUSTOMER_NAMES_BY_IDS = "SELECT id, name, region, segment FROM customers WHERE id IN :ids"
+
+_SQL_OPERATORS = {'=': '=', '!=': '<>', '<': '<', '<=': '<=', '>': '>', '>=': '>='}
+
+
+def build_select(table: str, columns, filters, order_by, limit) -> tuple:
+    """
+    Construye un SELECT con proyección, filtros, orden y límite.
+
+    Los nombres de columna deben venir ya validados contra la lista permitida
+    de la tabla; los valores se pasan siempre como parámetros.
+
+    Returns:
+        (sql, parámetros, nombres de parámetros expandibles para 'in')
+    """
+    conditions = []
+    params = {}
+    expanding = []
+    for position, (column, operator, value) in enumerate(filters):
+        name = f"p{position}"
+        if operator == 'in':
+            conditions.append(f"{column} IN :{name}")
+            params[name] = list(value)
+            expanding.append(name)
+        elif operator == 'between':
+            conditions.append(f"{column} BETWEEN :{name}_low AND :{name}_high")
+            params[f"{name}_low"], params[f"{name}_high"] = value
+        elif value is None and operator in ('=', '!='):
+            conditions.append(f"{column} IS {'NOT ' if operator == '!=' else ''}NULL")
+        else:
+            conditions.append(f"{column} {_SQL_OPERATORS[operator]} :{name}")
+            params[name] = value
+    sql = f"SELECT {', '.join(columns)} FROM {table}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    if order_by:
+        sql += " ORDER BY " + ", ".join(f"{column} {'DESC' if descending else 'ASC'}" for column, descending in order_by)
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params['limit'] = int(limit)
+    return sql, params, expanding
@@ -0,0 +1,164 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from config.settings import settings
+
+
+@dataclass
+class PoolMetrics:
+    """Métricas acumuladas de uso del pool de conexiones."""
+    checkouts: int = 0
+    total_checkout_seconds: float = 0.0
+    max_checkout_seconds: float = 0.0
+    waits: int = 0
+    total_wait_seconds: float = 0.0
+    connects: int = 0
+    invalidations: int = 0
+
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def record_checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_checkout_seconds += seconds
+            self.max_checkout_seconds = max(self.max_checkout_seconds, seconds)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.total_wait_seconds += seconds
+
+    def record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+
+def _instrumented_pool_class(metrics: PoolMetrics) -> type:
+    """
+    Crea una subclase de QueuePool que mide la latencia de cada checkout.
+
+    La espera se mide aparte, solo en la lectura bloqueante de la cola del
+    pool: QueuePool bloquea únicamente cuando el pool y el overflow están
+    agotados (nunca con max_overflow=-1, overflow ilimitado).
+    """
+
+    class InstrumentedQueuePool(QueuePool):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            queue_get = self._pool.get
+
+            def timed_get(block: bool = True, timeout: Optional[float] = None):
+                if not block:
+                    return queue_get(block, timeout)
+                start = time.perf_counter()
+                try:
+                    return queue_get(block, timeout)
+                finally:
+                    metrics.record_wait(time.perf_counter() - start)
+
+            self._pool.get = timed_get
+
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                metrics.record_checkout(time.perf_counter() - start)
+
+    return InstrumentedQueuePool
+
+
+class ConnectionManager:
+    """
+    Gestor del engine compartido con pool de conexiones.
+
+    Todos los repositorios, reportes y procesos ETL del proceso comparten el
+    mismo pool en lugar de abrir conexiones por consulta. Expone métricas de
+    latencia de checkout, tiempo de espera con el pool saturado y conexiones
+    en uso.
+    """
+
+    def __init__(self, url: Optional[str] = None, pool_size: Optional[int] = None,
+                 max_overflow: Optional[int] = None, pool_timeout: Optional[int] = None,
+                 pool_recycle: Optional[int] = None, pool_pre_ping: Optional[bool] = None):
+        self._url = url or settings.database_url
+        self._pool_size = pool_size if pool_size is not None else settings.DB_POOL_SIZE
+        self._max_overflow = max_overflow if max_overflow is not None else settings.DB_MAX_OVERFLOW
+        self._pool_timeout = pool_timeout if pool_timeout is not None else settings.DB_POOL_TIMEOUT
+        self._pool_recycle = pool_recycle if pool_recycle is not None else settings.DB_POOL_RECYCLE
+        self._pool_pre_ping = pool_pre_ping if pool_pre_ping is not None else settings.DB_POOL_PRE_PING
+        self._engine: Optional[Engine] = None
+        self._engine_lock = threading.Lock()
+        self.metrics = PoolMetrics()
+
+    @property
+    def engine(self) -> Engine:
+        """Engine compartido (se crea en el primer uso)."""
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    self._engine = self._create_engine()
+        return self._engine
+
+    def _create_engine(self) -> Engine:
+        engine = create_engine(
+            self._url,
+            poolclass=_instrumented_pool_class(self.metrics),
+            pool_size=self._pool_size,
+            max_overflow=self._max_overflow,
+            pool_timeout=self._pool_timeout,
+            pool_recycle=self._pool_recycle,
+            pool_pre_ping=self._pool_pre_ping,
+        )
+        event.listen(engine, 'connect', lambda *args: self.metrics.record('connects'))
+        event.listen(engine, 'invalidate', lambda *args: self.metrics.record('invalidations'))
+        return engine
+
+    def pool_status(self) -> Dict[str, float]:
+        """Estado actual del pool y métricas acumuladas."""
+        pool = self.engine.pool
+        metrics = self.metrics
+        checkouts = metrics.checkouts or 1
+        return {
+            'pool_size': pool.size(),
+            'in_use': pool.checkedout(),
+            'idle': pool.checkedin(),
+            'overflow': pool.overflow(),
+            'checkouts': metrics.checkouts,
+            'avg_checkout_ms': metrics.total_checkout_seconds / checkouts * 1000,
+            'max_checkout_ms': metrics.max_checkout_seconds * 1000,
+            'waits': metrics.waits,
+            'total_wait_ms': metrics.total_wait_seconds * 1000,
+            'connects': metrics.connects,
+            'invalidations': metrics.invalidations,
+        }
+
+    def dispose(self) -> None:
+        """Cierra todas las conexiones del pool."""
+        if self._engine is not None:
+            self._engine.dispose()
+
+
+_default_manager: Optional[ConnectionManager] = None
+_default_lock = threading.Lock()
+
+
+def get_connection_manager() -> ConnectionManager:
+    """Gestor de conexiones compartido del proceso (configurado desde Settings)."""
+    global _default_manager
+    with _default_lock:
+        if _default_manager is None:
+            _default_manager = ConnectionManager()
+        return _default_manager
+
+
+def get_engine() -> Engine:
+    """Engine compartido del proceso."""
+    return get_connection_manager().engine
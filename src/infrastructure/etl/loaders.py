@@ -0,0 +1,184 @@
+import csv
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from itertools import chain
+from typing import Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from ...domain.entities.money import cents_column, from_cents_columns, to_cents_columns
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.sales_repository import SalesRepository
+
+
+class SalesLoader:
+    """
+    Carga ventas transformadas en el repositorio.
+
+    El DataFrame se convierte a un SaleBatch, con región y categoría
+    codificadas por los diccionarios compartidos de dimensión, y se escribe
+    con save_bulk sin crear entidades por fila.
+    """
+
+    def __init__(self, repository: SalesRepository):
+        self._repository = repository
+
+    def load(self, df: pd.DataFrame) -> int:
+        """Carga un DataFrame de ventas válidas y devuelve el número de filas guardadas."""
+        if df.empty:
+            return 0
+        return self._repository.save_bulk(SaleBatch.from_dataframe(df))
+
+
+@dataclass
+class LoadReport:
+    """Resultado de una carga masiva."""
+    rows: int
+    seconds: float
+    method: str
+    batches: int
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+class BulkSalesLoader:
+    """
+    Escritura masiva de ventas.
+
+    Elige entre LOAD DATA LOCAL INFILE desde un CSV temporal (MySQL con
+    local_infile=True, que requiere connect_args={'local_infile': True} en el
+    engine) e INSERT multi-fila por lotes, que también es el camino usado con
+    SQLite en local. En MySQL desactiva durante la carga las comprobaciones
+    de unicidad (y, si se pide, las de claves foráneas) de la sesión y las
+    restaura al terminar. La carga completa es una sola transacción.
+    """
+
+    COLUMNS = ('date', 'product_id', 'customer_id', 'quantity', 'unit_price', 'total_amount', 'region', 'category')
+    MONEY_COLUMNS = ('unit_price', 'total_amount')
+    SQLITE_MAX_VARIABLES = 32_000
+
+    def __init__(self, engine: Engine, batch_size: int = 5_000, method: str = 'auto',
+                 local_infile: bool = False, skip_foreign_key_checks: bool = False,
+                 table_name: str = 'sales'):
+        if method not in ('auto', 'multi_insert', 'load_data'):
+            raise ValueError(f"Método de carga no soportado: {method}")
+        self._engine = engine
+        self._batch_size = batch_size
+        self._method = method
+        self._local_infile = local_infile
+        self._skip_foreign_key_checks = skip_foreign_key_checks
+        self._table_name = table_name
+
+    @property
+    def _is_mysql(self) -> bool:
+        return self._engine.dialect.name == 'mysql'
+
+    def _resolve_method(self) -> str:
+        if self._method != 'auto':
+            return self._method
+        return 'load_data' if self._is_mysql and self._local_infile else 'multi_insert'
+
+    def _prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normaliza montos a texto decimal exacto y fechas a texto ISO."""
+        pending = [c for c in self.MONEY_COLUMNS if cents_column(c) not in df]
+        df = from_cents_columns(to_cents_columns(df, pending), kind='text')
+        df = df.loc[:, list(self.COLUMNS)].copy()
+        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d %H:%M:%S')
+        return df
+
+    def load(self, df: pd.DataFrame, conn: Optional[Connection] = None) -> LoadReport:
+        """
+        Carga un DataFrame de ventas.
+
+        Args:
+            df: DataFrame con las columnas de la tabla sales (montos en
+                unidades o en centavos)
+            conn: Conexión con una transacción abierta en la que cargar; por
+                defecto la carga abre y confirma su propia transacción
+
+        Returns:
+            LoadReport con filas, duración, método usado y filas por segundo
+        """
+        method = self._resolve_method()
+        start = time.perf_counter()
+        if df.empty:
+            return LoadReport(rows=0, seconds=0.0, method=method, batches=0)
+        prepared = self._prepare(df)
+        if conn is not None:
+            batches = self._load(conn, prepared, method)
+        else:
+            with self._engine.begin() as conn:
+                batches = self._load(conn, prepared, method)
+        return LoadReport(rows=len(prepared), seconds=time.perf_counter() - start, method=method, batches=batches)
+
+    def _load(self, conn: Connection, df: pd.DataFrame, method: str) -> int:
+        restore = self._relax_checks(conn)
+        try:
+            if method == 'load_data':
+                return self._load_data(conn, df)
+            return self._multi_insert(conn, df)
+        finally:
+            self._restore_checks(conn, restore)
+
+    def _rows_per_statement(self) -> int:
+        if self._engine.dialect.name == 'sqlite':
+            return max(1, min(self._batch_size, self.SQLITE_MAX_VARIABLES // len(self.COLUMNS)))
+        return self._batch_size
+
+    def _insert_statement(self, rows: int) -> str:
+        """INSERT con `rows` tuplas VALUES en el estilo de parámetros del driver."""
+        placeholder = '?' if self._engine.dialect.paramstyle == 'qmark' else '%s'
+        row = '(' + ', '.join([placeholder] * len(self.COLUMNS)) + ')'
+        return (f"INSERT INTO {self._table_name} ({', '.join(self.COLUMNS)}) VALUES "
+                + ', '.join([row] * rows))
+
+    def _multi_insert(self, conn: Connection, df: pd.DataFrame) -> int:
+        # Se construye el SQL directamente: compilar un insert().values() de
+        # miles de filas con SQLAlchemy cuesta más que la propia escritura.
+        rows_per_statement = self._rows_per_statement()
+        records = df.astype(object).where(df.notna(), None)
+        statements = {}
+        batches = 0
+        for start in range(0, len(records), rows_per_statement):
+            chunk = list(records.iloc[start:start + rows_per_statement].itertuples(index=False, name=None))
+            if len(chunk) not in statements:
+                statements[len(chunk)] = self._insert_statement(len(chunk))
+            conn.exec_driver_sql(statements[len(chunk)], tuple(chain.from_iterable(chunk)))
+            batches += 1
+        return batches
+
+    def _load_data(self, conn: Connection, df: pd.DataFrame) -> int:
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        try:
+            with os.fdopen(handle, 'w', newline='', encoding='utf-8') as stream:
+                df.to_csv(stream, index=False, header=False, na_rep='\\N', quoting=csv.QUOTE_MINIMAL)
+            columns = ', '.join(self.COLUMNS)
+            conn.execute(text(
+                f"LOAD DATA LOCAL INFILE :path INTO TABLE {self._table_name} "
+                "CHARACTER SET utf8mb4 FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                f"LINES TERMINATED BY '\\n' ({columns})"
+            ), {'path': path})
+        finally:
+            os.remove(path)
+        return 1
+
+    def _relax_checks(self, conn: Connection) -> Optional[Tuple[int, int]]:
+        if not self._is_mysql:
+            return None
+        previous = tuple(conn.execute(text("SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks")).one())
+        conn.execute(text("SET SESSION unique_checks = 0"))
+        if self._skip_foreign_key_checks:
+            conn.execute(text("SET SESSION foreign_key_checks = 0"))
+        return previous
+
+    def _restore_checks(self, conn: Connection, previous: Optional[Tuple[int, int]]) -> None:
+        if previous is None:
+            return
+        conn.execute(text("SET SESSION unique_checks = :unique_checks, foreign_key_checks = :foreign_key_checks"),
+                     {'unique_checks': int(previous[0]), 'foreign_key_checks': int(previous[1])})
@@ -0,0 +1,74 @@
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from ...domain.entities.validation_rules import (
+    CUSTOMER_VALIDATOR,
+    PRODUCT_VALIDATOR,
+    SALE_VALIDATOR,
+    EntityValidator,
+    ValidationResult,
+)
+
+
+class DataFrameTransformer:
+    """
+    Transformador base de la etapa ETL.
+
+    Normaliza tipos y texto y luego valida todas las filas con las reglas de
+    negocio vectorizadas de la entidad, sin construir un objeto por fila.
+    """
+
+    validator: EntityValidator
+    TEXT_COLUMNS: Tuple[str, ...] = ()
+    DATE_COLUMNS: Tuple[str, ...] = ()
+    INTEGER_COLUMNS: Tuple[str, ...] = ()
+
+    def __init__(self, validator: Optional[EntityValidator] = None):
+        self._validator = validator or self.validator
+
+    def normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Recorta espacios en columnas de texto y convierte fechas y enteros."""
+        df = df.copy()
+        for column in self.TEXT_COLUMNS:
+            if column in df:
+                df[column] = df[column].where(df[column].isna(), df[column].astype(str).str.strip())
+        for column in self.DATE_COLUMNS:
+            if column in df:
+                df[column] = pd.to_datetime(df[column], errors='coerce')
+        for column in self.INTEGER_COLUMNS:
+            if column in df:
+                df[column] = pd.to_numeric(df[column], errors='coerce')
+        return df
+
+    def transform(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, ValidationResult]:
+        """
+        Normaliza y valida un DataFrame.
+
+        Returns:
+            Tuple (filas válidas, filas rechazadas con failed_rules, resultado
+            con el resumen de rechazos por regla)
+        """
+        return self._validator.split(self.normalize(df))
+
+
+class SalesTransformer(DataFrameTransformer):
+    """Transformador de ventas."""
+    validator = SALE_VALIDATOR
+    TEXT_COLUMNS = ('region', 'category')
+    DATE_COLUMNS = ('date',)
+    INTEGER_COLUMNS = ('product_id', 'customer_id', 'quantity')
+
+
+class ProductTransformer(DataFrameTransformer):
+    """Transformador de productos."""
+    validator = PRODUCT_VALIDATOR
+    TEXT_COLUMNS = ('name', 'category')
+    INTEGER_COLUMNS = ('stock',)
+
+
+class CustomerTransformer(DataFrameTransformer):
+    """Transformador de clientes."""
+    validator = CUSTOMER_VALIDATOR
+    TEXT_COLUMNS = ('name', 'email', 'phone', 'region', 'segment')
+    DATE_COLUMNS = ('registration_date',)
@@ -0,0 +1,44 @@
+import os
+from typing import Optional
+
+import pandas as pd
+
+from config.settings import settings
+from ...domain.entities.money import from_cents_columns
+
+
+class PowerBIExportService:
+    """
+    Exporta DataFrames a archivos consumibles por Power BI.
+
+    Las columnas monetarias en centavos (<columna>_cents) se convierten de
+    forma exacta a su nombre original al exportar: como texto decimal en CSV
+    y como Decimal (decimal128) en Parquet.
+    """
+
+    FORMATS = ('csv', 'parquet')
+
+    def __init__(self, export_path: Optional[str] = None):
+        self._export_path = export_path or settings.POWERBI_EXPORT_PATH
+
+    def export(self, df: pd.DataFrame, name: str, file_format: str = 'csv') -> str:
+        """
+        Exporta un DataFrame.
+
+        Args:
+            df: DataFrame a exportar
+            name: Nombre del archivo (sin extensión)
+            file_format: 'csv' o 'parquet'
+
+        Returns:
+            Ruta del archivo generado
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Formato de exportación no soportado: {file_format}")
+        os.makedirs(self._export_path, exist_ok=True)
+        path = os.path.join(self._export_path, f"{name}.{file_format}")
+        if file_format == 'csv':
+            from_cents_columns(df, kind='text').to_csv(path, index=False)
+        else:
+            from_cents_columns(df, kind='decimal').to_parquet(path, index=False)
+        return path
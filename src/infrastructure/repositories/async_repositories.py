@@ -0,0 +1,340 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from config.settings import settings
+from ...domain.entities.customer import Customer
+from ...domain.entities.product import Product
+from ...domain.entities.sale import Sale
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.async_customer_repository import AsyncCustomerRepository
+from ...domain.repositories.async_product_repository import AsyncProductRepository
+from ...domain.repositories.async_sales_repository import AsyncSalesRepository
+from ...domain.repositories.customer_repository import CustomerRepository
+from ...domain.repositories.pagination import Page
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.query_spec import Filters
+from ...domain.repositories.sales_repository import SalesRepository
+
+_END = object()
+
+
+class AsyncExecutor:
+    """
+    Pool de hilos compartido para ejecutar repositorios síncronos desde asyncio.
+
+    Por defecto tiene tantos hilos como conexiones puede entregar el pool del
+    engine (DB_POOL_SIZE + DB_MAX_OVERFLOW), de modo que las consultas
+    lanzadas con asyncio.gather se ejecutan en paralelo sin esperar por
+    conexiones; el resto quedan en cola sin bloquear el event loop.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = max(settings.DB_POOL_SIZE, 1) + max(settings.DB_MAX_OVERFLOW, 0)
+        if max_workers <= 0:
+            raise ValueError("El número de hilos debe ser mayor que cero.")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='async-repository')
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Ejecuta una llamada síncrona en el pool y espera su resultado.
+
+        La llamada se ejecuta en una copia del contexto de la tarea, de modo
+        que ve sus ContextVar (por ejemplo, el mapa de unit_of_work).
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, context.run, functools.partial(function, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        """
+        Recorre un iterador síncrono pidiendo cada elemento en el pool.
+
+        Si la iteración se abandona antes de terminar, cierra el generador
+        (y con él el cursor del servidor) en el pool.
+        """
+        try:
+            while True:
+                item = await self.run(next, iterator, _END)
+                if item is _END:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close is not None:
+                await self.run(close)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Detiene los hilos del pool."""
+        self._executor.shutdown(wait=wait)
+
+
+_default_executor: Optional[AsyncExecutor] = None
+_default_lock = threading.Lock()
+
+
+def get_async_executor() -> AsyncExecutor:
+    """Pool de hilos compartido del proceso para los repositorios asíncronos."""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = AsyncExecutor()
+        return _default_executor
+
+
+class AsyncRepositoryAdapter:
+    """
+    Base de los repositorios asíncronos sobre una implementación síncrona.
+
+    Cada llamada se ejecuta en el AsyncExecutor compartido y usa el engine
+    (y el pool de conexiones) del repositorio envuelto, por lo que sirve para
+    cualquier implementación: SQL sobre MySQL o SQLite, Parquet o memoria.
+    """
+
+    def __init__(self, repository: Any, executor: Optional[AsyncExecutor] = None):
+        self._repository = repository
+        self._executor = executor if executor is not None else get_async_executor()
+
+    @property
+    def repository(self) -> Any:
+        """Repositorio síncrono envuelto."""
+        return self._repository
+
+    async def _run(self, method: str, *args) -> Any:
+        return await self._executor.run(getattr(self._repository, method), *args)
+
+    def _iterate(self, method: str, *args) -> AsyncIterator[pd.DataFrame]:
+        return self._executor.iterate(getattr(self._repository, method)(*args))
+
+
+class AsyncSalesRepositoryAdapter(AsyncRepositoryAdapter, AsyncSalesRepository):
+    """Repositorio de ventas asíncrono sobre un SalesRepository síncrono."""
+
+    def __init__(self, repository: SalesRepository, executor: Optional[AsyncExecutor] = None):
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas."""
+        return await self._run('get_all')
+
+    async def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        return await self._run('get_by_id', sale_id)
+
+    async def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs."""
+        return await self._run('get_many', sale_ids)
+
+    async def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas."""
+        return await self._run('get_by_date_range', start_date, end_date)
+
+    async def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                                     cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id)."""
+        return await self._run('get_page_by_date_range', start_date, end_date, page_size, cursor)
+
+    async def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región."""
+        return await self._run('get_by_region', region)
+
+    async def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto."""
+        return await self._run('get_by_category', category)
+
+    async def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta."""
+        return await self._run('save', sale)
+
+    async def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas."""
+        return await self._run('save_bulk', sales)
+
+    async def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID."""
+        return await self._run('delete', sale_id)
+
+    async def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """Guarda un DataFrame de ventas."""
+        return await self._run('save_dataframe', df, if_exists)
+
+    async def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """Obtiene ventas agregadas por período (diario, mensual, anual)."""
+        return await self._run('get_aggregated_by_period', period)
+
+    async def get_top_products(self, limit: int = 10, start_date: datetime = None,
+                               end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos."""
+        return await self._run('get_top_products', limit, start_date, end_date)
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de chunk_size filas."""
+        return self._iterate('iter_all', chunk_size)
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime,
+                           chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de chunk_size filas."""
+        return self._iterate('iter_by_date_range', start_date, end_date, chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de chunk_size filas."""
+        return self._iterate('iter_by_region', region, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de chunk_size filas."""
+        return self._iterate('iter_by_category', category, chunk_size)
+
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite."""
+        return await self._run('query', columns, filters, order_by, limit)
+
+
+class AsyncProductRepositoryAdapter(AsyncRepositoryAdapter, AsyncProductRepository):
+    """Repositorio de productos asíncrono sobre un ProductRepository síncrono."""
+
+    def __init__(self, repository: ProductRepository, executor: Optional[AsyncExecutor] = None):
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los productos."""
+        return await self._run('get_all')
+
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        """Obtiene un producto por su ID."""
+        return await self._run('get_by_id', product_id)
+
+    async def get_many(self, product_ids: List[int]) -> List[Product]:
+        """Obtiene varios productos por sus IDs."""
+        return await self._run('get_many', product_ids)
+
+    async def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene productos por categoría."""
+        return await self._run('get_by_category', category)
+
+    async def get_low_stock(self, threshold: int = 10) -> pd.DataFrame:
+        """Obtiene productos con stock bajo."""
+        return await self._run('get_low_stock', threshold)
+
+    async def save(self, product: Product) -> Product:
+        """Guarda un nuevo producto."""
+        return await self._run('save', product)
+
+    async def update_stock(self, product_id: int, quantity: int) -> bool:
+        """Actualiza el stock de un producto."""
+        return await self._run('update_stock', product_id, quantity)
+
+    async def update_stock_bulk(self, deltas: Union[Mapping[int, int], Iterable[Tuple[int, int]]],
+                                batch_size: int = 1_000, atomic: bool = False,
+                                rejected: Optional[List[int]] = None) -> int:
+        """Aplica variaciones de stock a muchos productos por lotes."""
+        return await self._run('update_stock_bulk', deltas, batch_size, atomic, rejected)
+
+    async def delete(self, product_id: int) -> bool:
+        """Elimina un producto por su ID."""
+        return await self._run('delete', product_id)
+
+    async def get_products_with_margin(self) -> pd.DataFrame:
+        """Obtiene productos con su margen de beneficio calculado."""
+        return await self._run('get_products_with_margin')
+
+    async def get_best_sellers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los productos más vendidos."""
+        return await self._run('get_best_sellers', limit)
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera todos los productos en bloques de chunk_size filas."""
+        return self._iterate('iter_all', chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera los productos de una categoría en bloques de chunk_size filas."""
+        return self._iterate('iter_by_category', category, chunk_size)
+
+    def iter_low_stock(self, threshold: int = 10, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera los productos con stock bajo en bloques de chunk_size filas."""
+        return self._iterate('iter_low_stock', threshold, chunk_size)
+
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite."""
+        return await self._run('query', columns, filters, order_by, limit)
+
+
+class AsyncCustomerRepositoryAdapter(AsyncRepositoryAdapter, AsyncCustomerRepository):
+    """Repositorio de clientes asíncrono sobre un CustomerRepository síncrono."""
+
+    def __init__(self, repository: CustomerRepository, executor: Optional[AsyncExecutor] = None):
+        super().__init__(repository, executor)
+
+    async def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los clientes."""
+        return await self._run('get_all')
+
+    async def get_by_id(self, customer_id: int) -> Optional[Customer]:
+        """Obtiene un cliente por su ID."""
+        return await self._run('get_by_id', customer_id)
+
+    async def get_many(self, customer_ids: List[int]) -> List[Customer]:
+        """Obtiene varios clientes por sus IDs."""
+        return await self._run('get_many', customer_ids)
+
+    async def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene clientes por región."""
+        return await self._run('get_by_region', region)
+
+    async def get_by_segment(self, segment: str) -> pd.DataFrame:
+        """Obtiene clientes por segmento."""
+        return await self._run('get_by_segment', segment)
+
+    async def save(self, customer: Customer) -> Customer:
+        """Guarda un nuevo cliente."""
+        return await self._run('save', customer)
+
+    async def update_segment(self, customer_id: int, segment: str) -> bool:
+        """Actualiza el segmento de un cliente."""
+        return await self._run('update_segment', customer_id, segment)
+
+    async def update_segments_bulk(self, segments: Union[Mapping[int, Optional[str]], pd.DataFrame],
+                                   batch_size: int = 10_000) -> int:
+        """Actualiza el segmento de muchos clientes por lotes."""
+        return await self._run('update_segments_bulk', segments, batch_size)
+
+    async def delete(self, customer_id: int) -> bool:
+        """Elimina un cliente por su ID."""
+        return await self._run('delete', customer_id)
+
+    async def get_customers_with_purchases(self) -> pd.DataFrame:
+        """Obtiene clientes con su historial de compras."""
+        return await self._run('get_customers_with_purchases')
+
+    async def get_top_customers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los clientes con más compras."""
+        return await self._run('get_top_customers', limit)
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera todos los clientes en bloques de chunk_size filas."""
+        return self._iterate('iter_all', chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera los clientes de una región en bloques de chunk_size filas."""
+        return self._iterate('iter_by_region', region, chunk_size)
+
+    def iter_by_segment(self, segment: str, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera los clientes de un segmento en bloques de chunk_size filas."""
+        return self._iterate('iter_by_segment', segment, chunk_size)
+
+    def iter_customers_with_purchases(self, chunk_size: Optional[int] = None) -> AsyncIterator[pd.DataFrame]:
+        """Itera los clientes con su historial de compras en bloques de chunk_size filas."""
+        return self._iterate('iter_customers_with_purchases', chunk_size)
+
+    async def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+                    order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite."""
+        return await self._run('query', columns, filters, order_by, limit)
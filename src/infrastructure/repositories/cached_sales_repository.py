@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from ...domain.entities.sale import Sale
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.pagination import Page
+from ...domain.repositories.query_spec import Filters
+from ...domain.repositories.sales_repository import SalesRepository
+from .parquet_sales_repository import ParquetSalesRepository
+from .query_cache import QueryCache
+from .sales_repository_impl import PurgeReport
+
+
+class CachedSalesRepository(SalesRepository):
+    """
+    Repositorio de ventas con caché de lectura (read-through) sobre otra implementación.
+
+    Las lecturas que devuelven DataFrames se guardan en la caché con clave
+    método + argumentos; save, save_bulk, save_dataframe, delete y
+    purge_before invalidan
+    la caché completa, ya que cualquier escritura puede afectar a cualquier
+    agregado. Las lecturas por id, paginadas, iterativas y query no se
+    cachean.
+    """
+
+    NAMESPACE = 'sales'
+
+    def __init__(self, repository: SalesRepository, cache: Optional[QueryCache] = None):
+        self._repository = repository
+        self.cache = cache if cache is not None else QueryCache()
+
+    def _cached(self, method: str, loader: Callable[..., Any], *args) -> Any:
+        key = (self.NAMESPACE, method, args)
+        found, value = self.cache.get(key)
+        if found:
+            return value
+        generation = self.cache.generation
+        value = loader(*args)
+        self.cache.put(key, value, generation)
+        return value
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas."""
+        return self._cached('get_all', self._repository.get_all)
+
+    def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        return self._repository.get_by_id(sale_id)
+
+    def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs."""
+        return self._repository.get_many(sale_ids)
+
+    def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas."""
+        return self._cached('get_by_date_range', self._repository.get_by_date_range, start_date, end_date)
+
+    def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                               cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id)."""
+        return self._repository.get_page_by_date_range(start_date, end_date, page_size, cursor)
+
+    def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región."""
+        return self._cached('get_by_region', self._repository.get_by_region, region)
+
+    def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto."""
+        return self._cached('get_by_category', self._repository.get_by_category, category)
+
+    def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta e invalida la caché."""
+        try:
+            return self._repository.save(sale)
+        finally:
+            self.cache.invalidate()
+
+    def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas e invalida la caché."""
+        try:
+            return self._repository.save_bulk(sales)
+        finally:
+            self.cache.invalidate()
+
+    def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID e invalida la caché."""
+        try:
+            return self._repository.delete(sale_id)
+        finally:
+            self.cache.invalidate()
+
+    def purge_before(self, cutoff: datetime, archive: Union[str, ParquetSalesRepository, None] = 'table',
+                     batch_size: int = 5_000, pause_seconds: float = 0.0,
+                     max_batches: Optional[int] = None) -> PurgeReport:
+        """Elimina las ventas anteriores a cutoff (ver SQLSalesRepository.purge_before) e invalida la caché."""
+        try:
+            return self._repository.purge_before(cutoff, archive, batch_size, pause_seconds, max_batches)
+        finally:
+            self.cache.invalidate()
+
+    def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """Guarda un DataFrame de ventas e invalida la caché."""
+        try:
+            return self._repository.save_dataframe(df, if_exists)
+        finally:
+            self.cache.invalidate()
+
+    def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """Obtiene ventas agregadas por período (diario, mensual, anual)."""
+        return self._cached('get_aggregated_by_period', self._repository.get_aggregated_by_period, period)
+
+    def get_top_products(self, limit: int = 10, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos."""
+        return self._cached('get_top_products', self._repository.get_top_products, limit, start_date, end_date)
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de chunk_size filas."""
+        return self._repository.iter_all(chunk_size)
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de chunk_size filas."""
+        return self._repository.iter_by_date_range(start_date, end_date, chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de chunk_size filas."""
+        return self._repository.iter_by_region(region, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de chunk_size filas."""
+        return self._repository.iter_by_category(category, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite."""
+        return self._repository.query(columns, filters, order_by, limit)
@@ -0,0 +1,157 @@
+from typing import Iterator, List, Mapping, Optional, Sequence, Union
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from ...domain.entities.customer import Customer
+from ...domain.repositories.customer_repository import CustomerRepository
+from ...domain.repositories.query_spec import Filters
+from ..database import queries
+from ..database.arrow_reader import ArrowReader
+from .identity_map import IdentityMap
+from .sql_repository import SQLRepository
+from .top_k import TopKEngine
+
+
+class SQLCustomerRepository(SQLRepository, CustomerRepository):
+    """Implementación del repositorio de clientes sobre SQLAlchemy (MySQL)."""
+
+    TABLE = 'customers'
+    QUERY_COLUMNS = tuple(queries.CUSTOMER_COLUMNS.split(', '))
+    MONEY_COLUMNS = ('total_spent',)
+
+    def __init__(self, engine: Optional[Engine] = None, money_as_cents: bool = False, categorical_dimensions: bool = True,
+                 identity_map: Optional[IdentityMap] = None, top_k: Optional[TopKEngine] = None,
+                 arrow_reader: Optional[ArrowReader] = None,
+                 typed_reads: Optional[bool] = None):
+        super().__init__(engine, money_as_cents, categorical_dimensions, identity_map, arrow_reader, typed_reads)
+        self._top_k = top_k
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los clientes."""
+        return self._read(queries.SELECT_ALL_CUSTOMERS)
+
+    def get_by_id(self, customer_id: int) -> Optional[Customer]:
+        """Obtiene un cliente por su ID."""
+        return self._get_one(queries.SELECT_CUSTOMER_BY_ID, {'customer_id': customer_id},
+                             Customer, customer_id, Customer.from_tuple)
+
+    def get_many(self, customer_ids: List[int]) -> List[Customer]:
+        """Obtiene varios clientes por sus IDs con consultas IN por bloques."""
+        return self._get_many(queries.SELECT_CUSTOMERS_BY_IDS, Customer, customer_ids, Customer.from_tuple)
+
+    def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene clientes por región."""
+        return self._read(queries.SELECT_CUSTOMERS_BY_REGION, {'region': region})
+
+    def get_by_segment(self, segment: str) -> pd.DataFrame:
+        """Obtiene clientes por segmento."""
+        return self._read(queries.SELECT_CUSTOMERS_BY_SEGMENT, {'segment': segment})
+
+    def save(self, customer: Customer) -> Customer:
+        """Guarda un nuevo cliente."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.INSERT_CUSTOMER), {
+                'name': customer.name,
+                'email': customer.email,
+                'phone': customer.phone,
+                'region': customer.region,
+                'registration_date': customer.registration_date,
+                'segment': customer.segment,
+            })
+        customer.id = result.lastrowid
+        self._remember(customer)
+        return customer
+
+    def update_segment(self, customer_id: int, segment: str) -> bool:
+        """Actualiza el segmento de un cliente."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.UPDATE_CUSTOMER_SEGMENT),
+                                  {'customer_id': customer_id, 'segment': segment})
+        self._forget(Customer, customer_id)
+        return result.rowcount > 0
+
+    def update_segments_bulk(self, segments: Union[Mapping[int, Optional[str]], pd.DataFrame],
+                             batch_size: int = 10_000) -> int:
+        """
+        Actualiza el segmento de muchos clientes por lotes.
+
+        Cada lote (ordenado por id) se carga en una tabla temporal de la
+        conexión y se aplica con un único UPDATE con JOIN que omite los
+        clientes cuyo segmento no cambia; cada lote es una transacción, de
+        modo que los bloqueos se liberan entre lotes. Si hay ids repetidos
+        prevalece el último.
+
+        Returns:
+            Número de clientes cuyo segmento cambió
+        """
+        if batch_size <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor que cero.")
+        dialect = self._engine.dialect.name
+        if dialect not in queries.APPLY_SEGMENT_STAGING:
+            raise ValueError(f"Dialecto no soportado para la actualización masiva de segmentos: {dialect}")
+        if isinstance(segments, pd.DataFrame):
+            id_column = 'customer_id' if 'customer_id' in segments else 'id'
+            pairs = zip(segments[id_column].tolist(), segments['segment'].tolist())
+        else:
+            pairs = segments.items()
+        latest = {int(customer_id): (None if pd.isna(segment) else str(segment)) for customer_id, segment in pairs}
+        if not latest:
+            return 0
+        rows = [{'customer_id': customer_id, 'segment': latest[customer_id]} for customer_id in sorted(latest)]
+        changed = 0
+        with self._engine.connect() as conn:
+            conn.execute(text(queries.CREATE_SEGMENT_STAGING))
+            conn.commit()
+            try:
+                for start in range(0, len(rows), batch_size):
+                    with conn.begin():
+                        conn.execute(text(queries.CLEAR_SEGMENT_STAGING))
+                        conn.execute(text(queries.INSERT_SEGMENT_STAGING), rows[start:start + batch_size])
+                        changed += conn.execute(text(queries.APPLY_SEGMENT_STAGING[dialect])).rowcount
+            finally:
+                with conn.begin():
+                    conn.execute(text(queries.DROP_SEGMENT_STAGING[dialect]))
+                for customer_id in latest:
+                    self._forget(Customer, customer_id)
+        return changed
+
+    def delete(self, customer_id: int) -> bool:
+        """Elimina un cliente por su ID."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.DELETE_CUSTOMER), {'customer_id': customer_id})
+        self._forget(Customer, customer_id)
+        return result.rowcount > 0
+
+    def get_customers_with_purchases(self) -> pd.DataFrame:
+        """Obtiene clientes con su historial de compras."""
+        return self._read(queries.SELECT_CUSTOMERS_WITH_PURCHASES)
+
+    def get_top_customers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los clientes con más compras (con TopKEngine, desde los totales diarios)."""
+        if self._top_k is not None:
+            top = self._top_k.top_customers(limit).rename(columns={'transactions': 'purchases', 'total_revenue': 'total_spent'})
+            return self._finish_frame(top[['customer_id', 'name', 'region', 'segment', 'purchases', 'total_spent']])
+        return self._read(queries.SELECT_TOP_CUSTOMERS, {'limit': limit})
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todos los clientes en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_ALL_CUSTOMERS, {}, chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes de una región en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_CUSTOMERS_BY_REGION, {'region': region}, chunk_size)
+
+    def iter_by_segment(self, segment: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes de un segmento en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_CUSTOMERS_BY_SEGMENT, {'segment': segment}, chunk_size)
+
+    def iter_customers_with_purchases(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los clientes con su historial de compras en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_CUSTOMERS_WITH_PURCHASES, {}, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite compilados a un único SELECT."""
+        return self._query(columns, filters, order_by, limit)
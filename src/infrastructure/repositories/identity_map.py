@@ -0,0 +1,57 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class IdentityMap:
+    """
+    Mapa de identidad para una unidad de trabajo.
+
+    Garantiza una única instancia por (tipo de entidad, id) mientras dura la
+    unidad de trabajo, de modo que las búsquedas repetidas del mismo producto
+    o cliente no vuelven a consultar la base de datos.
+    """
+
+    def __init__(self):
+        self._entities: Dict[Tuple[type, int], Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __enter__(self) -> 'IdentityMap':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.clear()
+
+    def get(self, entity_type: type, entity_id: int) -> Optional[Any]:
+        """Devuelve la entidad registrada o None."""
+        entity = self._entities.get((entity_type, entity_id))
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entity
+
+    def peek(self, entity_type: type, entity_id: int) -> Optional[Any]:
+        """Como get, pero sin contar aciertos ni fallos."""
+        return self._entities.get((entity_type, entity_id))
+
+    def add(self, entity: Any) -> Any:
+        """Registra una entidad; si ya existía devuelve la instancia registrada."""
+        return self._entities.setdefault((type(entity), entity.id), entity)
+
+    def missing(self, entity_type: type, ids: Iterable[int]) -> List[int]:
+        """Devuelve los ids que no están registrados."""
+        ids = list(ids)
+        missing = [entity_id for entity_id in ids if (entity_type, entity_id) not in self._entities]
+        self.hits += len(ids) - len(missing)
+        self.misses += len(missing)
+        return missing
+
+    def evict(self, entity_type: type, entity_id: int) -> None:
+        """Elimina una entidad del mapa (tras modificarla o borrarla)."""
+        self._entities.pop((entity_type, entity_id), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
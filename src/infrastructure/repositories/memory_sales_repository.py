@@ -0,0 +1,453 @@
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ...domain.entities.dimension import CATEGORY, REGION, get_dimension
+from ...domain.entities.money import cents_column, cents_to_decimal, cents_to_float, from_cents, to_cents
+from ...domain.entities.sale import Sale
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.pagination import Page, decode_cursor, encode_cursor
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.query_spec import Filters, apply_query, normalize_filters, parse_order_by, validate_columns
+from ...domain.repositories.sales_repository import SalesRepository
+from ..database import queries
+
+SALE_COLUMNS = tuple(queries.SALES_COLUMNS.split(', '))
+MONEY_COLUMNS = ('unit_price', 'total_amount')
+
+_COLUMNS = {
+    'id': np.int64,
+    'date': 'datetime64[ns]',
+    'product_id': np.int64,
+    'customer_id': np.int64,
+    'quantity': np.int64,
+    'unit_price_cents': np.int64,
+    'total_amount_cents': np.int64,
+    'region_codes': np.int32,
+    'category_codes': np.int32,
+}
+
+
+def _timestamp(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value).to_datetime64(), 'ns')
+
+
+def _storage_value(column: str, value):
+    if value is None:
+        return None
+    if column in MONEY_COLUMNS:
+        return to_cents(value)
+    if column == 'date':
+        return pd.Timestamp(value)
+    return value
+
+
+def _storage_filter_value(column: str, operator: str, value):
+    if operator in ('in', 'between'):
+        return [_storage_value(column, item) for item in value]
+    return _storage_value(column, value)
+
+
+class InMemorySalesRepository(SalesRepository):
+    """
+    Repositorio de ventas en memoria con almacenamiento columnar ordenado por (date, id).
+
+    Las columnas son arrays de NumPy con capacidad de reserva, de modo que
+    añadir ventas posteriores a la última fecha no copia lo existente; las
+    ventas fuera de orden se intercalan con searchsorted. get_by_date_range es
+    una búsqueda binaria más un corte: el DataFrame devuelto usa vistas de
+    solo lectura sobre los arrays (sin copia, salvo los montos en Decimal si
+    money_as_cents=False). Región y categoría tienen índices hash (código ->
+    posiciones) que se reconstruyen tras cada escritura.
+    """
+
+    STREAM_CHUNK_SIZE = 50_000
+
+    def __init__(self, money_as_cents: bool = False, categorical_dimensions: bool = True,
+                 products: Optional[ProductRepository] = None):
+        self._money_as_cents = money_as_cents
+        self._categorical_dimensions = categorical_dimensions
+        self._products = products
+        self._columns: Dict[str, np.ndarray] = {name: np.empty(0, dtype=dtype) for name, dtype in _COLUMNS.items()}
+        self._size = 0
+        self._next_id = 1
+        self._lock = threading.RLock()
+        self._indexes: Dict[str, Dict[int, np.ndarray]] = {}
+        self._id_order: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _view(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        view = self._columns[name][start:self._size if stop is None else stop]
+        view.flags.writeable = False
+        return view
+
+    def _storage(self, start: int = 0, stop: Optional[int] = None,
+                 positions: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """Columnas de un corte [start, stop) (vistas) o de posiciones concretas (copia)."""
+        if positions is not None:
+            return {name: column[:self._size][positions] for name, column in self._columns.items()}
+        return {name: self._view(name, start, stop) for name in self._columns}
+
+    def _dimension(self, name: str, codes: np.ndarray):
+        dictionary = get_dimension(name)
+        if self._categorical_dimensions:
+            return pd.Categorical.from_codes(codes, categories=list(dictionary.values))
+        return dictionary.decode(codes)
+
+    def _finish(self, storage: Dict[str, np.ndarray], columns: Sequence[str] = SALE_COLUMNS) -> pd.DataFrame:
+        """Convierte columnas de almacenamiento a las columnas públicas pedidas."""
+        result = {}
+        for column in columns:
+            if column in MONEY_COLUMNS:
+                cents = storage[cents_column(column)]
+                if self._money_as_cents:
+                    result[cents_column(column)] = cents
+                else:
+                    result[column] = cents_to_decimal(pd.Series(cents, copy=False)).to_numpy()
+            elif column in (REGION, CATEGORY):
+                result[column] = self._dimension(column, storage[f'{column}_codes'])
+            else:
+                result[column] = storage[column]
+        return pd.DataFrame(result, columns=list(result), copy=False)
+
+    def _frame(self, start: int = 0, stop: Optional[int] = None, positions: Optional[np.ndarray] = None) -> pd.DataFrame:
+        return self._finish(self._storage(start, stop, positions))
+
+    def _date_bounds(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> tuple:
+        dates = self._view('date')
+        start = int(np.searchsorted(dates, _timestamp(start_date), side='left')) if start_date is not None else 0
+        stop = int(np.searchsorted(dates, _timestamp(end_date), side='right')) if end_date is not None else self._size
+        return start, max(start, stop)
+
+    def _index(self, name: str) -> Dict[int, np.ndarray]:
+        """Índice hash código -> posiciones (ordenadas) de una columna de dimensión."""
+        index = self._indexes.get(name)
+        if index is None:
+            codes = self._view(name)
+            order = np.argsort(codes, kind='stable')
+            sorted_codes = codes[order]
+            boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+            index = {int(group[0]): positions
+                     for group, positions in zip(np.split(sorted_codes, boundaries), np.split(order, boundaries))
+                     if len(group)}
+            self._indexes[name] = index
+        return index
+
+    def _positions_of(self, sale_ids: Sequence[int]) -> np.ndarray:
+        """Posiciones de los ids pedidos (-1 si no existen), con un índice por id ordenado."""
+        if self._id_order is None:
+            self._id_order = np.argsort(self._view('id'), kind='stable')
+        ids = self._view('id')[self._id_order]
+        wanted = np.asarray(sale_ids, dtype=np.int64)
+        if len(ids) == 0:
+            return np.full(len(wanted), -1, dtype=np.int64)
+        found = np.minimum(np.searchsorted(ids, wanted), len(ids) - 1)
+        return np.where(ids[found] == wanted, self._id_order[found], -1)
+
+    def _invalidate(self) -> None:
+        self._indexes = {}
+        self._id_order = None
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas (vistas sin copia)."""
+        with self._lock:
+            return self._frame()
+
+    def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        sales = self.get_many([sale_id])
+        return sales[0] if sales else None
+
+    def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        ids = list(dict.fromkeys(int(sale_id) for sale_id in sale_ids))
+        with self._lock:
+            positions = self._positions_of(ids)
+            regions = get_dimension(REGION).values
+            categories = get_dimension(CATEGORY).values
+            columns = self._columns
+            sales = []
+            for position in positions[positions >= 0].tolist():
+                region_code = int(columns['region_codes'][position])
+                category_code = int(columns['category_codes'][position])
+                sales.append(Sale.from_tuple((
+                    int(columns['id'][position]),
+                    pd.Timestamp(columns['date'][position]).to_pydatetime(),
+                    int(columns['product_id'][position]),
+                    int(columns['customer_id'][position]),
+                    int(columns['quantity'][position]),
+                    from_cents(columns['unit_price_cents'][position]),
+                    from_cents(columns['total_amount_cents'][position]),
+                    regions[region_code] if region_code >= 0 else None,
+                    categories[category_code] if category_code >= 0 else None,
+                )))
+            return sales
+
+    def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas (búsqueda binaria y corte sin copia)."""
+        with self._lock:
+            return self._frame(*self._date_bounds(start_date, end_date))
+
+    def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                               cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id), continuando desde cursor."""
+        if page_size <= 0:
+            raise ValueError("El tamaño de página debe ser mayor que cero.")
+        with self._lock:
+            start, stop = self._date_bounds(start_date, end_date)
+            if cursor is not None:
+                after_date, after_id = decode_cursor(cursor)
+                dates = self._view('date')
+                low = int(np.searchsorted(dates, _timestamp(after_date), side='left'))
+                high = int(np.searchsorted(dates, _timestamp(after_date), side='right'))
+                after = low + int(np.searchsorted(self._view('id', low, high), after_id, side='right'))
+                start = min(max(start, after), stop)
+            end = min(start + page_size, stop)
+            df = self._frame(start, end)
+            if end >= stop:
+                return Page(df)
+            last = df.iloc[-1]
+            return Page(df, encode_cursor(last['date'], last['id']))
+
+    def _by_dimension(self, name: str, dimension: str, value: str) -> pd.DataFrame:
+        with self._lock:
+            code = get_dimension(dimension).code_for(value)
+            positions = self._index(name).get(code, np.empty(0, dtype=np.int64))
+            return self._frame(positions=positions)
+
+    def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región (índice hash)."""
+        return self._by_dimension('region_codes', REGION, region)
+
+    def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto (índice hash)."""
+        return self._by_dimension('category_codes', CATEGORY, category)
+
+    def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta."""
+        sale.id = int(self._merge(SaleBatch.from_sales([sale]))[0])
+        return sale
+
+    def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas (lista de entidades o lote columnar SaleBatch)."""
+        if not isinstance(sales, SaleBatch):
+            if not sales:
+                return 0
+            sales = SaleBatch.from_sales(sales)
+        return len(self._merge(sales))
+
+    def _merge(self, batch: SaleBatch) -> np.ndarray:
+        """
+        Incorpora un lote validado manteniendo el orden por (date, id).
+
+        Si todas las fechas nuevas son posteriores a la última almacenada se
+        escriben al final (con crecimiento geométrico de la capacidad); si no,
+        se intercalan en sus posiciones con searchsorted.
+        """
+        count = len(batch)
+        if count == 0:
+            return np.empty(0, dtype=np.int64)
+        order = np.argsort(batch.date, kind='stable')
+        new = {
+            'date': batch.date[order],
+            'product_id': batch.product_id[order],
+            'customer_id': batch.customer_id[order],
+            'quantity': batch.quantity[order],
+            'unit_price_cents': batch.unit_price_cents[order],
+            'total_amount_cents': batch.total_amount_cents[order],
+            'region_codes': batch.region_codes[order],
+            'category_codes': batch.category_codes[order],
+        }
+        with self._lock:
+            ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+            self._next_id += count
+            new['id'] = ids
+            size = self._size
+            if size == 0 or new['date'][0] >= self._columns['date'][size - 1]:
+                self._reserve(size + count)
+                for name, values in new.items():
+                    self._columns[name][size:size + count] = values
+            else:
+                positions = np.searchsorted(self._view('date'), new['date'], side='right')
+                for name, values in new.items():
+                    self._columns[name] = np.insert(self._columns[name][:size], positions, values)
+            self._size = size + count
+            self._invalidate()
+        result = np.empty(count, dtype=np.int64)
+        result[order] = ids
+        return result
+
+    def _reserve(self, capacity: int) -> None:
+        current = len(self._columns['id'])
+        if capacity <= current:
+            return
+        capacity = max(capacity, current * 2, 1024)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID."""
+        with self._lock:
+            position = int(self._positions_of([sale_id])[0])
+            if position < 0:
+                return False
+            for name, column in self._columns.items():
+                self._columns[name] = np.delete(column[:self._size], position)
+            self._size -= 1
+            self._invalidate()
+            return True
+
+    def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """
+        Guarda un DataFrame de ventas (acepta columnas monetarias en centavos).
+
+        if_exists: 'append', 'replace' (vacía el repositorio antes) o 'fail'.
+        """
+        if if_exists not in ('append', 'replace', 'fail'):
+            raise ValueError(f"Modo de escritura no soportado: {if_exists}")
+        if if_exists == 'fail' and self._size:
+            raise ValueError("El repositorio de ventas ya contiene datos.")
+        batch = SaleBatch.from_dataframe(df)
+        if if_exists == 'replace':
+            with self._lock:
+                self._columns = {name: np.empty(0, dtype=dtype) for name, dtype in _COLUMNS.items()}
+                self._size = 0
+                self._invalidate()
+        return len(self._merge(batch))
+
+    def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """Obtiene ventas agregadas por período (diario, mensual, anual)."""
+        with self._lock:
+            df = pd.DataFrame({
+                'date': self._view('date'),
+                'quantity': self._view('quantity'),
+                'total_amount_cents': self._view('total_amount_cents'),
+            }, copy=False)
+        df['period'] = df['date'].dt.to_period(period).dt.start_time
+        result = (df.groupby('period')
+                    .agg(total_amount_cents=('total_amount_cents', 'sum'),
+                         quantity=('quantity', 'sum'),
+                         transactions=('date', 'size'))
+                    .reset_index())
+        if self._money_as_cents:
+            return result
+        result['total_amount_cents'] = cents_to_float(result['total_amount_cents'])
+        return result.rename(columns={'total_amount_cents': 'total_amount'})
+
+    def get_top_products(self, limit: int = 10, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos (nombres desde el repositorio de productos, si se indicó)."""
+        with self._lock:
+            start, stop = self._date_bounds(start_date, end_date)
+            df = pd.DataFrame({
+                'product_id': self._view('product_id', start, stop),
+                'quantity': self._view('quantity', start, stop),
+                'total_amount_cents': self._view('total_amount_cents', start, stop),
+            }, copy=False)
+        top = (df.groupby('product_id')
+                 .agg(total_quantity=('quantity', 'sum'),
+                      total_revenue_cents=('total_amount_cents', 'sum'),
+                      transactions=('quantity', 'size'))
+                 .sort_values('total_revenue_cents', ascending=False, kind='stable')
+                 .head(limit)
+                 .reset_index())
+        names = {}
+        if self._products is not None and len(top):
+            names = {product.id: product.name for product in self._products.get_many(top['product_id'].tolist())}
+        top.insert(1, 'product_name', top['product_id'].map(names))
+        if not self._money_as_cents:
+            top['total_revenue_cents'] = cents_to_decimal(top['total_revenue_cents'])
+            top = top.rename(columns={'total_revenue_cents': 'total_revenue'})
+        return top
+
+    def _iter_range(self, start: int, stop: int, chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        for offset in range(start, stop, chunk_size):
+            # El lock solo cubre la construcción del bloque: quien consume el
+            # generador no bloquea las escrituras mientras procesa cada bloque.
+            with self._lock:
+                frame = self._frame(offset, min(offset + chunk_size, stop))
+            yield frame
+
+    def _iter_positions(self, positions: np.ndarray, chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        for offset in range(0, len(positions), chunk_size):
+            with self._lock:
+                frame = self._frame(positions=positions[offset:offset + chunk_size])
+            yield frame
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de chunk_size filas (vistas)."""
+        with self._lock:
+            stop = self._size
+        return self._iter_range(0, stop, chunk_size)
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de chunk_size filas (vistas)."""
+        with self._lock:
+            start, stop = self._date_bounds(start_date, end_date)
+        return self._iter_range(start, stop, chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de chunk_size filas."""
+        with self._lock:
+            positions = self._index('region_codes').get(get_dimension(REGION).code_for(region), np.empty(0, dtype=np.int64))
+        return self._iter_positions(positions, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de chunk_size filas."""
+        with self._lock:
+            positions = self._index('category_codes').get(get_dimension(CATEGORY).code_for(category), np.empty(0, dtype=np.int64))
+        return self._iter_positions(positions, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Consulta con proyección, filtros, orden y límite.
+
+        Los filtros sobre date acotan primero el corte por búsqueda binaria; el
+        resto se evalúa sobre las columnas almacenadas (montos en centavos).
+        """
+        columns = validate_columns(columns if columns is not None else SALE_COLUMNS, SALE_COLUMNS)
+        filters = [(column, operator, _storage_filter_value(column, operator, value))
+                   for column, operator, value in normalize_filters(filters)]
+        validate_columns([column for column, _, _ in filters], SALE_COLUMNS)
+        validate_columns([column for column, _ in parse_order_by(order_by)], SALE_COLUMNS)
+        if limit is not None and limit < 0:
+            raise ValueError("El límite no puede ser negativo.")
+        start_date = end_date = None
+        for column, operator, value in filters:
+            if column != 'date':
+                continue
+            if operator in ('>', '>=', '=', 'between'):
+                low = value[0] if operator == 'between' else value
+                start_date = low if start_date is None else max(start_date, low)
+            if operator in ('<', '<=', '=', 'between'):
+                high = value[1] if operator == 'between' else value
+                end_date = high if end_date is None else min(end_date, high)
+        with self._lock:
+            storage = self._storage(*self._date_bounds(start_date, end_date))
+            df = pd.DataFrame({
+                'id': storage['id'],
+                'date': storage['date'],
+                'product_id': storage['product_id'],
+                'customer_id': storage['customer_id'],
+                'quantity': storage['quantity'],
+                'unit_price': storage['unit_price_cents'],
+                'total_amount': storage['total_amount_cents'],
+                REGION: get_dimension(REGION).decode(storage['region_codes']),
+                CATEGORY: get_dimension(CATEGORY).decode(storage['category_codes']),
+            }, copy=False)
+        df = apply_query(df, None, filters, order_by, limit)
+        storage = {name: df[name].to_numpy() for name in ('id', 'date', 'product_id', 'customer_id', 'quantity')}
+        for column in MONEY_COLUMNS:
+            storage[cents_column(column)] = df[column].to_numpy(dtype=np.int64)
+        for column in (REGION, CATEGORY):
+            storage[f'{column}_codes'] = get_dimension(column).encode(df[column])
+        return self._finish(storage, columns)
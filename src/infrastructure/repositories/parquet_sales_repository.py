@@ -0,0 +1,454 @@
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from ...domain.entities.dimension import to_categorical_columns
+from ...domain.entities.money import cents_column, cents_to_decimal, cents_to_float, to_cents
+from ...domain.entities.sale import Sale
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.pagination import Page, decode_cursor, encode_cursor
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.query_spec import Filters, normalize_filters, parse_order_by, validate_columns
+from ...domain.repositories.sales_repository import SalesRepository
+from ..database import queries
+
+SALE_COLUMNS = tuple(queries.SALES_COLUMNS.split(', '))
+MONEY_COLUMNS = ('unit_price', 'total_amount')
+
+_STORAGE_FIELDS = [
+    ('id', pa.int64()),
+    ('date', pa.timestamp('us')),
+    ('product_id', pa.int64()),
+    ('customer_id', pa.int64()),
+    ('quantity', pa.int64()),
+    ('unit_price_cents', pa.int64()),
+    ('total_amount_cents', pa.int64()),
+    ('region', pa.string()),
+    ('category', pa.string()),
+]
+_PARTITION_FIELDS = [('year', pa.int16()), ('month', pa.int8())]
+
+
+def _storage_column(column: str) -> str:
+    return cents_column(column) if column in MONEY_COLUMNS else column
+
+
+def _storage_value(column: str, value):
+    if value is None:
+        return None
+    if column in MONEY_COLUMNS:
+        return to_cents(value)
+    if column == 'date':
+        return pd.Timestamp(value).to_pydatetime()
+    return value
+
+
+def _and(*expressions: Optional[ds.Expression]) -> Optional[ds.Expression]:
+    result = None
+    for expression in expressions:
+        if expression is not None:
+            result = expression if result is None else result & expression
+    return result
+
+
+def _month_key(value) -> Tuple[int, int]:
+    timestamp = pd.Timestamp(value)
+    return timestamp.year, timestamp.month
+
+
+class ParquetSalesRepository(SalesRepository):
+    """
+    Repositorio de ventas sobre un dataset Parquet local particionado (estilo Hive).
+
+    Las ventas se guardan particionadas por year/month (y opcionalmente por
+    región), ordenadas por fecha dentro de cada archivo y con los montos en
+    centavos. Las lecturas por rango de fechas descartan particiones por
+    year/month y, dentro de cada archivo, los row groups cuyas estadísticas
+    de fecha no se solapan con el rango. Cada escritura añade archivos a sus
+    particiones; compact los junta. Pensado para análisis sin acceso a
+    MySQL: asume un único proceso escritor por dataset.
+    """
+
+    ROW_GROUP_SIZE = 128_000
+    STREAM_CHUNK_SIZE = 50_000
+
+    def __init__(self, path: str, partition_by_region: bool = False, money_as_cents: bool = False,
+                 categorical_dimensions: bool = True, products: Optional[ProductRepository] = None):
+        self._path = path
+        self._money_as_cents = money_as_cents
+        self._categorical_dimensions = categorical_dimensions
+        self._products = products
+        partition_fields = list(_PARTITION_FIELDS)
+        if partition_by_region:
+            partition_fields.append(('region', pa.string()))
+        self._partitioning = ds.partitioning(pa.schema(partition_fields), flavor='hive')
+        self._schema = pa.schema(_STORAGE_FIELDS + list(_PARTITION_FIELDS))
+        self._write_lock = threading.Lock()
+        self._next_id: Optional[int] = None
+        os.makedirs(path, exist_ok=True)
+
+    def _dataset(self) -> ds.Dataset:
+        return ds.dataset(self._path, schema=self._schema, format='parquet', partitioning=self._partitioning)
+
+    def _scan(self, filter: Optional[ds.Expression] = None, columns: Optional[Sequence[str]] = None) -> pa.Table:
+        return self._dataset().to_table(columns=list(columns) if columns is not None else None, filter=filter)
+
+    def _finish_frame(self, table: pa.Table, columns: Sequence[str] = SALE_COLUMNS) -> pd.DataFrame:
+        """Convierte una tabla de almacenamiento a las columnas públicas pedidas."""
+        df = table.to_pandas()
+        result = {}
+        for column in columns:
+            if column in MONEY_COLUMNS:
+                cents = df[cents_column(column)]
+                if self._money_as_cents:
+                    result[cents_column(column)] = cents.to_numpy(dtype=np.int64)
+                else:
+                    result[column] = cents_to_decimal(cents).to_numpy()
+            else:
+                result[column] = df[column].to_numpy()
+        frame = pd.DataFrame(result, columns=list(result))
+        return to_categorical_columns(frame) if self._categorical_dimensions else frame
+
+    @staticmethod
+    def _month_filter(start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[ds.Expression]:
+        """Filtro sobre year/month que permite descartar particiones completas."""
+        year, month = ds.field('year'), ds.field('month')
+        lower = upper = None
+        if start_date is not None:
+            y0, m0 = _month_key(start_date)
+            lower = (year > y0) | ((year == y0) & (month >= m0))
+        if end_date is not None:
+            y1, m1 = _month_key(end_date)
+            upper = (year < y1) | ((year == y1) & (month <= m1))
+        return _and(lower, upper)
+
+    def _date_filter(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[ds.Expression]:
+        date = ds.field('date')
+        return _and(self._month_filter(start_date, end_date),
+                    date >= _storage_value('date', start_date) if start_date is not None else None,
+                    date <= _storage_value('date', end_date) if end_date is not None else None)
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas."""
+        return self._finish_frame(self._scan())
+
+    def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        sales = self.get_many([sale_id])
+        return sales[0] if sales else None
+
+    def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs (en el orden pedido, omitiendo los inexistentes)."""
+        ids = list(dict.fromkeys(int(sale_id) for sale_id in sale_ids))
+        if not ids:
+            return []
+        table = self._scan(ds.field('id').isin(ids))
+        df = table.to_pandas()
+        found = {}
+        for row in zip(df['id'], df['date'], df['product_id'], df['customer_id'], df['quantity'],
+                       cents_to_decimal(df['unit_price_cents']), cents_to_decimal(df['total_amount_cents']),
+                       df['region'], df['category']):
+            sale = Sale.from_tuple((int(row[0]), row[1].to_pydatetime(), int(row[2]), int(row[3]), int(row[4]),
+                                    row[5], row[6], row[7], row[8]))
+            found[sale.id] = sale
+        return [found[sale_id] for sale_id in ids if sale_id in found]
+
+    def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas (con poda de particiones y row groups)."""
+        table = self._scan(self._date_filter(start_date, end_date))
+        return self._finish_frame(table.sort_by([('date', 'ascending')]))
+
+    def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                               cursor: Optional[str] = None) -> Page:
+        """Obtiene una página de ventas de un rango de fechas ordenadas por (date, id), continuando desde cursor."""
+        if page_size <= 0:
+            raise ValueError("El tamaño de página debe ser mayor que cero.")
+        if cursor is not None:
+            after_date, after_id = decode_cursor(cursor)
+            start_date = max(pd.Timestamp(start_date), pd.Timestamp(after_date)).to_pydatetime()
+            date = ds.field('date')
+            expression = _and(self._date_filter(start_date, end_date),
+                              (date > after_date) | ((date == after_date) & (ds.field('id') > after_id)))
+        else:
+            expression = self._date_filter(start_date, end_date)
+        table = self._scan(expression).sort_by([('date', 'ascending'), ('id', 'ascending')])
+        df = self._finish_frame(table.slice(0, page_size + 1))
+        if len(df) <= page_size:
+            return Page(df)
+        df = df.iloc[:page_size]
+        last = df.iloc[-1]
+        return Page(df, encode_cursor(last['date'], last['id']))
+
+    def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región."""
+        return self._finish_frame(self._scan(ds.field('region') == region))
+
+    def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto."""
+        return self._finish_frame(self._scan(ds.field('category') == category))
+
+    def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta (en un archivo propio; ver compact)."""
+        sale.id = self._append(SaleBatch.from_sales([sale]).to_dataframe())[0]
+        return sale
+
+    def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """Guarda múltiples ventas (lista de entidades o lote columnar SaleBatch)."""
+        if not isinstance(sales, SaleBatch):
+            if not sales:
+                return 0
+            sales = SaleBatch.from_sales(sales)
+        return len(self._append(sales.to_dataframe()))
+
+    def _allocate_ids(self, count: int) -> np.ndarray:
+        if self._next_id is None:
+            ids = self._scan(columns=['id']).column('id')
+            self._next_id = (pc.max(ids).as_py() or 0) + 1 if len(ids) else 1
+        ids = np.arange(self._next_id, self._next_id + count, dtype=np.int64)
+        self._next_id += count
+        return ids
+
+    def _append(self, df: pd.DataFrame, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Escribe ventas validadas (montos en centavos) como archivos nuevos en sus particiones.
+
+        Si se pasan ids se conservan en lugar de asignar nuevos y se omiten
+        las filas cuyo id ya está en el dataset (o repetido en el lote).
+        """
+        if df.empty:
+            return np.empty(0, dtype=np.int64)
+        dates = pd.to_datetime(df['date'])
+        frame = pd.DataFrame({
+            'date': dates.to_numpy(dtype='datetime64[us]'),
+            'product_id': df['product_id'].to_numpy(dtype=np.int64),
+            'customer_id': df['customer_id'].to_numpy(dtype=np.int64),
+            'quantity': df['quantity'].to_numpy(dtype=np.int64),
+            'unit_price_cents': df['unit_price_cents'].to_numpy(dtype=np.int64),
+            'total_amount_cents': df['total_amount_cents'].to_numpy(dtype=np.int64),
+            'region': df['region'].astype(object).to_numpy(),
+            'category': df['category'].astype(object).to_numpy(),
+            'year': dates.dt.year.to_numpy(dtype=np.int16),
+            'month': dates.dt.month.to_numpy(dtype=np.int8),
+        })
+        with self._write_lock:
+            if ids is None:
+                ids = self._allocate_ids(len(frame))
+            else:
+                existing = self._scan(ds.field('id').isin(np.unique(ids)), ['id']).column('id').to_numpy()
+                keep = ~np.isin(ids, existing) & ~pd.Series(ids).duplicated().to_numpy()
+                if not keep.all():
+                    frame, ids = frame[keep].reset_index(drop=True), ids[keep]
+                if not len(ids):
+                    return ids
+                if self._next_id is not None:
+                    self._next_id = max(self._next_id, int(ids.max()) + 1)
+            frame.insert(0, 'id', ids)
+            table = pa.Table.from_pandas(frame.sort_values(['date', 'id'], kind='stable'),
+                                         schema=self._schema, preserve_index=False)
+            ds.write_dataset(
+                table, self._path, format='parquet', partitioning=self._partitioning,
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                min_rows_per_group=min(self.ROW_GROUP_SIZE, len(table)),
+                max_rows_per_group=self.ROW_GROUP_SIZE,
+            )
+        return ids
+
+    def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID reescribiendo el archivo que la contiene."""
+        match = ds.field('id') == int(sale_id)
+        deleted = False
+        with self._write_lock:
+            for fragment in self._dataset().get_fragments():
+                if fragment.count_rows(filter=match) == 0:
+                    continue
+                table = pq.read_table(fragment.path)
+                kept = table.filter(pc.not_equal(table.column('id'), int(sale_id)))
+                if kept.num_rows:
+                    pq.write_table(kept, fragment.path, row_group_size=self.ROW_GROUP_SIZE)
+                else:
+                    os.remove(fragment.path)
+                deleted = True
+        return deleted
+
+    def compact(self, min_files: int = 2) -> int:
+        """
+        Reescribe en un único archivo cada partición con al menos min_files archivos.
+
+        Cada save y cada lote escriben archivos nuevos; compactar junta los
+        archivos pequeños de una partición en uno ordenado por (date, id) con
+        row groups de ROW_GROUP_SIZE filas, para que las lecturas abran menos
+        archivos y la poda por estadísticas de fecha vuelva a ser efectiva.
+
+        Returns:
+            Número de particiones reescritas
+        """
+        compacted = 0
+        with self._write_lock:
+            partitions = {}
+            for fragment in self._dataset().get_fragments():
+                partitions.setdefault(os.path.dirname(fragment.path), []).append(fragment.path)
+            for directory, paths in partitions.items():
+                if len(paths) < max(min_files, 2):
+                    continue
+                table = pa.concat_tables([pq.ParquetFile(path).read() for path in paths])
+                table = table.sort_by([('date', 'ascending'), ('id', 'ascending')])
+                pq.write_table(table, os.path.join(directory, f"part-{uuid.uuid4().hex}-0.parquet"),
+                               row_group_size=self.ROW_GROUP_SIZE)
+                for path in paths:
+                    os.remove(path)
+                compacted += 1
+        return compacted
+
+    def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """
+        Guarda un DataFrame de ventas (acepta columnas monetarias en centavos).
+
+        if_exists: 'append', 'replace' (vacía el dataset antes) o 'fail'.
+        """
+        if if_exists not in ('append', 'replace', 'fail'):
+            raise ValueError(f"Modo de escritura no soportado: {if_exists}")
+        if if_exists == 'fail' and self._dataset().count_rows() > 0:
+            raise ValueError("El dataset de ventas ya contiene datos.")
+        batch = SaleBatch.from_dataframe(df)
+        if if_exists == 'replace':
+            with self._write_lock:
+                shutil.rmtree(self._path, ignore_errors=True)
+                os.makedirs(self._path, exist_ok=True)
+                self._next_id = None
+        return len(self._append(batch.to_dataframe()))
+
+    def import_sales(self, df: pd.DataFrame) -> int:
+        """
+        Guarda ventas conservando sus IDs (p. ej. al archivar ventas purgadas de SQL).
+
+        Las ventas cuyo id ya está en el dataset se omiten, de modo que
+        reimportar un lote (un reintento de purge_before) no repite filas.
+
+        Returns:
+            Número de ventas nuevas guardadas
+        """
+        if df.empty:
+            return 0
+        batch = SaleBatch.from_dataframe(df)
+        return len(self._append(batch.to_dataframe(), ids=df['id'].to_numpy(dtype=np.int64)))
+
+    def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """Obtiene ventas agregadas por período (diario, mensual, anual)."""
+        df = self._scan(columns=['date', 'quantity', 'total_amount_cents']).to_pandas()
+        amount = cents_column('total_amount') if self._money_as_cents else 'total_amount'
+        df['period'] = df['date'].dt.to_period(period).dt.start_time
+        result = (df.groupby('period')
+                    .agg(total_amount_cents=('total_amount_cents', 'sum'),
+                         quantity=('quantity', 'sum'),
+                         transactions=('date', 'size'))
+                    .reset_index())
+        if not self._money_as_cents:
+            result['total_amount_cents'] = cents_to_float(result['total_amount_cents'])
+        return result.rename(columns={'total_amount_cents': amount})
+
+    def get_top_products(self, limit: int = 10, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos (nombres desde el repositorio de productos, si se indicó)."""
+        columns = ['product_id', 'quantity', 'total_amount_cents']
+        df = self._scan(self._date_filter(start_date, end_date), columns).to_pandas()
+        top = (df.groupby('product_id')
+                 .agg(total_quantity=('quantity', 'sum'),
+                      total_revenue_cents=('total_amount_cents', 'sum'),
+                      transactions=('quantity', 'size'))
+                 .sort_values('total_revenue_cents', ascending=False, kind='stable')
+                 .head(limit)
+                 .reset_index())
+        names = {}
+        if self._products is not None and len(top):
+            names = {product.id: product.name for product in self._products.get_many(top['product_id'].tolist())}
+        top.insert(1, 'product_name', top['product_id'].map(names))
+        if not self._money_as_cents:
+            top['total_revenue_cents'] = cents_to_decimal(top['total_revenue_cents'])
+            top = top.rename(columns={'total_revenue_cents': 'total_revenue'})
+        return top
+
+    def _iter(self, filter: Optional[ds.Expression], chunk_size: Optional[int]) -> Iterator[pd.DataFrame]:
+        batches = self._dataset().to_batches(filter=filter, batch_size=chunk_size or self.STREAM_CHUNK_SIZE)
+        for batch in batches:
+            if batch.num_rows:
+                yield self._finish_frame(pa.Table.from_batches([batch]))
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de a lo sumo chunk_size filas."""
+        return self._iter(None, chunk_size)
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de a lo sumo chunk_size filas."""
+        return self._iter(self._date_filter(start_date, end_date), chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de a lo sumo chunk_size filas."""
+        return self._iter(ds.field('region') == region, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de a lo sumo chunk_size filas."""
+        return self._iter(ds.field('category') == category, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección y filtros aplicados en el escaneo del dataset."""
+        columns = validate_columns(columns if columns is not None else SALE_COLUMNS, SALE_COLUMNS)
+        filters = normalize_filters(filters)
+        validate_columns([column for column, _, _ in filters], SALE_COLUMNS)
+        order = parse_order_by(order_by)
+        validate_columns([column for column, _ in order], SALE_COLUMNS)
+        if limit is not None and limit < 0:
+            raise ValueError("El límite no puede ser negativo.")
+        expression = _and(*(self._filter_expression(*item) for item in filters), self._query_month_filter(filters))
+        needed = dict.fromkeys(_storage_column(column) for column in [*columns, *(column for column, _ in order)])
+        table = self._scan(expression, list(needed))
+        if order:
+            table = table.sort_by([(_storage_column(column), 'descending' if descending else 'ascending')
+                                   for column, descending in order])
+        if limit is not None:
+            table = table.slice(0, limit)
+        return self._finish_frame(table, columns)
+
+    @staticmethod
+    def _filter_expression(column: str, operator: str, value) -> ds.Expression:
+        field = ds.field(_storage_column(column))
+        if operator == 'in':
+            return field.isin([_storage_value(column, item) for item in value])
+        if operator == 'between':
+            low, high = (_storage_value(column, item) for item in value)
+            return (field >= low) & (field <= high)
+        if value is None and operator in ('=', '!='):
+            return field.is_null() if operator == '=' else field.is_valid()
+        value = _storage_value(column, value)
+        return {
+            '=': lambda: field == value,
+            '!=': lambda: field != value,
+            '<': lambda: field < value,
+            '<=': lambda: field <= value,
+            '>': lambda: field > value,
+            '>=': lambda: field >= value,
+        }[operator]()
+
+    def _query_month_filter(self, filters) -> Optional[ds.Expression]:
+        """Deriva de los filtros sobre date un filtro de particiones year/month."""
+        start = end = None
+        for column, operator, value in filters:
+            if column != 'date':
+                continue
+            if operator in ('>', '>=', '=') or operator == 'between':
+                low = value[0] if operator == 'between' else value
+                start = low if start is None else max(pd.Timestamp(start), pd.Timestamp(low))
+            if operator in ('<', '<=', '=') or operator == 'between':
+                high = value[1] if operator == 'between' else value
+                end = high if end is None else min(pd.Timestamp(end), pd.Timestamp(high))
+        return self._month_filter(start, end)
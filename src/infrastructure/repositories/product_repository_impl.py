@@ -0,0 +1,191 @@
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+from ...domain.entities.product import Product
+from ...domain.repositories.product_repository import ProductRepository
+from ...domain.repositories.query_spec import Filters
+from ...domain.services.margin_service import calculate_margins
+from ..database import queries
+from ..database.arrow_reader import ArrowReader
+from .identity_map import IdentityMap
+from .sql_repository import SQLRepository
+from .top_k import TopKEngine
+
+
+class SQLProductRepository(SQLRepository, ProductRepository):
+    """Implementación del repositorio de productos sobre SQLAlchemy (MySQL)."""
+
+    TABLE = 'products'
+    QUERY_COLUMNS = tuple(queries.PRODUCT_COLUMNS.split(', '))
+    MONEY_COLUMNS = ('price', 'cost', 'total_revenue')
+
+    def __init__(self, engine: Optional[Engine] = None, money_as_cents: bool = False, categorical_dimensions: bool = True,
+                 identity_map: Optional[IdentityMap] = None, top_k: Optional[TopKEngine] = None,
+                 arrow_reader: Optional[ArrowReader] = None, typed_reads: Optional[bool] = None):
+        super().__init__(engine, money_as_cents, categorical_dimensions, identity_map, arrow_reader, typed_reads)
+        self._top_k = top_k
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todos los productos."""
+        return self._read(queries.SELECT_ALL_PRODUCTS)
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        """Obtiene un producto por su ID."""
+        return self._get_one(queries.SELECT_PRODUCT_BY_ID, {'product_id': product_id},
+                             Product, product_id, Product.from_tuple)
+
+    def get_many(self, product_ids: List[int]) -> List[Product]:
+        """Obtiene varios productos por sus IDs con consultas IN por bloques."""
+        return self._get_many(queries.SELECT_PRODUCTS_BY_IDS, Product, product_ids, Product.from_tuple)
+
+    def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene productos por categoría."""
+        return self._read(queries.SELECT_PRODUCTS_BY_CATEGORY, {'category': category})
+
+    def get_low_stock(self, threshold: int = 10) -> pd.DataFrame:
+        """Obtiene productos con stock bajo."""
+        return self._read(queries.SELECT_LOW_STOCK_PRODUCTS, {'threshold': threshold})
+
+    def save(self, product: Product) -> Product:
+        """Guarda un nuevo producto."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.INSERT_PRODUCT), {
+                'name': product.name,
+                'category': product.category,
+                'price': product.price,
+                'cost': product.cost,
+                'stock': product.stock,
+            })
+        product.id = result.lastrowid
+        self._remember(product)
+        return product
+
+    def update_stock(self, product_id: int, quantity: int) -> bool:
+        """
+        Actualiza el stock de un producto sumando quantity (negativo para descontar).
+
+        Returns:
+            False si el producto no existe o el stock quedaría negativo
+        """
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.UPDATE_PRODUCT_STOCK),
+                                  {'product_id': product_id, 'quantity': quantity})
+        self._forget(Product, product_id)
+        return result.rowcount > 0
+
+    def update_stock_bulk(self, deltas: Union[Mapping[int, int], Iterable[Tuple[int, int]]],
+                          batch_size: int = 1_000, atomic: bool = False,
+                          rejected: Optional[List[int]] = None) -> int:
+        """
+        Aplica variaciones de stock a muchos productos por lotes.
+
+        Las variaciones de un mismo producto se suman en memoria y las netas
+        nulas se descartan. Cada lote bloquea sus filas en orden de id (sin
+        interbloqueos entre procesos concurrentes), descarta los productos
+        cuyo stock quedaría negativo y aplica el resto con un UPDATE (CASE por
+        id). Sin atomic cada lote se confirma por separado y los bloqueos se
+        liberan entre lotes; con atomic un fallo no deja ningún lote aplicado.
+
+        Returns:
+            Número de productos actualizados
+        """
+        if batch_size <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor que cero.")
+        pairs = list(deltas.items()) if isinstance(deltas, Mapping) else list(deltas)
+        if not pairs:
+            return 0
+        ids, changes = (np.asarray(column, dtype=np.int64) for column in zip(*pairs))
+        product_ids, positions = np.unique(ids, return_inverse=True)
+        net = np.zeros(len(product_ids), dtype=np.int64)
+        np.add.at(net, positions, changes)
+        keep = net != 0
+        product_ids, net = product_ids[keep], net[keep]
+        batches = [(product_ids[start:start + batch_size], net[start:start + batch_size])
+                   for start in range(0, len(product_ids), batch_size)]
+        updated = 0
+        if atomic:
+            # Los rechazos solo se publican si la transacción se confirma
+            batch_rejected: List[int] = []
+            try:
+                with self._engine.begin() as conn:
+                    for batch_ids, batch_net in batches:
+                        updated += self._apply_stock_batch(conn, batch_ids, batch_net, batch_rejected)
+            finally:
+                self._forget_products(product_ids)
+            if rejected is not None:
+                rejected.extend(batch_rejected)
+            return updated
+        for batch_ids, batch_net in batches:
+            try:
+                with self._engine.begin() as conn:
+                    updated += self._apply_stock_batch(conn, batch_ids, batch_net, rejected)
+            finally:
+                self._forget_products(batch_ids)
+        return updated
+
+    def _apply_stock_batch(self, conn: Connection, product_ids: np.ndarray, net: np.ndarray,
+                           rejected: Optional[List[int]]) -> int:
+        """Aplica un lote (ids ordenados) sin dejar stock negativo; devuelve las filas actualizadas."""
+        sql = queries.SELECT_PRODUCT_STOCK_BY_IDS + (' FOR UPDATE' if self._engine.dialect.name == 'mysql' else '')
+        statement = text(sql).bindparams(bindparam('ids', expanding=True))
+        rows = conn.execute(statement, {'ids': product_ids.tolist()}).all()
+        if not rows:
+            return 0
+        found, stock = (np.asarray(column, dtype=np.int64) for column in zip(*rows))
+        deltas = net[np.searchsorted(product_ids, found)]
+        valid = stock + deltas >= 0
+        if rejected is not None:
+            rejected.extend(found[~valid].tolist())
+        if not valid.any():
+            return 0
+        sql, params = queries.build_stock_delta_update(dict(zip(found[valid].tolist(), deltas[valid].tolist())))
+        return conn.execute(text(sql), params).rowcount
+
+    def _forget_products(self, product_ids: np.ndarray) -> None:
+        for product_id in product_ids.tolist():
+            self._forget(Product, product_id)
+
+    def delete(self, product_id: int) -> bool:
+        """Elimina un producto por su ID."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.DELETE_PRODUCT), {'product_id': product_id})
+        self._forget(Product, product_id)
+        return result.rowcount > 0
+
+    def get_products_with_margin(self) -> pd.DataFrame:
+        """
+        Obtiene productos con su margen de beneficio calculado.
+
+        El margen se calcula de forma vectorizada para todo el catálogo.
+        """
+        df = self.get_all()
+        df['margin'] = calculate_margins(df)
+        return df
+
+    def get_best_sellers(self, limit: int = 10) -> pd.DataFrame:
+        """Obtiene los productos más vendidos (con TopKEngine, desde los totales diarios)."""
+        if self._top_k is not None:
+            top = self._top_k.top_products(limit, by='total_quantity')
+            return self._finish_frame(top[['product_id', 'product_name', 'category', 'total_quantity', 'total_revenue']])
+        return self._read(queries.SELECT_BEST_SELLERS, {'limit': limit})
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todos los productos en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_ALL_PRODUCTS, {}, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los productos de una categoría en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_PRODUCTS_BY_CATEGORY, {'category': category}, chunk_size)
+
+    def iter_low_stock(self, threshold: int = 10, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera los productos con stock bajo en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_LOW_STOCK_PRODUCTS, {'threshold': threshold}, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite compilados a un único SELECT."""
+        return self._query(columns, filters, order_by, limit)
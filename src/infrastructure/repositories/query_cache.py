@@ -0,0 +1,231 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+@dataclass
+class CacheStats:
+    """Contadores de actividad de la caché de consultas."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+def _size_of(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return sys.getsizeof(value)
+
+
+def _remove_files(paths) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _copy(value: Any) -> Any:
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+class QueryCache:
+    """
+    Caché LRU de resultados de consultas con caducidad (TTL) y presupuesto en bytes.
+
+    Cuando se supera max_bytes se descartan las entradas menos usadas. Con
+    disk_path, los DataFrames descartados de memoria (o demasiado grandes
+    para el presupuesto) se guardan en Parquet y se recuperan desde disco
+    mientras no caduquen; la E/S de disco se hace fuera del lock y un fallo
+    al escribir solo deja la entrada fuera de la caché. Los resultados se
+    entregan como copias para que el llamador no pueda alterar la entrada
+    guardada.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = 300.0,
+                 disk_path: Optional[str] = None):
+        if max_bytes <= 0:
+            raise ValueError("El presupuesto de memoria de la caché debe ser mayor que cero.")
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._disk_path = disk_path
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int, float]]' = OrderedDict()
+        self._disk: Dict[Hashable, Tuple[str, float]] = {}
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.RLock()
+        self.stats = CacheStats()
+        if disk_path:
+            os.makedirs(disk_path, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Bytes ocupados en memoria por las entradas."""
+        return self._bytes
+
+    @property
+    def generation(self) -> int:
+        """Número de invalidaciones; permite descartar resultados leídos antes de una escritura."""
+        return self._generation
+
+    def _expires_at(self) -> float:
+        return time.monotonic() + self._ttl if self._ttl is not None else float('inf')
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Busca una entrada.
+
+        Returns:
+            (encontrada, valor)
+        """
+        stale = []
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return True, _copy(value)
+                self._drop(key)
+                self.stats.expirations += 1
+            disk_entry = self._disk.get(key)
+            if disk_entry is not None and disk_entry[1] <= now:
+                stale.append(self._disk.pop(key)[0])
+                self.stats.expirations += 1
+                disk_entry = None
+            if disk_entry is None:
+                self.stats.misses += 1
+        _remove_files(stale)
+        if disk_entry is None:
+            return False, None
+        value = self._read_disk(disk_entry[0])
+        with self._lock:
+            # Una invalidación o un put concurrente pudo retirar el archivo leído
+            if value is None or self._disk.get(key) != disk_entry:
+                self.stats.misses += 1
+                return False, None
+            self.stats.disk_hits += 1
+        return True, value
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """
+        Guarda una entrada, descartando las menos usadas si se supera el presupuesto.
+
+        Si se indica generation y hubo una invalidación desde entonces, el
+        valor se considera obsoleto y no se guarda. Los archivos de disco se
+        escriben y borran fuera del lock.
+        """
+        size = _size_of(value)
+        expires = self._expires_at()
+        removed, spills = [], []
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._drop(key)
+            removed.extend(self._forget_disk(key))
+            if size > self._max_bytes:
+                spills.append((key, value, expires))
+            else:
+                self._entries[key] = (_copy(value), size, expires)
+                self._bytes += size
+                while self._bytes > self._max_bytes:
+                    evicted_key, (evicted, _, evicted_expires) = next(iter(self._entries.items()))
+                    self._drop(evicted_key)
+                    self.stats.evictions += 1
+                    spills.append((evicted_key, evicted, evicted_expires))
+            spill_generation = self._generation
+        _remove_files(removed)
+        for spill_key, spill_value, spill_expires in spills:
+            self._spill(spill_key, spill_value, spill_expires, spill_generation)
+
+    def invalidate(self) -> None:
+        """Descarta todas las entradas (memoria y disco)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            removed = [path for path, _ in self._disk.values()]
+            self._disk.clear()
+            self._generation += 1
+            self.stats.invalidations += 1
+        _remove_files(removed)
+
+    def _drop(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _disk_file(self, key: Hashable) -> str:
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self._disk_path, f"{digest}-{uuid.uuid4().hex}.parquet")
+
+    def _spill(self, key: Hashable, value: Any, expires: float, generation: int) -> None:
+        """
+        Guarda en disco una entrada descartada de memoria.
+
+        Si la escritura falla, o si mientras tanto hubo una invalidación o
+        una entrada más reciente para la clave, el archivo se descarta y la
+        entrada simplemente no queda en caché.
+        """
+        if not self._disk_path or not isinstance(value, pd.DataFrame):
+            return
+        path = self._disk_file(key)
+        try:
+            value.to_parquet(path, index=True)
+        except Exception:
+            _remove_files([path])
+            return
+        with self._lock:
+            current = generation == self._generation and key not in self._entries and key not in self._disk
+            if current:
+                self._disk[key] = (path, expires)
+        if not current:
+            _remove_files([path])
+
+    @staticmethod
+    def _read_disk(path: str) -> Optional[pd.DataFrame]:
+        try:
+            return pd.read_parquet(path)
+        except (OSError, ValueError):
+            return None
+
+    def _forget_disk(self, key: Hashable) -> list:
+        entry = self._disk.pop(key, None)
+        return [entry[0]] if entry is not None else []
+
+    def metrics(self) -> Dict[str, float]:
+        """Contadores de aciertos, fallos y descartes, y ocupación actual."""
+        with self._lock:
+            stats = self.stats
+            return {
+                'hits': stats.hits,
+                'disk_hits': stats.disk_hits,
+                'misses': stats.misses,
+                'evictions': stats.evictions,
+                'expirations': stats.expirations,
+                'invalidations': stats.invalidations,
+                'hit_ratio': stats.hit_ratio,
+                'entries': len(self._entries),
+                'disk_entries': len(self._disk),
+                'bytes': self._bytes,
+            }
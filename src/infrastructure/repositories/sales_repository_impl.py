@@ -0,0 +1,297 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+from sqlalchemy import Numeric, bindparam, text
+from sqlalchemy.engine import Engine
+
+from ...domain.entities.money import cents_column, from_cents_columns
+from ...domain.entities.sale import Sale
+from ...domain.entities.sale_batch import SaleBatch
+from ...domain.repositories.pagination import Page, decode_cursor, encode_cursor
+from ...domain.repositories.query_spec import Filters
+from ...domain.repositories.sales_repository import SalesRepository
+from ..database import queries
+from ..database.arrow_reader import ArrowReader
+from ..etl.loaders import BulkSalesLoader, LoadReport
+from .identity_map import IdentityMap
+from .parquet_sales_repository import ParquetSalesRepository
+from .sales_rollups import SalesRollups
+from .sql_repository import SQLRepository
+from .top_k import TopKEngine
+
+
+@dataclass
+class PurgeReport:
+    """Resultado de una purga de ventas antiguas."""
+    rows: int
+    seconds: float
+    destination: str
+    batches: int
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+
+class SQLSalesRepository(SQLRepository, SalesRepository):
+    """Implementación del repositorio de ventas sobre SQLAlchemy (MySQL)."""
+
+    BULK_CHUNK_SIZE = 10_000
+    TABLE = 'sales'
+    QUERY_COLUMNS = tuple(queries.SALES_COLUMNS.split(', '))
+    MONEY_COLUMNS = ('unit_price', 'total_amount', 'total_revenue')
+    last_load_report: Optional[LoadReport] = None
+
+    def __init__(self, engine: Optional[Engine] = None, money_as_cents: bool = False, categorical_dimensions: bool = True,
+                 identity_map: Optional[IdentityMap] = None, rollups: Optional[SalesRollups] = None,
+                 top_k: Optional[TopKEngine] = None, arrow_reader: Optional[ArrowReader] = None,
+                 typed_reads: Optional[bool] = None):
+        super().__init__(engine, money_as_cents, categorical_dimensions, identity_map, arrow_reader, typed_reads)
+        self._rollups = rollups
+        self._top_k = top_k
+        self._aggregates = [aggregates for aggregates in (rollups, top_k) if aggregates is not None]
+
+    def get_all(self) -> pd.DataFrame:
+        """Obtiene todas las ventas."""
+        return self._read(queries.SELECT_ALL_SALES)
+
+    def get_by_id(self, sale_id: int) -> Optional[Sale]:
+        """Obtiene una venta por su ID."""
+        return self._get_one(queries.SELECT_SALE_BY_ID, {'sale_id': sale_id}, Sale, sale_id, Sale.from_tuple)
+
+    def get_many(self, sale_ids: List[int]) -> List[Sale]:
+        """Obtiene varias ventas por sus IDs con consultas IN por bloques."""
+        return self._get_many(queries.SELECT_SALES_BY_IDS, Sale, sale_ids, Sale.from_tuple)
+
+    def get_by_date_range(self, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Obtiene ventas dentro de un rango de fechas."""
+        return self._read(queries.SELECT_SALES_BY_DATE_RANGE,
+                          {'start_date': start_date, 'end_date': end_date})
+
+    def get_page_by_date_range(self, start_date: datetime, end_date: datetime, page_size: int = 1000,
+                               cursor: Optional[str] = None) -> Page:
+        """
+        Obtiene una página de ventas de un rango de fechas ordenadas por (date, id).
+
+        Paginación por clave: cada página busca directamente la posición
+        siguiente a la del cursor en lugar de descartar filas con OFFSET, por lo
+        que su costo no crece con el número de página.
+        """
+        if page_size <= 0:
+            raise ValueError("El tamaño de página debe ser mayor que cero.")
+        params = {'start_date': start_date, 'end_date': end_date, 'limit': page_size + 1}
+        sql = queries.SELECT_SALES_PAGE_BY_DATE_RANGE
+        if cursor is not None:
+            params['after_date'], params['after_id'] = decode_cursor(cursor)
+            sql = queries.SELECT_SALES_PAGE_BY_DATE_RANGE_AFTER
+        df = self._read(sql, params)
+        if len(df) <= page_size:
+            return Page(df)
+        df = df.iloc[:page_size]
+        last = df.iloc[-1]
+        return Page(df, encode_cursor(last['date'], last['id']))
+
+    def get_by_region(self, region: str) -> pd.DataFrame:
+        """Obtiene ventas por región."""
+        return self._read(queries.SELECT_SALES_BY_REGION, {'region': region})
+
+    def get_by_category(self, category: str) -> pd.DataFrame:
+        """Obtiene ventas por categoría de producto."""
+        return self._read(queries.SELECT_SALES_BY_CATEGORY, {'category': category})
+
+    def save(self, sale: Sale) -> Sale:
+        """Guarda una nueva venta."""
+        with self._engine.begin() as conn:
+            result = conn.execute(text(queries.INSERT_SALE), self._sale_params(sale))
+        sale.id = result.lastrowid
+        self._remember(sale)
+        return sale
+
+    def save_bulk(self, sales: Union[List[Sale], SaleBatch]) -> int:
+        """
+        Guarda múltiples ventas.
+
+        Con un SaleBatch la validación es vectorizada y la inserción se hace por
+        bloques de BULK_CHUNK_SIZE filas, sin crear una entidad Sale por fila.
+        """
+        if isinstance(sales, SaleBatch):
+            saved = self._save_batch(sales)
+        elif not sales:
+            return 0
+        else:
+            with self._engine.begin() as conn:
+                conn.execute(text(queries.INSERT_SALE), [self._sale_params(sale) for sale in sales])
+            saved = len(sales)
+        self._refresh_aggregates()
+        return saved
+
+    def _refresh_aggregates(self) -> None:
+        for aggregates in self._aggregates:
+            aggregates.refresh()
+
+    def _save_batch(self, batch: SaleBatch) -> int:
+        batch.validate()
+        saved = 0
+        with self._engine.begin() as conn:
+            for chunk in batch.iter_chunks(self.BULK_CHUNK_SIZE):
+                conn.execute(text(queries.INSERT_SALE), chunk.to_records())
+                saved += len(chunk)
+        return saved
+
+    @staticmethod
+    def _sale_params(sale: Sale) -> dict:
+        return {
+            'date': sale.date,
+            'product_id': sale.product_id,
+            'customer_id': sale.customer_id,
+            'quantity': sale.quantity,
+            'unit_price': sale.unit_price,
+            'total_amount': sale.total_amount,
+            'region': sale.region,
+            'category': sale.category,
+        }
+
+    def delete(self, sale_id: int) -> bool:
+        """Elimina una venta por su ID."""
+        with self._engine.begin() as conn:
+            if self._aggregates:
+                row = conn.execute(text(queries.SELECT_SALE_BY_ID), {'sale_id': sale_id}).first()
+                if row is not None:
+                    for aggregates in self._aggregates:
+                        aggregates.subtract(conn, Sale.from_tuple(row))
+            result = conn.execute(text(queries.DELETE_SALE), {'sale_id': sale_id})
+        self._forget(Sale, sale_id)
+        return result.rowcount > 0
+
+    def purge_before(self, cutoff: datetime, archive: Union[str, ParquetSalesRepository, None] = 'table',
+                     batch_size: int = 5_000, pause_seconds: float = 0.0,
+                     max_batches: Optional[int] = None) -> PurgeReport:
+        """
+        Elimina las ventas anteriores a cutoff por lotes de batch_size ids.
+
+        archive: 'table' copia cada lote a sales_archive en la misma
+        transacción que lo elimina; un ParquetSalesRepository recibe el lote
+        (con sus ids) antes de eliminarlo; None solo elimina. Cada lote es una
+        transacción corta y entre lotes se espera pause_seconds, de modo que
+        las escrituras concurrentes no quedan bloqueadas durante la purga.
+        Las tablas de agregados se descuentan en la misma transacción.
+        """
+        if batch_size <= 0:
+            raise ValueError("El tamaño de lote debe ser mayor que cero.")
+        if isinstance(archive, str) and archive != 'table':
+            raise ValueError(f"Destino de archivo no soportado: {archive}")
+        destination = ('sales_archive' if archive == 'table' else
+                       'parquet' if archive is not None else 'none')
+        select_rows = text(queries.SELECT_SALES_BY_IDS).bindparams(bindparam('ids', expanding=True))
+        copy_rows = text(queries.INSERT_SALES_ARCHIVE_BY_IDS).bindparams(bindparam('ids', expanding=True))
+        delete_rows = text(queries.DELETE_SALES_BY_IDS).bindparams(bindparam('ids', expanding=True))
+        rows = batches = 0
+        start = time.perf_counter()
+        while max_batches is None or batches < max_batches:
+            if batches and pause_seconds > 0:
+                time.sleep(pause_seconds)
+            with self._engine.connect() as conn:
+                ids = list(conn.execute(text(queries.SELECT_SALE_IDS_BEFORE),
+                                        {'cutoff': cutoff, 'limit': batch_size}).scalars())
+                if ids and isinstance(archive, ParquetSalesRepository):
+                    result = conn.execute(select_rows, {'ids': ids})
+                    archive.import_sales(pd.DataFrame(result.fetchall(), columns=list(result.keys())))
+            if not ids:
+                break
+            with self._engine.begin() as conn:
+                for aggregates in self._aggregates:
+                    aggregates.subtract_many(conn, ids)
+                if archive == 'table':
+                    conn.execute(copy_rows, {'ids': ids})
+                rows += conn.execute(delete_rows, {'ids': ids}).rowcount
+            for sale_id in ids:
+                self._forget(Sale, sale_id)
+            batches += 1
+        return PurgeReport(rows, time.perf_counter() - start, destination, batches)
+
+    def save_dataframe(self, df: pd.DataFrame, if_exists: str = 'append') -> int:
+        """
+        Guarda un DataFrame de ventas (acepta columnas monetarias en centavos).
+
+        En modo 'append' usa BulkSalesLoader (LOAD DATA o INSERT multi-fila);
+        el informe de la última carga queda en last_load_report. Con tablas de
+        agregados, 'replace' vacía sales en lugar de recrearla (conserva su
+        trigger) y reinicia los agregados en la misma transacción.
+        """
+        if if_exists == 'append':
+            self.last_load_report = BulkSalesLoader(self._engine, batch_size=self.BULK_CHUNK_SIZE).load(df)
+            self._refresh_aggregates()
+            return self.last_load_report.rows
+        df = from_cents_columns(df, kind='decimal')
+        money_types = {column: Numeric(10, 2) for column in self.MONEY_COLUMNS if column in df}
+        with self._engine.begin() as conn:
+            if if_exists == 'replace' and self._aggregates:
+                conn.execute(text(queries.DELETE_ALL_SALES))
+                for aggregates in self._aggregates:
+                    aggregates.reset(conn)
+                df.to_sql('sales', conn, if_exists='append', index=False, dtype=money_types)
+            else:
+                df.to_sql('sales', conn, if_exists=if_exists, index=False, dtype=money_types)
+        self._refresh_aggregates()
+        return len(df)
+
+    def get_aggregated_by_period(self, period: str = 'M') -> pd.DataFrame:
+        """
+        Obtiene ventas agregadas por período (diario, mensual, anual).
+
+        Con tablas de resumen, se usa la más gruesa que responde el período
+        y solo las ventas aún no sumadas se leen de la tabla base.
+        """
+        level = SalesRollups.level_for(period) if self._rollups is not None else None
+        if level is None:
+            df = self._read(queries.SELECT_SALES_FOR_AGGREGATION)
+            df['transactions'] = 1
+        else:
+            rolled, tail = self._rollups.read(level)
+            rolled = self._finish_frame(rolled.rename(columns={'period_start': 'date'}))
+            rolled['date'] = pd.to_datetime(rolled['date'])
+            tail = self._finish_frame(tail)
+            tail['date'] = pd.to_datetime(tail['date'])
+            tail['transactions'] = 1
+            df = pd.concat([frame for frame in (rolled, tail) if len(frame)] or [rolled], ignore_index=True)
+        amount = cents_column('total_amount') if self._money_as_cents else 'total_amount'
+        if not self._money_as_cents:
+            df[amount] = pd.to_numeric(df[amount])
+        df['period'] = pd.to_datetime(df['date']).dt.to_period(period).dt.start_time
+        return (df.groupby('period')
+                  .agg(**{amount: (amount, 'sum')},
+                       quantity=('quantity', 'sum'),
+                       transactions=('transactions', 'sum'))
+                  .reset_index())
+
+    def get_top_products(self, limit: int = 10, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
+        """Obtiene los productos más vendidos (con TopKEngine, desde los totales diarios)."""
+        if self._top_k is not None:
+            top = self._top_k.top_products(limit, start_date, end_date)
+            return self._finish_frame(top[['product_id', 'product_name', 'total_quantity', 'total_revenue', 'transactions']])
+        return self._read(queries.SELECT_TOP_PRODUCTS,
+                          {'limit': limit, 'start_date': start_date, 'end_date': end_date})
+
+    def iter_all(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera todas las ventas en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_ALL_SALES, {}, chunk_size)
+
+    def iter_by_date_range(self, start_date: datetime, end_date: datetime, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de un rango de fechas en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_SALES_BY_DATE_RANGE, {'start_date': start_date, 'end_date': end_date}, chunk_size)
+
+    def iter_by_region(self, region: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una región en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_SALES_BY_REGION, {'region': region}, chunk_size)
+
+    def iter_by_category(self, category: str, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Itera las ventas de una categoría en bloques de chunk_size filas (cursor del servidor)."""
+        return self._iter(queries.SELECT_SALES_BY_CATEGORY, {'category': category}, chunk_size)
+
+    def query(self, columns: Optional[Sequence[str]] = None, filters: Optional[Filters] = None,
+              order_by: Optional[Sequence[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """Consulta con proyección, filtros, orden y límite compilados a un único SELECT."""
+        return self._query(columns, filters, order_by, limit)
@@ -0,0 +1,188 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Connection, Engine
+
+from ..database import queries
+from ..database.sql_connection import get_engine
+
+# Períodos de pandas que cada tabla de resumen puede responder: un período de
+# la tabla debe quedar completamente dentro de un período pedido.
+_LEVEL_BY_PERIOD = {
+    'Y': 'Y', 'A': 'Y', 'Y-DEC': 'Y', 'A-DEC': 'Y',
+    'Q': 'M', 'M': 'M',
+    'W': 'D', 'D': 'D',
+}
+
+
+class IncrementalAggregates(ABC):
+    """
+    Base de las tablas de agregados de ventas mantenidas de forma incremental.
+
+    Un trigger de sales anota cada venta nueva en sales_rollup_pending para
+    cada conjunto registrado en sales_rollup_state (bajo NAME), en la misma
+    transacción que la venta. refresh suma exactamente las ventas pendientes
+    con un INSERT ... SELECT agrupado por tabla y las borra de la lista, por
+    lo que no depende del orden en que se confirman los ids. Asume que las
+    ventas no se modifican después de insertarse. Las subclases definen las
+    tablas y sus claves.
+    """
+
+    NAME = ''
+    # Ids de ventas por sentencia al sumar las pendientes
+    FOLD_CHUNK_SIZE = 10_000
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self._engine = engine if engine is not None else get_engine()
+        dialect = self._engine.dialect.name
+        if dialect not in queries.ROLLUP_PERIOD_EXPRESSIONS:
+            raise ValueError(f"Dialecto no soportado por las tablas de agregados: {dialect}")
+        self._dialect = dialect
+        self._expressions = queries.ROLLUP_PERIOD_EXPRESSIONS[dialect]
+        self._lock_pending = ' FOR UPDATE' if dialect == 'mysql' else ''
+        self._lock = threading.Lock()
+        self._registered = False
+        self._keys = self._tables()
+        self._upserts = [
+            text(queries.build_incremental_upsert(dialect, table, keys)).bindparams(bindparam('ids', expanding=True))
+            for table, keys in self._keys.items()
+        ]
+        self._batch_subtracts = [
+            text(queries.build_incremental_upsert(dialect, table, keys, sign=-1)).bindparams(
+                bindparam('ids', expanding=True))
+            for table, keys in self._keys.items()
+        ]
+
+    @abstractmethod
+    def _tables(self) -> Dict[str, Dict[str, str]]:
+        """Tablas mantenidas y sus claves de agrupación (columna -> expresión sobre sales)."""
+        pass
+
+    @abstractmethod
+    def _key_values(self, table: str, sale) -> dict:
+        """Valores de las claves de una venta en una tabla (para descontarla)."""
+        pass
+
+    def _register(self, conn: Connection) -> None:
+        """Da de alta NAME en sales_rollup_state si falta, partiendo de tablas vacías y todo pendiente."""
+        if self._registered:
+            return
+        if conn.execute(text(queries.SELECT_ROLLUP_STATE), {'name': self.NAME}).first() is None:
+            self.reset(conn)
+        self._registered = True
+
+    def reset(self, conn: Connection) -> None:
+        """Vacía las tablas y marca como pendientes todas las ventas actuales (en la transacción de conn)."""
+        conn.execute(text(queries.INSERT_ROLLUP_STATE[self._dialect]), {'name': self.NAME})
+        for table in self._keys:
+            conn.execute(text(queries.build_clear_table(table)))
+        conn.execute(text(queries.CLEAR_PENDING_SALES), {'name': self.NAME})
+        conn.execute(text(queries.BACKFILL_PENDING_SALES[self._dialect]), {'name': self.NAME})
+        self._registered = True
+
+    def _pending_ids(self, conn: Connection, sale_ids: Optional[Sequence[int]] = None) -> List[int]:
+        """Ids pendientes de sumar (todos o los de sale_ids), bloqueados hasta el fin de la transacción."""
+        if sale_ids is None:
+            statement = text(queries.SELECT_PENDING_SALE_IDS + self._lock_pending)
+            params = {'name': self.NAME}
+        else:
+            statement = text(queries.SELECT_PENDING_SALE_IDS_IN + self._lock_pending).bindparams(
+                bindparam('ids', expanding=True))
+            params = {'name': self.NAME, 'ids': list(sale_ids)}
+        return [int(sale_id) for sale_id in conn.execute(statement, params).scalars()]
+
+    def _forget_pending(self, conn: Connection, sale_ids: Sequence[int]) -> None:
+        statement = text(queries.DELETE_PENDING_SALE_IDS).bindparams(bindparam('ids', expanding=True))
+        for start in range(0, len(sale_ids), self.FOLD_CHUNK_SIZE):
+            conn.execute(statement, {'name': self.NAME, 'ids': list(sale_ids[start:start + self.FOLD_CHUNK_SIZE])})
+
+    def refresh(self) -> int:
+        """
+        Suma a las tablas las ventas pendientes.
+
+        Returns:
+            Número de ventas sumadas
+        """
+        with self._lock, self._engine.begin() as conn:
+            self._register(conn)
+            pending = self._pending_ids(conn)
+            for start in range(0, len(pending), self.FOLD_CHUNK_SIZE):
+                params = {'ids': pending[start:start + self.FOLD_CHUNK_SIZE]}
+                for statement in self._upserts:
+                    conn.execute(statement, params)
+            self._forget_pending(conn, pending)
+        return len(pending)
+
+    def subtract(self, conn: Connection, sale) -> None:
+        """Descuenta de las tablas una venta que se va a eliminar (si ya estaba sumada)."""
+        self._register(conn)
+        forgotten = conn.execute(text(queries.DELETE_PENDING_SALE), {'name': self.NAME, 'sale_id': sale.id})
+        if forgotten.rowcount:
+            return
+        for table, keys in self._keys.items():
+            conn.execute(text(queries.build_incremental_subtract(table, keys)), {
+                **self._key_values(table, sale),
+                'quantity': sale.quantity,
+                'total_amount': sale.total_amount,
+            })
+
+    def subtract_many(self, conn: Connection, sale_ids: Sequence[int]) -> None:
+        """Descuenta de las tablas un lote de ventas que se va a eliminar (solo las ya sumadas)."""
+        if not sale_ids:
+            return
+        self._register(conn)
+        pending = self._pending_ids(conn, sale_ids)
+        self._forget_pending(conn, pending)
+        skipped = set(pending)
+        folded = [sale_id for sale_id in sale_ids if sale_id not in skipped]
+        if not folded:
+            return
+        for statement in self._batch_subtracts:
+            conn.execute(statement, {'ids': folded})
+
+
+class SalesRollups(IncrementalAggregates):
+    """
+    Tablas de resumen de ventas por día, mes y año (por región y categoría).
+
+    Las ventas pendientes de sumar se leen de la tabla base al consultar, por lo que los resultados son exactos aunque no se haya
+    refrescado.
+    """
+
+    NAME = 'sales'
+
+    def _tables(self) -> Dict[str, Dict[str, str]]:
+        return {table: queries.rollup_keys(self._expressions[level])
+                for level, table in queries.ROLLUP_TABLES.items()}
+
+    def _key_values(self, table: str, sale) -> dict:
+        day = pd.Timestamp(sale.date).date()
+        starts = {'D': day, 'M': day.replace(day=1), 'Y': day.replace(month=1, day=1)}
+        level = next(level for level, name in queries.ROLLUP_TABLES.items() if name == table)
+        return {'period_start': starts[level], 'region': sale.region or '', 'category': sale.category or ''}
+
+    @staticmethod
+    def level_for(period: str) -> Optional[str]:
+        """Tabla de resumen más gruesa que responde un período de pandas ('D', 'W', 'M', 'Q', 'Y'), o None."""
+        base = period.upper()
+        if base in _LEVEL_BY_PERIOD:
+            return _LEVEL_BY_PERIOD[base]
+        anchor_free = base.split('-')[0]
+        # Semanas y trimestres con cualquier anclaje contienen días y meses completos
+        return _LEVEL_BY_PERIOD[anchor_free] if anchor_free in ('W', 'Q') else None
+
+    def read(self, level: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Lee en una misma transacción la tabla de resumen y las ventas aún no sumadas.
+
+        Returns:
+            (totales por period_start, ventas pendientes de sumar [date, quantity, total_amount])
+        """
+        with self._engine.begin() as conn:
+            self._register(conn)
+            rolled = pd.read_sql(text(queries.build_rollup_aggregation(queries.ROLLUP_TABLES[level])), conn)
+            tail = pd.read_sql(text(queries.SELECT_PENDING_SALES_FOR_AGGREGATION), conn, params={'name': self.NAME})
+        return rolled, tail
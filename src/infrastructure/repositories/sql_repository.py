@@ -0,0 +1,195 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
+
+from ...domain.entities.dimension import to_categorical_columns
+from ...domain.entities.money import to_cents_columns
+from ...domain.repositories.query_spec import Filters, normalize_filters, parse_order_by, validate_columns
+from config.settings import settings
+from ..database import queries
+from ..database.arrow_reader import ArrowReader
+from ..database.materializer import CATEGORY, MONEY, TABLE_SCHEMAS, TEXT, ResultMaterializer
+from ..database.sql_connection import get_engine
+from .identity_map import IdentityMap
+
+# Mapas de identidad activados con unit_of_work, por repositorio. Una sola
+# ContextVar para todo el proceso: cada unit_of_work fija una copia del
+# diccionario con su repositorio añadido y la restaura al salir.
+_active_identity_maps: ContextVar[Mapping['SQLRepository', IdentityMap]] = ContextVar(
+    'sql_repository_identity_maps', default=MappingProxyType({}))
+
+
+class SQLRepository:
+    """
+    Base común de los repositorios SQLAlchemy.
+
+    Con money_as_cents=True las columnas monetarias de las lecturas se
+    devuelven como <columna>_cents (int64) en lugar de Decimal. Con
+    categorical_dimensions=True (por defecto) region y category se devuelven
+    como dtype category con los códigos de los diccionarios compartidos.
+    Con un IdentityMap (en el constructor o con unit_of_work) las entidades
+    leídas por id se reutilizan sin volver a consultar la base de datos; el
+    mapa de unit_of_work solo es visible en el hilo o tarea asyncio que abrió
+    el bloque, aunque la instancia del repositorio sea compartida.
+    Sin engine explícito se usa el engine compartido del gestor de conexiones.
+    Con un ArrowReader (o con DB_ARROW_READS en Settings) las lecturas
+    completas se transportan como tablas Arrow en lugar de tuplas por fila.
+    Con typed_reads=True (o DB_TYPED_READS) las lecturas y los iteradores
+    construyen los DataFrames con ResultMaterializer: columnas con el dtype
+    final del esquema de TABLE (int32, float64 o centavos, category) en lugar
+    de pasar por pd.read_sql y columnas object.
+    """
+
+    TABLE = ''
+    QUERY_COLUMNS: Tuple[str, ...] = ()
+    MONEY_COLUMNS: Tuple[str, ...] = ()
+    IN_LIST_CHUNK_SIZE = 1_000
+    STREAM_CHUNK_SIZE = 50_000
+
+    def __init__(self, engine: Optional[Engine] = None, money_as_cents: bool = False, categorical_dimensions: bool = True,
+                 identity_map: Optional[IdentityMap] = None, arrow_reader: Optional[ArrowReader] = None,
+                 typed_reads: Optional[bool] = None):
+        self._engine = engine if engine is not None else get_engine()
+        self._money_as_cents = money_as_cents
+        self._categorical_dimensions = categorical_dimensions
+        self._default_identity_map = identity_map
+        if arrow_reader is None and settings.DB_ARROW_READS:
+            arrow_reader = ArrowReader(self._engine)
+        self._arrow_reader = arrow_reader
+        if typed_reads is None:
+            typed_reads = settings.DB_TYPED_READS
+        self._materializer = self._build_materializer() if typed_reads else None
+
+    def _build_materializer(self) -> ResultMaterializer:
+        """Materializador con el esquema de TABLE y las columnas monetarias calculadas."""
+        schema = dict(TABLE_SCHEMAS.get(self.TABLE, {}))
+        schema.update({column: MONEY for column in self.MONEY_COLUMNS})
+        if not self._categorical_dimensions:
+            schema = {column: TEXT if kind == CATEGORY else kind for column, kind in schema.items()}
+        return ResultMaterializer(schema, self._money_as_cents, self.STREAM_CHUNK_SIZE)
+
+    @property
+    def _identity_map(self) -> Optional[IdentityMap]:
+        active = _active_identity_maps.get().get(self)
+        return active if active is not None else self._default_identity_map
+
+    @contextmanager
+    def unit_of_work(self, identity_map: Optional[IdentityMap] = None) -> Iterator[IdentityMap]:
+        """
+        Activa un mapa de identidad mientras dura el bloque (puede compartirse entre repositorios).
+
+        El mapa se guarda en una ContextVar: las llamadas de otros hilos o
+        tareas sobre la misma instancia siguen usando el mapa del constructor.
+        """
+        identity_map = identity_map if identity_map is not None else IdentityMap()
+        token = _active_identity_maps.set({**_active_identity_maps.get(), self: identity_map})
+        try:
+            yield identity_map
+        finally:
+            _active_identity_maps.reset(token)
+
+    def _read(self, sql: Union[str, TextClause], params: Optional[dict] = None) -> pd.DataFrame:
+        statement = text(sql) if isinstance(sql, str) else sql
+        if self._arrow_reader is not None:
+            cents_columns = self.MONEY_COLUMNS if self._money_as_cents else ()
+            return self._finish_frame(self._arrow_reader.read_frame(statement, params, cents_columns))
+        with self._engine.connect() as conn:
+            if self._materializer is not None:
+                df = self._materializer.materialize(conn.execute(statement, params or {}))
+            else:
+                df = pd.read_sql(statement, conn, params=params or {})
+        return self._finish_frame(df)
+
+    def _query(self, columns: Optional[Sequence[str]], filters: Optional[Filters],
+               order_by: Optional[Sequence[str]], limit: Optional[int]) -> pd.DataFrame:
+        """Compila una consulta de query a un único SELECT sobre TABLE con las columnas permitidas."""
+        allowed = self.QUERY_COLUMNS
+        columns = validate_columns(columns if columns is not None else allowed, allowed)
+        if not columns:
+            raise ValueError("Debe indicarse al menos una columna.")
+        filters = normalize_filters(filters)
+        validate_columns([column for column, _, _ in filters], allowed)
+        order = parse_order_by(order_by)
+        validate_columns([column for column, _ in order], allowed)
+        if limit is not None and limit < 0:
+            raise ValueError("El límite no puede ser negativo.")
+        sql, params, expanding = queries.build_select(self.TABLE, columns, filters, order, limit)
+        statement = text(sql).bindparams(*(bindparam(name, expanding=True) for name in expanding))
+        return self._read(statement, params)
+
+    def _iter(self, sql: str, params: Optional[dict] = None,
+              chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Ejecuta una consulta con cursor del servidor (sin buffer) y produce
+        DataFrames de a lo sumo chunk_size filas, con memoria acotada.
+        """
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        with self._engine.connect() as conn:
+            conn = conn.execution_options(stream_results=True, max_row_buffer=chunk_size)
+            result = conn.execute(text(sql), params or {})
+            if self._materializer is not None:
+                for df in self._materializer.iter_materialize(result, chunk_size):
+                    yield self._finish_frame(df)
+                return
+            columns = list(result.keys())
+            for rows in result.partitions(chunk_size):
+                yield self._finish_frame(pd.DataFrame.from_records(rows, columns=columns))
+
+    def _finish_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self._money_as_cents:
+            df = to_cents_columns(df, self.MONEY_COLUMNS)
+        if self._categorical_dimensions:
+            df = to_categorical_columns(df)
+        return df
+
+    def _get_one(self, sql: str, params: dict, entity_type: type, entity_id: int,
+                 factory: Callable[[Any], Any]) -> Optional[Any]:
+        if self._identity_map is not None:
+            entity = self._identity_map.get(entity_type, entity_id)
+            if entity is not None:
+                return entity
+        with self._engine.connect() as conn:
+            row = conn.execute(text(sql), params).first()
+        if row is None:
+            return None
+        entity = factory(row)
+        return self._identity_map.add(entity) if self._identity_map is not None else entity
+
+    def _get_many(self, sql: str, entity_type: type, ids: Iterable[int],
+                  factory: Callable[[Any], Any]) -> List[Any]:
+        """Resuelve varios ids con consultas IN por bloques, respetando el orden pedido."""
+        ids = list(dict.fromkeys(ids))
+        pending = self._identity_map.missing(entity_type, ids) if self._identity_map is not None else ids
+        found = {}
+        if pending:
+            statement = text(sql).bindparams(bindparam('ids', expanding=True))
+            with self._engine.connect() as conn:
+                for start in range(0, len(pending), self.IN_LIST_CHUNK_SIZE):
+                    chunk = pending[start:start + self.IN_LIST_CHUNK_SIZE]
+                    for row in conn.execute(statement, {'ids': chunk}):
+                        entity = factory(row)
+                        if self._identity_map is not None:
+                            entity = self._identity_map.add(entity)
+                        found[entity.id] = entity
+        result = []
+        for entity_id in ids:
+            entity = found.get(entity_id)
+            if entity is None and self._identity_map is not None:
+                entity = self._identity_map.peek(entity_type, entity_id)
+            if entity is not None:
+                result.append(entity)
+        return result
+
+    def _remember(self, entity: Any) -> None:
+        if self._identity_map is not None:
+            self._identity_map.add(entity)
+
+    def _forget(self, entity_type: type, entity_id: int) -> None:
+        if self._identity_map is not None:
+            self._identity_map.evict(entity_type, entity_id)
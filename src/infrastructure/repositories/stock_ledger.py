@@ -0,0 +1,253 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from .product_repository_impl import SQLProductRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LedgerStats:
+    """Contadores de actividad del libro de stock."""
+    reservations: int = 0
+    rejections: int = 0
+    releases: int = 0
+    contended: int = 0
+    flushes: int = 0
+    flushed_products: int = 0
+    flush_rejections: int = 0
+    flush_errors: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        """Reservas aceptadas por segundo desde la creación del libro."""
+        elapsed = time.monotonic() - self.started_at
+        return self.reservations / elapsed if elapsed > 0 else 0.0
+
+
+class StockLedger:
+    """
+    Libro de reservas de stock en memoria con bloqueo por franjas (lock striping).
+
+    Cada producto se asigna a una de `stripes` franjas con su propio lock, de
+    modo que los hilos que reservan productos distintos no compiten entre sí.
+    Las reservas se validan contra el stock conocido menos lo ya reservado y
+    se acumulan como variaciones netas que se vuelcan a la base de datos en
+    cada intervalo (flush) con update_stock_bulk, en lotes ordenados por id
+    dentro de una sola transacción. El libro asume que es el único escritor
+    de stock para los productos que gestiona.
+
+    on_rejected recibe, tras cada volcado, las variaciones netas por producto
+    que la base de datos rechazó: reservas ya confirmadas por reserve() que
+    no llegaron a aplicarse y que el llamador debe compensar.
+    """
+
+    def __init__(self, repository: SQLProductRepository, stripes: int = 64, flush_interval: float = 1.0,
+                 batch_size: int = 1_000, on_rejected: Optional[Callable[[Dict[int, int]], None]] = None):
+        self._repository = repository
+        self._on_rejected = on_rejected
+        self._batch_size = batch_size
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._available: List[Dict[int, int]] = [{} for _ in range(stripes)]
+        self._pending: List[Dict[int, int]] = [{} for _ in range(stripes)]
+        self._flush_lock = threading.Lock()
+        self._flush_epoch = 0
+        self._flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self.stats = LedgerStats()
+
+    def _stripe(self, product_id: int) -> int:
+        return hash(product_id) % len(self._locks)
+
+    def _acquire(self, stripe: int) -> threading.Lock:
+        lock = self._locks[stripe]
+        if not lock.acquire(blocking=False):
+            self._count('contended')
+            lock.acquire()
+        return lock
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + amount)
+
+    def _ensure_loaded(self, stripe: int, product_id: int) -> bool:
+        """
+        Carga el stock conocido de un producto si la franja aún no lo tiene.
+
+        La consulta se hace sin el lock de la franja y el valor se inserta
+        con doble comprobación. Se descarta (y se repite) si un flush se
+        solapó con la lectura, porque el stock leído podría no incluir las
+        variaciones volcadas.
+
+        Returns:
+            False si el producto no existe
+        """
+        while product_id not in self._available[stripe]:
+            epoch = self._flush_epoch
+            if epoch % 2:
+                with self._flush_lock:
+                    continue
+            product = self._repository.get_by_id(product_id)
+            if product is None:
+                return False
+            lock = self._acquire(stripe)
+            try:
+                if product_id not in self._available[stripe] and self._flush_epoch == epoch:
+                    self._available[stripe][product_id] = product.stock + self._pending[stripe].get(product_id, 0)
+            finally:
+                lock.release()
+        return True
+
+    def reserve(self, product_id: int, quantity: int) -> bool:
+        """
+        Reserva stock de un producto.
+
+        Returns:
+            False si el producto no existe o no tiene stock suficiente
+        """
+        if quantity <= 0:
+            raise ValueError("La cantidad a reservar debe ser mayor que cero.")
+        stripe = self._stripe(product_id)
+        while self._ensure_loaded(stripe, product_id):
+            lock = self._acquire(stripe)
+            try:
+                available = self._available[stripe].get(product_id)
+                if available is None:
+                    continue
+                if available < quantity:
+                    break
+                self._available[stripe][product_id] = available - quantity
+                self._pending[stripe][product_id] = self._pending[stripe].get(product_id, 0) - quantity
+            finally:
+                lock.release()
+            self._count('reservations')
+            return True
+        self._count('rejections')
+        return False
+
+    def release(self, product_id: int, quantity: int) -> None:
+        """Devuelve stock reservado (cancelaciones) o repone stock."""
+        if quantity <= 0:
+            raise ValueError("La cantidad a liberar debe ser mayor que cero.")
+        stripe = self._stripe(product_id)
+        lock = self._acquire(stripe)
+        try:
+            if product_id in self._available[stripe]:
+                self._available[stripe][product_id] += quantity
+            self._pending[stripe][product_id] = self._pending[stripe].get(product_id, 0) + quantity
+        finally:
+            lock.release()
+        self._count('releases')
+
+    def available(self, product_id: int) -> Optional[int]:
+        """Stock disponible según el libro (incluye reservas aún no volcadas)."""
+        stripe = self._stripe(product_id)
+        while self._ensure_loaded(stripe, product_id):
+            lock = self._acquire(stripe)
+            try:
+                available = self._available[stripe].get(product_id)
+            finally:
+                lock.release()
+            if available is not None:
+                return available
+        return None
+
+    def flush(self) -> int:
+        """
+        Vuelca las variaciones netas pendientes a la base de datos en lotes ordenados por id.
+
+        El volcado es atómico: si falla, todas las variaciones vuelven a quedar
+        pendientes. Las que dejarían un stock negativo (otro escritor modificó
+        el producto) se descartan, se notifican a on_rejected y el stock del
+        producto se vuelve a leer.
+
+        Returns:
+            Número de productos actualizados
+        """
+        with self._flush_lock:
+            # Época impar mientras dura el volcado (ver _ensure_loaded)
+            self._flush_epoch += 1
+            try:
+                deltas: Dict[int, int] = {}
+                for stripe, lock in enumerate(self._locks):
+                    with lock:
+                        deltas.update(self._pending[stripe])
+                        self._pending[stripe] = {}
+                if not deltas:
+                    return 0
+                rejected: List[int] = []
+                try:
+                    updated = self._repository.update_stock_bulk(deltas, self._batch_size, atomic=True,
+                                                                 rejected=rejected)
+                except Exception:
+                    self._restore(deltas)
+                    raise
+                self._invalidate(rejected)
+            finally:
+                self._flush_epoch += 1
+        self._count('flushes')
+        self._count('flushed_products', updated)
+        self._count('flush_rejections', len(rejected))
+        if rejected and self._on_rejected is not None:
+            self._on_rejected({product_id: deltas[product_id] for product_id in rejected})
+        return updated
+
+    def _invalidate(self, product_ids: List[int]) -> None:
+        for product_id in product_ids:
+            stripe = self._stripe(product_id)
+            with self._locks[stripe]:
+                self._available[stripe].pop(product_id, None)
+
+    def _restore(self, deltas: Dict[int, int]) -> None:
+        for product_id, delta in deltas.items():
+            stripe = self._stripe(product_id)
+            with self._locks[stripe]:
+                pending = self._pending[stripe]
+                pending[product_id] = pending.get(product_id, 0) + delta
+
+    def start(self) -> None:
+        """Inicia el volcado periódico en un hilo de fondo."""
+        if self._worker is not None:
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name='stock-ledger-flush', daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Detiene el volcado periódico y vuelca lo pendiente."""
+        if self._worker is not None:
+            self._stop.set()
+            self._worker.join()
+            self._worker = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # Las variaciones ya quedaron pendientes (ver flush); se reintenta en el siguiente intervalo
+                self._count('flush_errors')
+                logger.exception("Error al volcar el libro de stock")
+
+    def metrics(self) -> Dict[str, float]:
+        """Contadores de rendimiento y contención."""
+        with self._stats_lock:
+            stats = self.stats
+            return {
+                'reservations': stats.reservations,
+                'rejections': stats.rejections,
+                'releases': stats.releases,
+                'contended': stats.contended,
+                'flushes': stats.flushes,
+                'flushed_products': stats.flushed_products,
+                'flush_rejections': stats.flush_rejections,
+                'flush_errors': stats.flush_errors,
+                'throughput': stats.throughput,
+            }
@@ -0,0 +1,137 @@
+import heapq
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import bindparam, text
+
+from ...domain.entities.money import from_cents, to_cents_array
+from ..database import queries
+from .sales_rollups import IncrementalAggregates
+
+_ONE_DAY = pd.Timedelta(days=1)
+# Resolución de sales.date (DATETIME sin fracciones de segundo)
+_DATE_RESOLUTION = pd.Timedelta(seconds=1)
+
+_RANKING_COLUMNS = {
+    'total_revenue': 'total_amount',
+    'total_quantity': 'quantity',
+}
+
+
+def _as_datetime(value: Optional[pd.Timestamp]) -> Optional[datetime]:
+    return value.to_pydatetime() if value is not None else None
+
+
+def _as_date(value: Optional[pd.Timestamp]):
+    return value.date() if value is not None else None
+
+
+class TopKEngine(IncrementalAggregates):
+    """
+    Motor de top-K de productos y clientes sobre totales diarios.
+
+    Mantiene totales por día y producto y por día y cliente. Una ventana
+    de fechas se responde sumando los totales de sus días completos y, desde
+    la tabla base, solo los días incompletos de los extremos y las ventas
+    aún no sumadas; la selección final usa un heap acotado (heapq.nlargest)
+    sobre los totales por clave.
+    """
+
+    NAME = 'top_k'
+
+    def _tables(self) -> Dict[str, Dict[str, str]]:
+        return {table: {'day': self._expressions['D'], key: key}
+                for key, table in queries.DAILY_TOTAL_TABLES.items()}
+
+    def _key_values(self, table: str, sale) -> dict:
+        key = next(key for key, name in queries.DAILY_TOTAL_TABLES.items() if name == table)
+        return {'day': pd.Timestamp(sale.date).date(), key: getattr(sale, key)}
+
+    @staticmethod
+    def _full_days(start_date: Optional[datetime],
+                   end_date: Optional[datetime]) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """Primer día completo de la ventana y día siguiente al último día completo (None = sin límite)."""
+        first_full = after_full = None
+        if start_date is not None:
+            start = pd.Timestamp(start_date)
+            first_full = start.normalize()
+            if first_full < start:
+                first_full += _ONE_DAY
+        if end_date is not None:
+            after_full = (pd.Timestamp(end_date) + _DATE_RESOLUTION).normalize()
+        return first_full, after_full
+
+    def totals(self, key: str, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Totales por clave ('product_id' o 'customer_id') de una ventana de fechas.
+
+        Returns:
+            DataFrame indexado por la clave con quantity, total_amount (centavos) y transactions
+        """
+        if key not in queries.DAILY_TOTAL_TABLES:
+            raise ValueError(f"Clave de top-K no soportada: {key}")
+        first_full, after_full = self._full_days(start_date, end_date)
+        last_full = after_full - _ONE_DAY if after_full is not None else None
+        with self._engine.begin() as conn:
+            self._register(conn)
+            daily = pd.read_sql(text(queries.build_daily_totals_window(queries.DAILY_TOTAL_TABLES[key], key)), conn,
+                                params={'first_day': _as_date(first_full), 'last_day': _as_date(last_full)})
+            remainder = pd.read_sql(text(queries.build_sales_window_remainder(key)), conn, params={
+                'start_date': start_date,
+                'end_date': end_date,
+                'name': self.NAME,
+                'first_full': _as_datetime(first_full),
+                'after_full': _as_datetime(after_full),
+            })
+        frame = pd.concat([part for part in (daily, remainder) if len(part)] or [daily], ignore_index=True)
+        frame['total_amount'] = to_cents_array(frame['total_amount'].to_numpy())
+        totals = frame.groupby(key).sum()
+        return totals[totals['transactions'] > 0]
+
+    def top(self, key: str, limit: int, by: str = 'total_revenue', start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        Las limit claves con mayor total_revenue o total_quantity en la ventana.
+
+        Returns:
+            DataFrame [key, total_quantity, total_revenue (Decimal), transactions] ordenado de mayor a menor
+        """
+        if by not in _RANKING_COLUMNS:
+            raise ValueError(f"Criterio de ranking no soportado: {by}")
+        totals = self.totals(key, start_date, end_date)
+        ranking = totals[_RANKING_COLUMNS[by]].to_numpy()
+        positions = heapq.nlargest(limit, range(len(ranking)), key=ranking.__getitem__)
+        best = totals.iloc[positions]
+        return pd.DataFrame({
+            key: best.index.to_numpy(),
+            'total_quantity': best['quantity'].to_numpy(dtype=np.int64),
+            'total_revenue': [from_cents(cents) for cents in best['total_amount']],
+            'transactions': best['transactions'].to_numpy(dtype=np.int64),
+        })
+
+    def _names(self, sql: str, ids) -> pd.DataFrame:
+        statement = text(sql).bindparams(bindparam('ids', expanding=True))
+        with self._engine.connect() as conn:
+            return pd.read_sql(statement, conn, params={'ids': [int(i) for i in ids]})
+
+    def top_products(self, limit: int = 10, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None, by: str = 'total_revenue') -> pd.DataFrame:
+        """Productos con mayor total_revenue o total_quantity, con nombre y categoría."""
+        best = self.top('product_id', limit, by, start_date, end_date)
+        if best.empty:
+            return best.assign(product_name=[], category=[])
+        names = self._names(queries.SELECT_PRODUCT_NAMES_BY_IDS, best['product_id'])
+        names = names.rename(columns={'id': 'product_id', 'name': 'product_name'})
+        return best.merge(names, on='product_id', how='inner')
+
+    def top_customers(self, limit: int = 10, start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Clientes con mayor gasto, con nombre, región y segmento."""
+        best = self.top('customer_id', limit, 'total_revenue', start_date, end_date)
+        if best.empty:
+            return best.assign(name=[], region=[], segment=[])
+        names = self._names(queries.SELECT_CUSTOMER_NAMES_BY_IDS, best['customer_id'])
+        return best.merge(names.rename(columns={'id': 'customer_id'}), on='customer_id', how='inner')
@@ -0,0 +1,71 @@
+import decimal
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.database import queries
+
+sqlite3.register_adapter(decimal.Decimal, str)
+
+SCHEMA = [
+    """CREATE TABLE customers (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(255) NOT NULL,
+       email VARCHAR(255) UNIQUE NOT NULL, phone VARCHAR(50), region VARCHAR(100),
+       registration_date DATETIME DEFAULT CURRENT_TIMESTAMP, segment VARCHAR(50))""",
+    """CREATE TABLE products (id INTEGER PRIMARY KEY AUTOINCREMENT, name VARCHAR(255) NOT NULL,
+       category VARCHAR(100) NOT NULL, price DECIMAL(10, 2) NOT NULL, cost DECIMAL(10, 2) NOT NULL,
+       stock INT DEFAULT 0)""",
+    """CREATE TABLE sales (id INTEGER PRIMARY KEY AUTOINCREMENT, date DATETIME NOT NULL, product_id INT NOT NULL,
+       customer_id INT NOT NULL, quantity INT NOT NULL, unit_price DECIMAL(10, 2) NOT NULL,
+       total_amount DECIMAL(10, 2) NOT NULL, region VARCHAR(100), category VARCHAR(100))""",
+]
+
+SAMPLE_DATA = [
+    """INSERT INTO customers (name, email, phone, region, segment) VALUES
+       ('Juan', 'j@e.com', '1', 'Norte', 'VIP'), ('Maria', 'm@e.com', '2', 'Sur', 'Regular'),
+       ('Carlos', 'c@e.com', '3', 'Centro', 'Regular')""",
+    """INSERT INTO products (name, category, price, cost, stock) VALUES
+       ('Laptop', 'Electrónica', 1200.00, 800.00, 50), ('Mouse', 'Accesorios', 25.00, 15.00, 200),
+       ('Teclado', 'Accesorios', 80.00, 50.00, 100)""",
+    """INSERT INTO sales (date, product_id, customer_id, quantity, unit_price, total_amount, region, category) VALUES
+       ('2024-01-15 10:30:00', 1, 1, 2, 1200.00, 2400.00, 'Norte', 'Electrónica'),
+       ('2024-01-16 14:20:00', 2, 2, 5, 25.00, 125.00, 'Sur', 'Accesorios'),
+       ('2024-02-17 09:15:00', 3, 3, 3, 80.00, 240.00, 'Centro', 'Accesorios')""",
+]
+
+
+_AGGREGATE_COLUMNS = """quantity BIGINT NOT NULL DEFAULT 0, total_amount DECIMAL(16, 2) NOT NULL DEFAULT 0,
+       transactions BIGINT NOT NULL DEFAULT 0"""
+
+AGGREGATE_SCHEMA = [
+    *(f"""CREATE TABLE {table} (period_start DATE NOT NULL, region VARCHAR(100) NOT NULL DEFAULT '',
+       category VARCHAR(100) NOT NULL DEFAULT '', {_AGGREGATE_COLUMNS}, PRIMARY KEY (period_start, region, category))"""
+      for table in queries.ROLLUP_TABLES.values()),
+    *(f"CREATE TABLE {table} (day DATE NOT NULL, {key} INT NOT NULL, {_AGGREGATE_COLUMNS}, PRIMARY KEY (day, {key}))"
+      for key, table in queries.DAILY_TOTAL_TABLES.items()),
+    "CREATE TABLE sales_rollup_state (name VARCHAR(50) PRIMARY KEY)",
+    """CREATE TABLE sales_rollup_pending (name VARCHAR(50) NOT NULL, sale_id INT NOT NULL,
+       PRIMARY KEY (name, sale_id))""",
+    queries.CREATE_PENDING_SALES_TRIGGER['sqlite'],
+]
+
+
+@pytest.fixture
+def engine():
+    """Base SQLite en memoria (una conexión compartida entre hilos) con el esquema y los datos de ejemplo."""
+    engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+    with engine.begin() as conn:
+        for statement in SCHEMA + SAMPLE_DATA:
+            conn.execute(text(statement))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def aggregates_engine(engine):
+    """Como engine, con las tablas de agregados incrementales y el trigger de ventas pendientes."""
+    with engine.begin() as conn:
+        for statement in AGGREGATE_SCHEMA:
+            conn.execute(text(statement))
+    return engine
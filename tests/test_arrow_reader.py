@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Integer, Numeric, text
+
+from src.infrastructure.database.arrow_reader import ArrowReader
+from src.infrastructure.repositories.product_repository_impl import SQLProductRepository
+
+PRODUCTS = text("SELECT id, price, cost FROM products ORDER BY id").columns(
+    id=Integer, price=Numeric(10, 2), cost=Numeric(10, 2))
+
+
+def test_decimal_columns_are_read_as_float_like_read_sql(engine):
+    with engine.connect() as conn:
+        assert isinstance(conn.execute(PRODUCTS).first().price, Decimal)
+        expected = pd.read_sql(PRODUCTS, conn)
+    df = ArrowReader(engine, backend='cursor').read_frame(PRODUCTS)
+    assert df['price'].dtype == np.float64
+    assert df['cost'].dtype == np.float64
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert (df.dtypes == expected.dtypes).all()
+
+
+def test_decimal_columns_are_read_as_exact_cents(engine):
+    df = ArrowReader(engine, backend='cursor').read_frame(PRODUCTS, cents_columns=('price', 'cost'))
+    assert list(df.columns) == ['id', 'price_cents', 'cost_cents']
+    assert df['price_cents'].dtype == np.int64
+    assert df['price_cents'].tolist() == [120000, 2500, 8000]
+
+
+def test_repository_reads_match_without_arrow(engine):
+    for cents in (False, True):
+        arrow = SQLProductRepository(engine, money_as_cents=cents, arrow_reader=ArrowReader(engine, backend='cursor'))
+        plain = SQLProductRepository(engine, money_as_cents=cents)
+        pd.testing.assert_frame_equal(arrow.get_all(), plain.get_all())
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from sqlalchemy import text
+
+from src.infrastructure.database.sql_connection import ConnectionManager
+
+
+def _hold_and_checkout(manager, hold_seconds):
+    """Ocupa una conexión durante hold_seconds mientras otro hilo pide otra."""
+    engine = manager.engine
+    held = threading.Event()
+
+    def holder():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            held.set()
+            time.sleep(hold_seconds)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    held.wait()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    thread.join()
+
+
+def test_wait_is_measured_only_when_pool_is_exhausted(tmp_path):
+    manager = ConnectionManager(url=f"sqlite:///{tmp_path / 'pool.db'}", pool_size=1, max_overflow=0)
+    _hold_and_checkout(manager, 0.2)
+    status = manager.pool_status()
+    assert status['waits'] == 1
+    assert 150 <= status['total_wait_ms'] < 1000
+    manager.dispose()
+
+
+def test_unbounded_overflow_never_waits(tmp_path):
+    manager = ConnectionManager(url=f"sqlite:///{tmp_path / 'pool.db'}", pool_size=1, max_overflow=-1)
+    _hold_and_checkout(manager, 0.2)
+    status = manager.pool_status()
+    assert status['waits'] == 0
+    assert status['checkouts'] == 2
+    manager.dispose()
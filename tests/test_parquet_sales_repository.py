@@ -0,0 +1,25 @@
+from datetime import datetime
+from decimal import Decimal
+
+from src.domain.entities.sale import Sale
+from src.infrastructure.repositories.parquet_sales_repository import ParquetSalesRepository
+
+
+def _sale(day: int, month: int = 1) -> Sale:
+    return Sale(id=None, date=datetime(2024, month, day, 10, 0), product_id=1, customer_id=1, quantity=1,
+                unit_price=Decimal('2.50'), total_amount=Decimal('2.50'), region='Norte', category='Accesorios')
+
+
+def test_compact_merges_single_row_files_per_partition(tmp_path):
+    repository = ParquetSalesRepository(str(tmp_path))
+    for day in (3, 1, 2):
+        repository.save(_sale(day))
+    repository.save(_sale(1, month=2))
+    before = repository.get_all()
+    assert len(list(repository._dataset().get_fragments())) == 4
+    assert repository.compact() == 1
+    assert len(list(repository._dataset().get_fragments())) == 2
+    after = repository.get_all()
+    assert after.sort_values('id').reset_index(drop=True).equals(before.sort_values('id').reset_index(drop=True))
+    assert after['id'].tolist()[:3] == [2, 3, 1]
+    assert repository.compact() == 0
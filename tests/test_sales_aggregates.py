@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pandas as pd
+from sqlalchemy import text
+
+from src.infrastructure.repositories.sales_repository_impl import SQLSalesRepository
+from src.infrastructure.repositories.sales_rollups import SalesRollups
+from src.infrastructure.repositories.top_k import TopKEngine
+
+INSERT_SALE_WITH_ID = """
+INSERT INTO sales (id, date, product_id, customer_id, quantity, unit_price, total_amount, region, category)
+VALUES (:id, :date, :product_id, 1, :quantity, 10.00, :total_amount, 'Norte', 'Electrónica')
+"""
+
+
+def _monthly(repository):
+    df = repository.get_aggregated_by_period('M')
+    return {row.period.strftime('%Y-%m'): (float(row.total_amount), int(row.quantity), int(row.transactions))
+            for row in df.itertuples()}
+
+
+def _rolled(engine, table):
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT SUM(quantity), SUM(transactions) FROM {table}")).one()
+
+
+def test_refresh_folds_a_sale_whose_id_commits_after_a_higher_id(aggregates_engine):
+    rollups, top_k = SalesRollups(aggregates_engine), TopKEngine(aggregates_engine)
+    repository = SQLSalesRepository(aggregates_engine, rollups=rollups, top_k=top_k)
+    assert rollups.refresh() == top_k.refresh() == 3
+    # Id 20 se confirma y se suma antes que id 10, reservado antes por otra transacción
+    with aggregates_engine.begin() as conn:
+        conn.execute(text(INSERT_SALE_WITH_ID),
+                     {'id': 20, 'date': '2024-03-01 10:00:00', 'product_id': 2, 'quantity': 1, 'total_amount': 10})
+    assert rollups.refresh() == top_k.refresh() == 1
+    with aggregates_engine.begin() as conn:
+        conn.execute(text(INSERT_SALE_WITH_ID),
+                     {'id': 10, 'date': '2024-03-02 10:00:00', 'product_id': 3, 'quantity': 4, 'total_amount': 40})
+    assert rollups.refresh() == top_k.refresh() == 1
+    assert rollups.refresh() == top_k.refresh() == 0
+    assert tuple(_rolled(aggregates_engine, 'sales_rollup_monthly')) == (15, 5)
+    assert tuple(_rolled(aggregates_engine, 'sales_daily_product')) == (15, 5)
+    assert _monthly(repository) == _monthly(SQLSalesRepository(aggregates_engine))
+    assert repository.delete(10) and repository.delete(1)
+    assert tuple(_rolled(aggregates_engine, 'sales_rollup_monthly')) == (9, 3)
+    assert _monthly(repository) == _monthly(SQLSalesRepository(aggregates_engine))
+
+
+def test_pending_sales_are_read_from_the_base_table_before_refresh(aggregates_engine):
+    repository = SQLSalesRepository(aggregates_engine, rollups=SalesRollups(aggregates_engine))
+    assert _monthly(repository) == {'2024-01': (2525.0, 7, 2), '2024-02': (240.0, 3, 1)}
+    assert tuple(_rolled(aggregates_engine, 'sales_rollup_monthly')) == (None, None)
+
+
+def test_replace_resets_the_aggregates(aggregates_engine):
+    rollups, top_k = SalesRollups(aggregates_engine), TopKEngine(aggregates_engine)
+    repository = SQLSalesRepository(aggregates_engine, rollups=rollups, top_k=top_k)
+    rollups.refresh()
+    top_k.refresh()
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2024-05-01 10:00:00']),
+        'product_id': [2], 'customer_id': [3], 'quantity': [6],
+        'unit_price': [Decimal('25.00')], 'total_amount': [Decimal('150.00')],
+        'region': ['Sur'], 'category': ['Accesorios'],
+    })
+    assert repository.save_dataframe(df, if_exists='replace') == 1
+    assert _monthly(repository) == {'2024-05': (150.0, 6, 1)}
+    assert tuple(_rolled(aggregates_engine, 'sales_rollup_yearly')) == (6, 1)
+    assert tuple(_rolled(aggregates_engine, 'sales_daily_customer')) == (6, 1)
+    with aggregates_engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM sales_rollup_pending")).scalar() == 0
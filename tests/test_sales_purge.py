@@ -0,0 +1,42 @@
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import text
+
+from src.infrastructure.repositories.cached_sales_repository import CachedSalesRepository
+from src.infrastructure.repositories.parquet_sales_repository import ParquetSalesRepository
+from src.infrastructure.repositories.sales_repository_impl import SQLSalesRepository
+
+CREATE_SALES_ARCHIVE = """
+CREATE TABLE sales_archive (id INT PRIMARY KEY, date DATETIME NOT NULL, product_id INT NOT NULL,
+    customer_id INT NOT NULL, quantity INT NOT NULL, unit_price DECIMAL(10, 2) NOT NULL,
+    total_amount DECIMAL(10, 2) NOT NULL, region VARCHAR(100), category VARCHAR(100),
+    archived_at DATETIME DEFAULT CURRENT_TIMESTAMP)
+"""
+
+
+def test_purge_moves_old_sales_to_the_archive_in_batches(engine):
+    with engine.begin() as conn:
+        conn.execute(text(CREATE_SALES_ARCHIVE))
+    repository = SQLSalesRepository(engine)
+    report = repository.purge_before(datetime(2024, 2, 1), batch_size=1)
+    assert (report.rows, report.batches, report.destination) == (2, 2, 'sales_archive')
+    assert pd.read_sql("SELECT id FROM sales_archive ORDER BY id", engine)['id'].tolist() == [1, 2]
+    assert repository.get_all()['id'].tolist() == [3]
+
+
+def test_purge_retry_does_not_duplicate_parquet_archive(engine, tmp_path):
+    archive = ParquetSalesRepository(str(tmp_path))
+    repository = SQLSalesRepository(engine)
+    # Un intento anterior archivó la venta 1 pero no llegó a eliminarla
+    archive.import_sales(repository.get_all().iloc[:1])
+    report = repository.purge_before(datetime(2024, 2, 1), archive=archive)
+    assert (report.rows, report.destination) == (2, 'parquet')
+    assert sorted(archive.get_all()['id'].tolist()) == [1, 2]
+
+
+def test_cached_purge_invalidates_the_cache(engine):
+    repository = CachedSalesRepository(SQLSalesRepository(engine))
+    assert len(repository.get_all()) == 3
+    assert repository.purge_before(datetime(2024, 2, 1), archive=None).rows == 2
+    assert repository.get_all()['id'].tolist() == [3]
@@ -0,0 +1,31 @@
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from src.infrastructure.repositories.sales_repository_impl import SQLSalesRepository
+
+
+def test_replace_writes_cents_exactly(engine):
+    df = pd.DataFrame({
+        'id': [1, 2],
+        'date': pd.to_datetime(['2024-03-01 10:00:00', '2024-03-02 11:00:00']),
+        'product_id': [1, 2],
+        'customer_id': [1, 2],
+        'quantity': [3, 1],
+        'unit_price_cents': np.array([333, 9999999], dtype=np.int64),
+        'total_amount_cents': np.array([999, 9999999], dtype=np.int64),
+        'region': ['Norte', 'Sur'],
+        'category': ['A', 'B'],
+    })
+    repository = SQLSalesRepository(engine)
+    assert repository.save_dataframe(df, if_exists='replace') == 2
+    with engine.connect() as conn:
+        types = {row[1]: row[2] for row in conn.execute(text("PRAGMA table_info(sales)"))}
+        assert types['unit_price'] == types['total_amount'] == 'NUMERIC(10, 2)'
+        amounts = conn.execute(text("SELECT CAST(unit_price AS TEXT), CAST(total_amount AS TEXT) FROM sales")).all()
+    assert [tuple(Decimal(value) for value in row) for row in amounts] == [
+        (Decimal('3.33'), Decimal('9.99')), (Decimal('99999.99'), Decimal('99999.99'))]
+    cents = SQLSalesRepository(engine, money_as_cents=True).get_all()
+    assert cents['total_amount_cents'].tolist() == [999, 9999999]
@@ -0,0 +1,142 @@
+import time
+
+import pytest
+import pandas as pd
+
+from src.infrastructure.repositories.product_repository_impl import SQLProductRepository
+from src.infrastructure.repositories.stock_ledger import StockLedger
+
+
+def _stock(engine):
+    return dict(pd.read_sql("SELECT id, stock FROM products", engine).itertuples(index=False))
+
+
+def test_update_stock_bulk_rejects_negative_stock(engine):
+    repository = SQLProductRepository(engine)
+    rejected = []
+    assert repository.update_stock_bulk({1: -1000, 2: -10}, rejected=rejected) == 1
+    assert rejected == [1]
+    assert _stock(engine) == {1: 50, 2: 190, 3: 100}
+
+
+def test_atomic_rejections_are_reported_only_after_commit(engine, monkeypatch):
+    repository = SQLProductRepository(engine)
+    apply_batch = SQLProductRepository._apply_stock_batch
+
+    def failing_last_batch(self, conn, product_ids, net, rejected):
+        updated = apply_batch(self, conn, product_ids, net, rejected)
+        if 3 in product_ids:
+            raise RuntimeError("fallo simulado")
+        return updated
+
+    monkeypatch.setattr(SQLProductRepository, '_apply_stock_batch', failing_last_batch)
+    rejected = []
+    with pytest.raises(RuntimeError):
+        repository.update_stock_bulk({1: -1000, 2: -10, 3: -1}, batch_size=1, atomic=True, rejected=rejected)
+    assert rejected == []
+    assert _stock(engine) == {1: 50, 2: 200, 3: 100}
+
+    monkeypatch.setattr(SQLProductRepository, '_apply_stock_batch', apply_batch)
+    assert repository.update_stock_bulk({1: -1000, 2: -10}, batch_size=1, atomic=True, rejected=rejected) == 1
+    assert rejected == [1]
+
+
+def test_flush_failure_partway_restores_all_deltas(engine, monkeypatch):
+    repository = SQLProductRepository(engine)
+    ledger = StockLedger(repository, batch_size=1)
+    assert ledger.reserve(1, 10)
+    assert ledger.reserve(2, 5)
+    apply_batch = SQLProductRepository._apply_stock_batch
+    calls = []
+
+    def failing_batch(self, *args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("fallo simulado")
+        return apply_batch(self, *args)
+
+    monkeypatch.setattr(SQLProductRepository, '_apply_stock_batch', failing_batch)
+    with pytest.raises(RuntimeError):
+        ledger.flush()
+    assert _stock(engine) == {1: 50, 2: 200, 3: 100}
+
+    monkeypatch.setattr(SQLProductRepository, '_apply_stock_batch', apply_batch)
+    assert ledger.flush() == 2
+    assert _stock(engine) == {1: 40, 2: 195, 3: 100}
+    assert ledger.flush() == 0
+
+
+def test_flush_drops_deltas_rejected_by_the_database(engine):
+    repository = SQLProductRepository(engine)
+    notified = []
+    ledger = StockLedger(repository, on_rejected=notified.append)
+    assert ledger.reserve(1, 30)
+    assert ledger.reserve(2, 5)
+    repository.update_stock(1, -40)
+    assert ledger.flush() == 1
+    assert notified == [{1: -30}]
+    assert ledger.metrics()['flush_rejections'] == 1
+    assert ledger.available(1) == 10
+
+
+def test_background_flush_survives_errors(engine, monkeypatch):
+    repository = SQLProductRepository(engine)
+    ledger = StockLedger(repository, flush_interval=0.01)
+    assert ledger.reserve(1, 10)
+    update_stock_bulk = repository.update_stock_bulk
+    calls = []
+
+    def failing_once(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("fallo simulado")
+        return update_stock_bulk(*args, **kwargs)
+
+    monkeypatch.setattr(repository, 'update_stock_bulk', failing_once)
+    ledger.start()
+    try:
+        deadline = time.monotonic() + 5
+        while ledger.metrics()['flushes'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        ledger.stop()
+    assert ledger.metrics()['flush_errors'] == 1
+    assert _stock(engine)[1] == 40
+
+
+def test_products_are_loaded_outside_the_stripe_lock(engine):
+    repository = SQLProductRepository(engine)
+    ledger = StockLedger(repository, stripes=1)
+    get_by_id = repository.get_by_id
+
+    def unlocked_get_by_id(product_id):
+        assert not ledger._locks[0].locked()
+        return get_by_id(product_id)
+
+    repository.get_by_id = unlocked_get_by_id
+    assert ledger.reserve(1, 5)
+    assert ledger.available(1) == 45
+    assert not ledger.reserve(99, 1)
+    assert ledger.available(99) is None
+
+
+def test_load_overlapping_a_flush_is_retried(engine):
+    repository = SQLProductRepository(engine)
+    ledger = StockLedger(repository)
+    ledger.release(1, 10)
+    get_by_id = repository.get_by_id
+    reads = []
+
+    def get_by_id_then_flush(product_id):
+        product = get_by_id(product_id)
+        reads.append(product.stock)
+        if len(reads) == 1:
+            ledger.flush()
+        return product
+
+    repository.get_by_id = get_by_id_then_flush
+    assert ledger.reserve(1, 5)
+    assert reads == [50, 60]
+    assert ledger.available(1) == 55
+    ledger.flush()
+    assert _stock(engine)[1] == 55
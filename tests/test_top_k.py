@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import text
+
+from src.infrastructure.repositories.customer_repository_impl import SQLCustomerRepository
+from src.infrastructure.repositories.product_repository_impl import SQLProductRepository
+from src.infrastructure.repositories.sales_repository_impl import SQLSalesRepository
+from src.infrastructure.repositories.top_k import TopKEngine
+
+INSERT_SALE_WITH_ID = """
+INSERT INTO sales (id, date, product_id, customer_id, quantity, unit_price, total_amount, region, category)
+VALUES (:id, :date, :product_id, :customer_id, :quantity, :unit_price, :total_amount, 'Sur', 'Accesorios')
+"""
+
+LATE_SALES = [
+    {'id': 30, 'date': '2024-02-20 08:00:00', 'product_id': 2, 'customer_id': 3, 'quantity': 40,
+     'unit_price': 25.00, 'total_amount': 1000.00},
+    # Id menor confirmado después de que refresh ya sumó el 30
+    {'id': 25, 'date': '2024-03-01 12:00:00', 'product_id': 3, 'customer_id': 2, 'quantity': 1,
+     'unit_price': 80.00, 'total_amount': 80.00},
+    {'id': 26, 'date': '2024-03-01 12:00:01', 'product_id': 1, 'customer_id': 2, 'quantity': 1,
+     'unit_price': 1200.00, 'total_amount': 1200.00},
+]
+
+MONEY_COLUMNS = ('total_revenue', 'total_spent')
+
+
+def _normalized(df: pd.DataFrame) -> list:
+    df = df.copy()
+    for column in MONEY_COLUMNS:
+        if column in df:
+            df[column] = pd.to_numeric(df[column]).astype(float).round(2)
+    return df.astype(object).to_dict('records')
+
+
+def test_top_k_matches_the_full_scans(aggregates_engine):
+    top_k = TopKEngine(aggregates_engine)
+    top_k.refresh()
+    with aggregates_engine.begin() as conn:
+        conn.execute(text(INSERT_SALE_WITH_ID), LATE_SALES[0])
+    top_k.refresh()
+    with aggregates_engine.begin() as conn:
+        conn.execute(text(INSERT_SALE_WITH_ID), LATE_SALES[1:])
+    window = {'start_date': datetime(2024, 1, 15, 12, 0), 'end_date': datetime(2024, 3, 1, 12, 0)}
+    for pending in (True, False):
+        for limit in (1, 2, 10):
+            fast, full = SQLSalesRepository(aggregates_engine, top_k=top_k), SQLSalesRepository(aggregates_engine)
+            assert _normalized(fast.get_top_products(limit)) == _normalized(full.get_top_products(limit))
+            assert (_normalized(fast.get_top_products(limit, **window))
+                    == _normalized(full.get_top_products(limit, **window)))
+            fast, full = SQLProductRepository(aggregates_engine, top_k=top_k), SQLProductRepository(aggregates_engine)
+            assert _normalized(fast.get_best_sellers(limit)) == _normalized(full.get_best_sellers(limit))
+            fast, full = SQLCustomerRepository(aggregates_engine, top_k=top_k), SQLCustomerRepository(aggregates_engine)
+            assert _normalized(fast.get_top_customers(limit)) == _normalized(full.get_top_customers(limit))
+        if pending:
+            assert top_k.refresh() == 2
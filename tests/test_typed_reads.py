@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.infrastructure.repositories.customer_repository_impl import SQLCustomerRepository
+from src.infrastructure.repositories.product_repository_impl import SQLProductRepository
+from src.infrastructure.repositories.sales_repository_impl import SQLSalesRepository
+
+READS = [
+    (SQLSalesRepository, lambda r: r.get_all()),
+    (SQLSalesRepository, lambda r: r.get_by_date_range(datetime(2024, 1, 1), datetime(2024, 1, 31))),
+    (SQLSalesRepository, lambda r: r.get_top_products(2)),
+    (SQLSalesRepository, lambda r: r.query(['id', 'unit_price', 'region'], order_by=['-id'])),
+    (SQLSalesRepository, lambda r: pd.concat(list(r.iter_all(chunk_size=2)), ignore_index=True)),
+    (SQLProductRepository, lambda r: r.get_all()),
+    (SQLProductRepository, lambda r: r.get_best_sellers()),
+    (SQLCustomerRepository, lambda r: r.get_top_customers()),
+    (SQLCustomerRepository, lambda r: pd.concat(list(r.iter_all(chunk_size=2)), ignore_index=True)),
+]
+
+
+@pytest.mark.parametrize('money_as_cents', [False, True])
+@pytest.mark.parametrize('repository_type, read', READS)
+def test_typed_reads_match_read_sql(engine, repository_type, read, money_as_cents):
+    typed = read(repository_type(engine, money_as_cents=money_as_cents, typed_reads=True))
+    plain = read(repository_type(engine, money_as_cents=money_as_cents, typed_reads=False))
+    assert list(typed.columns) == list(plain.columns)
+    # SQLite devuelve DATETIME como texto en pd.read_sql; el materializador ya los convierte
+    for column in typed.select_dtypes('datetime').columns:
+        plain[column] = pd.to_datetime(plain[column])
+    pd.testing.assert_frame_equal(typed, plain, check_dtype=False, check_categorical=False)
+
+
+def test_typed_reads_use_schema_dtypes(engine):
+    df = SQLSalesRepository(engine, money_as_cents=True, typed_reads=True).get_all()
+    assert df['id'].dtype == np.int32
+    assert df['unit_price_cents'].dtype == np.int64
+    assert df['date'].dtype == 'datetime64[ns]'
+    assert isinstance(df['region'].dtype, pd.CategoricalDtype)
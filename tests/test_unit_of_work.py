@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from src.infrastructure.repositories.async_repositories import AsyncExecutor
+from src.infrastructure.repositories.customer_repository_impl import SQLCustomerRepository
+
+
+def test_unit_of_work_is_not_visible_from_other_threads(engine):
+    repository = SQLCustomerRepository(engine)
+    inside = threading.Event()
+    done = threading.Event()
+    seen = {}
+
+    def other_caller():
+        inside.wait()
+        try:
+            seen['first'] = repository.get_by_id(1)
+            seen['second'] = repository.get_by_id(1)
+        finally:
+            done.set()
+
+    worker = threading.Thread(target=other_caller)
+    worker.start()
+    with repository.unit_of_work():
+        customer = repository.get_by_id(1)
+        assert repository.get_by_id(1) is customer
+        inside.set()
+        done.wait(timeout=10)
+    worker.join()
+    assert seen['first'] is not customer
+    assert seen['first'] is not seen['second']
+    assert repository.get_by_id(1) is not repository.get_by_id(1)
+
+
+def test_unit_of_work_is_visible_from_the_async_executor(engine):
+    repository = SQLCustomerRepository(engine)
+    other = SQLCustomerRepository(engine)
+    executor = AsyncExecutor(max_workers=2)
+
+    async def main():
+        with repository.unit_of_work() as identity_map:
+            first, second = await asyncio.gather(executor.run(repository.get_by_id, 1),
+                                                 executor.run(repository.get_by_id, 1))
+            assert first is second is identity_map.peek(type(first), 1)
+            assert await executor.run(other.get_by_id, 1) is not await executor.run(other.get_by_id, 1)
+        assert await executor.run(repository.get_by_id, 1) is not first
+
+    try:
+        asyncio.run(main())
+    finally:
+        executor.shutdown()